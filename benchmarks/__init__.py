@@ -0,0 +1 @@
+"""Benchmark suite for the simulation and management hot paths."""
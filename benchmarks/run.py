@@ -0,0 +1,293 @@
+"""Benchmark suite for the simulation and management hot paths.
+
+Run from the repository root:
+
+    python -m benchmarks.run                  # run, write JSON, compare to baseline
+    python -m benchmarks.run --save-baseline  # also store the results as the new baseline
+    python -m benchmarks.run --filter map     # only benchmarks whose name contains "map"
+
+Every benchmark is seeded, reports operations per second (best of several
+rounds) and peak traced memory, and is compared against the saved baseline
+when one exists.
+"""
+
+import argparse
+import builtins
+import json
+import platform
+import random
+import time
+import tracemalloc
+from pathlib import Path
+import numpy as np
+from core.console import console
+from managers import GameManager, LeagueManager, MatchManager, ScheduleManager, StandingsManager, TeamRegistry
+from models.RosterGenerator import RosterGenerator
+from models.Team import Team
+from models.WorldIndex import WorldIndex
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results.json"
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+
+SEED = 1234
+ROUNDS = 5
+MIN_ROUND_TIME = 0.2
+
+
+def _make_team(name: str) -> Team:
+    team = Team(name=name)
+    team.build_roster()
+    return team
+
+
+def _make_game(batch_simulation: bool = False, map_engine: str = "markov") -> GameManager:
+    league_manager = LeagueManager(seed=SEED)
+    user_team = league_manager.find_team(league_manager.leagues[0]["teams"][0]["name"])
+    return GameManager(
+        user_team, league_manager.leagues,
+        batch_simulation=batch_simulation, registry=league_manager.registry, map_engine=map_engine
+    )
+
+
+def bench_simulate_map(map_engine: str):
+    match_manager = MatchManager(map_engine=map_engine)
+    team1, team2 = _make_team("Alpha"), _make_team("Bravo")
+    return lambda: match_manager._simulate_map(team1, team2, "Bind")
+
+
+def bench_simulate_match(series_format: int):
+    match_manager = MatchManager()
+    team1, team2 = _make_team("Alpha"), _make_team("Bravo")
+    
+    def run():
+        match_manager.simulate_match(team1, team2, series_format=series_format)
+        match_manager.match_history.clear()
+    
+    return run
+
+
+def bench_round_robin(n_teams: int):
+    schedule_manager = ScheduleManager([])
+    teams_data = [{"name": f"Team {i}"} for i in range(n_teams)]
+    return lambda: list(schedule_manager._generate_round_robin(teams_data))
+
+
+def bench_sort_standings(n_teams: int):
+    standings_manager = StandingsManager([], None)
+    teams = []
+    for i in range(n_teams):
+        team = Team(name=f"Team {i}")
+        team.wins = random.randint(0, 11)
+        team.maps_won = random.randint(0, 22)
+        team.maps_lost = random.randint(0, 22)
+        teams.append(team)
+    return lambda: standings_manager._sort_standings(teams)
+
+
+def bench_simulate_week(map_engine: str = "markov"):
+    game_manager = _make_game(map_engine=map_engine)
+    league_name = game_manager.leagues[0]["name"]
+    
+    def run():
+        game_manager._simulate_week(league_name)
+        game_manager.match_manager.match_history.clear()
+    
+    return run
+
+
+def bench_batch_week(map_engine: str = "markov"):
+    game_manager = _make_game(batch_simulation=True, map_engine=map_engine)
+    return lambda: game_manager.simulation_manager.simulate_week(game_manager.schedule_manager, 0)
+
+
+def bench_rating_update(n_matches: int):
+    rating_manager = _make_game().rating_manager
+    rng = np.random.default_rng(SEED)
+    team1_ids = rng.integers(0, rating_manager.registry.team_count, n_matches)
+    team2_ids = rng.integers(0, rating_manager.registry.team_count, n_matches)
+    team1_maps = rng.integers(0, 3, n_matches)
+    team2_maps = np.where(team1_maps == 2, rng.integers(0, 2, n_matches), 2)
+    return lambda: rating_manager.update(team1_ids, team2_ids, team1_maps, team2_maps)
+
+
+def bench_roster_generation(n_teams: int):
+    roster_generator = RosterGenerator()
+    team_names = [f"Team {i}" for i in range(n_teams)]
+    return lambda: roster_generator.generate(team_names, np.random.default_rng(SEED))
+
+
+def bench_world_load(n_leagues: int):
+    lines = [
+        json.dumps({"name": f"League {i}", "teams": [{"name": f"League {i} Team {j}"} for j in range(12)]})
+        for i in range(n_leagues)
+    ]
+    
+    def run():
+        registry = TeamRegistry(WorldIndex.from_lines(lines))
+        ScheduleManager(registry.world)
+    
+    return run
+
+
+def bench_advance_season():
+    game_manager = _make_game()
+    return game_manager._advance_to_next_season
+
+
+BENCHMARKS = {
+    "simulate_map[markov]": lambda: bench_simulate_map("markov"),
+    "simulate_map[rounds]": lambda: bench_simulate_map("rounds"),
+    "simulate_map[players]": lambda: bench_simulate_map("players"),
+    "simulate_match[bo3]": lambda: bench_simulate_match(3),
+    "simulate_match[bo5]": lambda: bench_simulate_match(5),
+    "round_robin[12]": lambda: bench_round_robin(12),
+    "round_robin[100]": lambda: bench_round_robin(100),
+    "round_robin[500]": lambda: bench_round_robin(500),
+    "sort_standings[12]": lambda: bench_sort_standings(12),
+    "sort_standings[1000]": lambda: bench_sort_standings(1000),
+    "simulate_week[league]": bench_simulate_week,
+    "simulate_week[all, batch]": bench_batch_week,
+    "simulate_week[league, players]": lambda: bench_simulate_week("players"),
+    "simulate_week[all, batch, players]": lambda: bench_batch_week("players"),
+    "rating_update[24]": lambda: bench_rating_update(24),
+    "rating_update[10000]": lambda: bench_rating_update(10_000),
+    "roster_generation[12]": lambda: bench_roster_generation(12),
+    "roster_generation[10000]": lambda: bench_roster_generation(10_000),
+    "world_load[5000]": lambda: bench_world_load(5000),
+    "advance_to_next_season": bench_advance_season,
+}
+
+
+def _calibrate(fn) -> int:
+    """Find how many calls make one timing round last at least MIN_ROUND_TIME."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= MIN_ROUND_TIME or number >= 1_000_000:
+            return number
+        number *= 2
+
+
+def run_benchmark(name: str, setup) -> dict:
+    """Time one benchmark.
+    
+    Args:
+        name: Benchmark name.
+        setup: Callable returning the function to time.
+    
+    Returns:
+        Dictionary with ops/sec, mean time per op and peak memory.
+    """
+    random.seed(SEED)
+    fn = setup()
+    number = _calibrate(fn)
+    
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+    
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    best = min(timings)
+    return {
+        "name": name,
+        "ops_per_sec": 1.0 / best,
+        "mean_seconds": sum(timings) / len(timings),
+        "best_seconds": best,
+        "calls_per_round": number,
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare(results: list, baseline: dict, threshold: float) -> list:
+    """Attach the change against the baseline to each result.
+    
+    Args:
+        results: Benchmark results.
+        baseline: Saved results keyed by benchmark name.
+        threshold: Relative slowdown reported as a regression.
+    
+    Returns:
+        Names of the benchmarks that regressed.
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result["name"])
+        if previous is None:
+            continue
+        change = result["ops_per_sec"] / previous["ops_per_sec"] - 1.0
+        result["change_vs_baseline"] = change
+        if change < -threshold:
+            regressions.append(result["name"])
+    return regressions
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Run the simulation benchmark suite")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write JSON results")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Slowdown reported as a regression (default 0.10)")
+    args = parser.parse_args()
+    
+    # Benchmarked code paths print Rich output and wait for Enter
+    console.quiet = True
+    builtins.input = lambda prompt="": ""
+    
+    results = []
+    for name, setup in BENCHMARKS.items():
+        if args.filter in name:
+            results.append(run_benchmark(name, setup))
+    
+    baseline = {}
+    if args.baseline.exists():
+        baseline = {r["name"]: r for r in json.loads(args.baseline.read_text())["results"]}
+    regressions = compare(results, baseline, args.threshold)
+    
+    for result in results:
+        change = result.get("change_vs_baseline")
+        change_str = f"{change:+.1%}" if change is not None else "n/a"
+        print(
+            f"{result['name']:<26} {result['ops_per_sec']:>14,.1f} ops/sec  "
+            f"{_format_bytes(result['peak_memory_bytes']):>10} peak  {change_str:>8} vs baseline"
+        )
+    
+    payload = {
+        "seed": SEED,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    args.output.write_text(json.dumps(payload, indent=2))
+    print(f"\nResults written to {args.output}")
+    
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(payload, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+    
+    if regressions:
+        print(f"Regressions over {args.threshold:.0%}: {', '.join(regressions)}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
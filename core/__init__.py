@@ -1,6 +1,8 @@
 """Core module for shared utilities."""
 
 from .console import console
+from .map_odds import MapScoreDistribution, get_map_distribution
+from .rng import RNGService
+from .series_odds import SeriesOdds, get_series_odds
 
-__all__ = ["console"]
-
+__all__ = ["console", "MapScoreDistribution", "get_map_distribution", "RNGService", "SeriesOdds", "get_series_odds"]
@@ -0,0 +1,135 @@
+"""Exact map score distributions for a fixed round-win probability.
+
+A map is a sequence of independent rounds won by team 1 with probability
+``p``: the first team to 13 wins, and from 12-12 play continues until one
+team is two rounds ahead. That makes every final score computable in closed
+form, so a whole map can be sampled from a single uniform draw instead of
+playing it out round by round.
+"""
+
+import bisect
+import math
+from functools import lru_cache
+
+ROUNDS_TO_WIN = 13
+
+# Round-win probabilities are quantized to this many steps before lookup so
+# the distribution cache stays bounded.
+PROBABILITY_RESOLUTION = 10_000
+
+# At most this many distributions are kept; each holds a 24-entry CDF.
+DISTRIBUTION_CACHE_SIZE = 2048
+
+# Regulation finishes: the winner takes round 13 with the loser on k < 12.
+# Shared by every distribution, in CDF order.
+REGULATION_SCORES = tuple(
+    [(ROUNDS_TO_WIN, k) for k in range(ROUNDS_TO_WIN - 1)]
+    + [(k, ROUNDS_TO_WIN) for k in range(ROUNDS_TO_WIN - 1)]
+)
+
+
+class MapScoreDistribution:
+    """Final-score distribution of a map for one round-win probability."""
+
+    __slots__ = ("p", "scores", "cdf", "overtime_probability", "team1_win_probability")
+
+    def __init__(self, p: float):
+        """Build the distribution.
+
+        Args:
+            p: Probability that team 1 wins any single round.
+        """
+        q = 1.0 - p
+        last = ROUNDS_TO_WIN - 1
+
+        self.scores = REGULATION_SCORES
+        probabilities = [math.comb(last + k, k) * p**ROUNDS_TO_WIN * q**k for k in range(last)]
+        probabilities += [math.comb(last + k, k) * q**ROUNDS_TO_WIN * p**k for k in range(last)]
+
+        self.cdf = []
+        total = 0.0
+        for probability in probabilities:
+            total += probability
+            self.cdf.append(total)
+
+        self.p = p
+        self.overtime_probability = math.comb(2 * last, last) * (p * q) ** last
+
+        # From 12-12, each pair of rounds ends the map with probability p^2 + q^2.
+        team1_regulation = sum(probabilities[:last])
+        decisive = p * p + q * q
+        team1_overtime = p * p / decisive if decisive > 0 else 0.5
+        self.team1_win_probability = team1_regulation + self.overtime_probability * team1_overtime
+
+    def sample(self, u: float) -> tuple[int, int]:
+        """Map a uniform draw onto a final score.
+
+        Args:
+            u: Uniform random number in [0, 1).
+
+        Returns:
+            Tuple of (team1_score, team2_score).
+        """
+        idx = bisect.bisect_right(self.cdf, u)
+        if idx < len(self.scores):
+            return self.scores[idx]
+        if self.overtime_probability == 0:
+            # Rounding left u past the CDF; take the last reachable score.
+            return self.scores[bisect.bisect_left(self.cdf, self.cdf[-1])]
+        return self._sample_overtime((u - self.cdf[-1]) / self.overtime_probability)
+
+    def _sample_overtime(self, u: float) -> tuple[int, int]:
+        """Map a uniform draw onto an overtime final score.
+
+        Overtime is a geometric number of split round pairs followed by one
+        pair won outright, so the draw is inverted through the geometric CDF
+        and the remainder decides the winner.
+
+        Args:
+            u: Uniform random number in [0, 1), rescaled to the overtime branch.
+
+        Returns:
+            Tuple of (team1_score, team2_score).
+        """
+        p = self.p
+        q = 1.0 - p
+        split = 2.0 * p * q
+        u = min(max(u, 0.0), math.nextafter(1.0, 0.0))
+
+        extra_pairs = int(math.log1p(-u) / math.log(split)) if split > 0 else 0
+        reached = split**extra_pairs
+        remainder = (u - (1.0 - reached)) / reached if reached > 0 else 0.0
+
+        base = ROUNDS_TO_WIN - 1 + extra_pairs
+        if remainder < p * p:
+            return (base + 2, base)
+        return (base, base + 2)
+
+
+def quantize_probability(p: float) -> int:
+    """Quantize a round-win probability to a cache key.
+
+    Args:
+        p: Probability in [0, 1].
+
+    Returns:
+        Integer step in [0, PROBABILITY_RESOLUTION].
+    """
+    return min(max(round(p * PROBABILITY_RESOLUTION), 0), PROBABILITY_RESOLUTION)
+
+
+@lru_cache(maxsize=DISTRIBUTION_CACHE_SIZE)
+def _distribution_for_key(key: int) -> MapScoreDistribution:
+    return MapScoreDistribution(key / PROBABILITY_RESOLUTION)
+
+
+def get_map_distribution(p: float) -> MapScoreDistribution:
+    """Get the cached score distribution for a round-win probability.
+
+    Args:
+        p: Probability that team 1 wins any single round.
+
+    Returns:
+        MapScoreDistribution for the quantized probability.
+    """
+    return _distribution_for_key(quantize_probability(p))
@@ -0,0 +1,147 @@
+"""Opt-in phase timing for finding where simulation time goes.
+
+Code marks its phases with the ``phase`` context manager or the ``timed``
+decorator. While the shared ``profiler`` is disabled (the default) a phase
+costs one attribute check; once enabled, every phase records its call count
+and inclusive wall time, and Rich rendering through the shared console is
+timed as the "render" phase.
+
+    profiler.enable()
+    ...
+    print(profiler.format_report())
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+from .console import console
+
+
+class Profiler:
+    """Collects call counts and wall time per named phase."""
+    
+    def __init__(self):
+        """Initialize a disabled profiler with no recorded phases."""
+        self.enabled = False
+        self.stats = {}  # Phase name -> [calls, total seconds]
+        self._lock = threading.Lock()  # Phases may end on several threads at once
+        self._console_print = None
+    
+    def enable(self) -> None:
+        """Start recording phases, including console rendering."""
+        if self.enabled:
+            return
+        self.enabled = True
+        
+        # Rich renders tables synchronously inside print, so timing print
+        # times the rendering.
+        self._console_print = console.print
+        console.print = self.timed("render")(self._console_print)
+    
+    def disable(self) -> None:
+        """Stop recording phases; recorded stats are kept."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        del console.print
+        self._console_print = None
+    
+    def reset(self) -> None:
+        """Forget all recorded phases."""
+        self.stats = {}
+    
+    def record(self, name: str, seconds: float) -> None:
+        """Add one call of a phase.
+        
+        Args:
+            name: Phase name.
+            seconds: Wall time the call took.
+        """
+        with self._lock:
+            entry = self.stats.get(name)
+            if entry is None:
+                self.stats[name] = [1, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one call of a phase.
+        
+        Args:
+            name: Phase name.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+    
+    def timed(self, name: str) -> Callable:
+        """Decorator that times every call of a function as a phase.
+        
+        Args:
+            name: Phase name.
+        
+        Returns:
+            Decorator for the function.
+        """
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+    
+    def report(self) -> list[dict]:
+        """Get the recorded phases, slowest first.
+        
+        Phases are timed inclusively, so a phase that runs inside another
+        (e.g. simulate_map inside simulate_week) is counted in both.
+        
+        Returns:
+            List of dictionaries with name, calls, total_seconds and
+            mean_seconds.
+        """
+        rows = [
+            {
+                "name": name,
+                "calls": calls,
+                "total_seconds": total,
+                "mean_seconds": total / calls,
+            }
+            for name, (calls, total) in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row["total_seconds"], reverse=True)
+        return rows
+    
+    def format_report(self) -> str:
+        """Format the recorded phases as a plain text table.
+        
+        Returns:
+            Report text, one phase per line.
+        """
+        lines = [f"{'Phase':<32} {'Calls':>10} {'Total (s)':>12} {'Mean (us)':>12}"]
+        for row in self.report():
+            lines.append(
+                f"{row['name']:<32} {row['calls']:>10,} {row['total_seconds']:>12.4f} "
+                f"{row['mean_seconds'] * 1e6:>12.1f}"
+            )
+        return "\n".join(lines)
+
+
+profiler = Profiler()
+phase = profiler.phase
+timed = profiler.timed
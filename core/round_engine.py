@@ -0,0 +1,254 @@
+"""Vectorized player-level round simulation.
+
+A round is a string of one-on-one duels. Players enter fights in a random
+order biased by their role's aggression, and the loser of each duel is
+replaced by the next teammate in line until one side has lost all five. The
+chance to win a duel follows the difference in effective rating, which
+combines the player's rating, a side bonus for their role, the team's
+utility, and how much each team spent on its loadout that round. Team
+credits follow a simple economy: pistol rounds at the start of each half,
+win and loss income with a loss streak bonus, kill rewards, and a fixed
+bank in overtime.
+
+Every map of a batch is played in lockstep, one round at a time, with all
+players of all maps held in NumPy arrays; finished maps drop out of the
+batch as they end.
+"""
+
+import numpy as np
+from .map_odds import ROUNDS_TO_WIN
+
+PLAYERS_PER_TEAM = 5
+
+# Per role: (aggression, attack bonus, defense bonus, utility). Aggression
+# weights how early a player takes fights; bonuses are in rating points.
+ROLE_PROFILES = {
+    "duelist": (3.0, 4.0, 0.0, 0.0),
+    "initiator": (1.5, 2.0, 1.0, 3.0),
+    "controller": (1.0, 1.0, 2.0, 3.0),
+    "flex": (1.2, 1.0, 1.0, 1.0),
+    "sentinel": (0.6, 0.0, 5.0, 2.0)
+}
+ROLE_NAMES = tuple(ROLE_PROFILES)
+_AGGRESSION, _ATTACK_BONUS, _DEFENSE_BONUS, _UTILITY = (
+    np.array(column) for column in zip(*ROLE_PROFILES.values())
+)
+_ROLE_INDICES = {role: idx for idx, role in enumerate(ROLE_NAMES)}
+_DEFAULT_ROLE = _ROLE_INDICES["flex"]
+
+# Team utility is summed over the roster and added to every player, up to a cap.
+UTILITY_CAP = 8.0
+
+# Logistic scale of duels: a 40 point rating edge wins about 62% of duels.
+DUEL_SCALE = 80.0
+
+# Rating points a full buy is worth over a team with nothing bought.
+LOADOUT_WEIGHT = 60.0
+
+# Economy, in credits per player
+HALF_LENGTH = 12
+PISTOL_CREDITS = 800
+OVERTIME_CREDITS = 5000
+FULL_BUY = 3900
+HALF_BUY = 2000
+WIN_REWARD = 3000
+LOSS_REWARD = 1900
+LOSS_STREAK_BONUS = 500
+MAX_LOSS_STREAK_BONUSES = 2
+KILL_REWARD = 200
+MAX_CREDITS = 9000
+
+# Loadout bought for a bank below, between and above the two thresholds
+_BUY_THRESHOLDS = np.array([HALF_BUY, FULL_BUY])
+_BUYS = np.array([0.0, HALF_BUY, FULL_BUY])
+
+# Round income by loss streak; a streak of 0 means the team won the round
+_INCOME = np.array(
+    [WIN_REWARD] + [LOSS_REWARD + LOSS_STREAK_BONUS * bonuses for bonuses in range(MAX_LOSS_STREAK_BONUSES + 1)],
+    dtype=np.float64
+)
+
+# A round is decided in at most 2 * PLAYERS_PER_TEAM - 1 duels
+_MAX_DUELS = 2 * PLAYERS_PER_TEAM - 1
+_TEAM1_COLUMN = np.array([True, False])
+
+
+def role_indices(role_names: list[str]) -> np.ndarray:
+    """Convert role names to the engine's role indices.
+    
+    Args:
+        role_names: Role of each player.
+    
+    Returns:
+        Array of indices into ROLE_NAMES; unknown roles play as flex.
+    """
+    return np.array([_ROLE_INDICES.get(role, _DEFAULT_ROLE) for role in role_names], dtype=np.int64)
+
+
+def roster_arrays(players: list) -> tuple[np.ndarray, np.ndarray]:
+    """Convert a roster to the engine's rating and role arrays.
+    
+    Args:
+        players: The team's players; anything with rating and role attributes.
+    
+    Returns:
+        Tuple of (ratings, roles) arrays of length PLAYERS_PER_TEAM. Roles are
+        indices into ROLE_NAMES; unknown roles play as flex.
+    """
+    if len(players) != PLAYERS_PER_TEAM:
+        raise ValueError(f"The player engine needs {PLAYERS_PER_TEAM} players per team, got {len(players)}")
+    ratings = np.array([player.rating for player in players], dtype=np.float64)
+    roles = role_indices([player.role for player in players])
+    return ratings, roles
+
+
+def matchup_arrays(matchups: list, maps_per_matchup: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """Stack the rosters of several matchups into simulate_maps input.
+    
+    Args:
+        matchups: List of (team1_players, team2_players) rosters.
+        maps_per_matchup: Number of consecutive maps to lay out per matchup.
+    
+    Returns:
+        Tuple of (ratings, roles) arrays of shape
+        (len(matchups) * maps_per_matchup, 2, PLAYERS_PER_TEAM).
+    """
+    rosters = [roster_arrays(players) for matchup in matchups for players in matchup]
+    shape = (len(matchups), 2, PLAYERS_PER_TEAM)
+    ratings = np.array([ratings for ratings, _ in rosters]).reshape(shape)
+    roles = np.array([roles for _, roles in rosters]).reshape(shape)
+    return np.repeat(ratings, maps_per_matchup, axis=0), np.repeat(roles, maps_per_matchup, axis=0)
+
+
+def _play_duels(entries: np.ndarray, thresholds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Play one round's duels in every map.
+    
+    Each side's next player in line fights, and the loser is replaced by the
+    next teammate. A threshold is drawn for every duel slot so the random
+    stream does not depend on how rounds go, but duels after a side is wiped
+    out are not played and count no deaths.
+    
+    Args:
+        entries: Effective ratings in entry order, shape (maps, 2,
+            PLAYERS_PER_TEAM); entries[m, t, k] is the k-th player of team t
+            to fight in map m.
+        thresholds: Rating edge team 1 must beat in each duel slot, shape
+            (_MAX_DUELS, maps).
+    
+    Returns:
+        Tuple of (team1_deaths, team2_deaths) arrays; the side that lost the
+        round has PLAYERS_PER_TEAM deaths.
+    """
+    n_maps = len(entries)
+    team1_entries = entries[:, 0].ravel()
+    team2_entries = entries[:, 1].ravel()
+    first_entry = np.arange(n_maps) * PLAYERS_PER_TEAM  # Where each map's order starts in the flattened entries
+    last_player = PLAYERS_PER_TEAM - 1
+    
+    team1_deaths = np.zeros(n_maps, dtype=np.int64)
+    team2_deaths = np.zeros(n_maps, dtype=np.int64)
+    for duel_thresholds in thresholds:
+        played = (team1_deaths < PLAYERS_PER_TEAM) & (team2_deaths < PLAYERS_PER_TEAM)
+        edge = (
+            team1_entries.take(first_entry + np.minimum(team1_deaths, last_player))
+            - team2_entries.take(first_entry + np.minimum(team2_deaths, last_player))
+        )
+        team1_won_duel = edge > duel_thresholds
+        team2_deaths += team1_won_duel & played
+        team1_deaths += ~team1_won_duel & played
+    return team1_deaths, team2_deaths
+
+
+def simulate_maps(
+    ratings: np.ndarray,
+    roles: np.ndarray,
+    generator: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """Play a batch of maps to completion.
+    
+    Team 1 attacks first; sides swap after HALF_LENGTH rounds and after every
+    overtime round.
+    
+    Args:
+        ratings: Player ratings, shape (maps, 2, PLAYERS_PER_TEAM), team 1 first.
+        roles: Role indices into ROLE_NAMES, same shape as ratings.
+        generator: NumPy generator to draw from.
+    
+    Returns:
+        Tuple of (team1_scores, team2_scores) arrays, one entry per map.
+    """
+    n_maps = len(ratings)
+    base = ratings + np.minimum(_UTILITY[roles].sum(axis=2), UTILITY_CAP)[:, :, None]
+    attack = base + _ATTACK_BONUS[roles]
+    defense = base + _DEFENSE_BONUS[roles]
+    
+    # Effective ratings by side, pre-divided by DUEL_SCALE, each of shape
+    # (maps, 2, PLAYERS_PER_TEAM): index 0 while team 1 attacks, 1 while it defends
+    side_ratings = [
+        np.stack([attack[:, 0], defense[:, 1]], axis=1) / DUEL_SCALE,
+        np.stack([defense[:, 0], attack[:, 1]], axis=1) / DUEL_SCALE
+    ]
+    aggression = _AGGRESSION[roles]
+    
+    # State of the maps still being played
+    map_ids = np.arange(n_maps)
+    scores = np.zeros((n_maps, 2), dtype=np.int64)
+    credits = np.zeros((n_maps, 2))
+    loss_streaks = np.zeros((n_maps, 2), dtype=np.int64)
+    
+    team1_scores = np.zeros(n_maps, dtype=np.int64)
+    team2_scores = np.zeros(n_maps, dtype=np.int64)
+    
+    round_number = 0
+    while len(map_ids):
+        n_playing = len(map_ids)
+        regulation = round_number < 2 * HALF_LENGTH
+        side = (round_number // HALF_LENGTH) % 2 if regulation else round_number % 2
+        
+        # Buy phase
+        if regulation and round_number % HALF_LENGTH == 0:
+            credits[:] = PISTOL_CREDITS
+            loadouts = credits.copy()
+        else:
+            if not regulation:
+                credits[:] = OVERTIME_CREDITS
+            loadouts = _BUYS[np.searchsorted(_BUY_THRESHOLDS, credits, side="right")]
+        credits -= loadouts
+        loadout_edge = (loadouts[:, 0] - loadouts[:, 1]) * (LOADOUT_WEIGHT / FULL_BUY / DUEL_SCALE)
+        
+        # Entry order: weighted sampling without replacement via exponential keys
+        keys = generator.exponential(size=(n_playing, 2, PLAYERS_PER_TEAM)) / aggression
+        entries = np.take_along_axis(side_ratings[side][map_ids], np.argsort(keys, axis=2), axis=2)
+        
+        # Team 1 wins a duel when its rating edge beats a logistic draw
+        thresholds = generator.logistic(size=(_MAX_DUELS, n_playing)) - loadout_edge
+        team1_deaths, team2_deaths = _play_duels(entries, thresholds)
+        team1_won = team2_deaths >= PLAYERS_PER_TEAM
+        won = team1_won[:, None] == _TEAM1_COLUMN
+        scores += won
+        
+        # Income: survivors keep their loadout, kills pay out, and the loser's
+        # bonus grows with its loss streak.
+        deaths = np.stack([team1_deaths, team2_deaths], axis=1)
+        loss_streaks = (loss_streaks + 1) * ~won
+        credits += _INCOME[np.minimum(loss_streaks, len(_INCOME) - 1)]
+        credits += deaths[:, ::-1] * (KILL_REWARD / PLAYERS_PER_TEAM)
+        credits += loadouts * (PLAYERS_PER_TEAM - deaths) / PLAYERS_PER_TEAM
+        np.minimum(credits, MAX_CREDITS, out=credits)
+        
+        round_number += 1
+        if round_number < ROUNDS_TO_WIN:
+            continue
+        finished = (scores.max(axis=1) >= ROUNDS_TO_WIN) & (np.abs(scores[:, 0] - scores[:, 1]) >= 2)
+        if finished.any():
+            done = map_ids[finished]
+            team1_scores[done] = scores[finished, 0]
+            team2_scores[done] = scores[finished, 1]
+            playing = ~finished
+            map_ids = map_ids[playing]
+            aggression = aggression[playing]
+            scores = scores[playing]
+            credits = credits[playing]
+            loss_streaks = loss_streaks[playing]
+    
+    return team1_scores, team2_scores
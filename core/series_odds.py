@@ -0,0 +1,151 @@
+"""Exact series outcome probabilities for best-of-N matches.
+
+Maps of a series are independent and won by team 1 with the same
+probability, so the chance of every final series score follows in closed
+form: team 1 wins n to k when it takes n of the first n+k maps, including the
+last one. Combined with the exact map-win probability from core.map_odds,
+a matchup's odds are computed without simulating it.
+
+Odds are memoized in two LRU caches: one keyed on quantized team rating
+pairs, for the default roster strength, and one keyed on the quantized
+map-win probability, for any other source of map odds.
+"""
+
+import math
+from functools import lru_cache
+import numpy as np
+from .map_odds import PROBABILITY_RESOLUTION, get_map_distribution, quantize_probability
+
+# Team ratings are quantized to 1 / RATING_RESOLUTION of a point before lookup
+RATING_RESOLUTION = 100
+
+# At most this many odds are kept per cache
+SERIES_CACHE_SIZE = 4096
+
+
+def round_win_chance(team1_rating: float, team2_rating: float) -> float:
+    """Get the round-win chance two team ratings give team1.
+    
+    Args:
+        team1_rating: First team's rating.
+        team2_rating: Second team's rating.
+    
+    Returns:
+        team1's share of the combined rating, or 0.5 if both are zero.
+    """
+    total_rating = team1_rating + team2_rating
+    return team1_rating / total_rating if total_rating > 0 else 0.5
+
+
+@lru_cache(maxsize=None)
+def series_scores(series_format: int) -> tuple[tuple[int, int], ...]:
+    """Get every possible final score of a series.
+    
+    Args:
+        series_format: Number of maps (3 or 5).
+    
+    Returns:
+        Tuple of (team1_maps, team2_maps) scores: team1's wins from the
+        sweep down, then team2's in the same order.
+    """
+    maps_to_win = (series_format // 2) + 1
+    return tuple(
+        [(maps_to_win, k) for k in range(maps_to_win)]
+        + [(k, maps_to_win) for k in range(maps_to_win)]
+    )
+
+
+def series_score_probabilities(map_win_probabilities: np.ndarray, series_format: int) -> np.ndarray:
+    """Get the probability of every final series score, for many matchups at once.
+    
+    Args:
+        map_win_probabilities: Probability that team1 wins a map, one per matchup.
+        series_format: Number of maps (3 or 5).
+    
+    Returns:
+        Array of shape (matchups, len(series_scores(series_format))), in
+        series_scores order.
+    """
+    maps_to_win = (series_format // 2) + 1
+    p = np.asarray(map_win_probabilities, dtype=np.float64)[:, None]
+    q = 1.0 - p
+    k = np.arange(maps_to_win)
+    ways = np.array([math.comb(maps_to_win - 1 + i, i) for i in range(maps_to_win)], dtype=np.float64)
+    return np.concatenate([ways * p**maps_to_win * q**k, ways * q**maps_to_win * p**k], axis=1)
+
+
+class SeriesOdds:
+    """Outcome probabilities of a series for one map-win probability."""
+    
+    __slots__ = ("map_win_probability", "series_format", "scores", "probabilities", "team1_win_probability")
+    
+    def __init__(self, map_win_probability: float, series_format: int):
+        """Compute the odds.
+        
+        Args:
+            map_win_probability: Probability that team 1 wins any single map.
+            series_format: Number of maps (3 or 5).
+        """
+        self.map_win_probability = map_win_probability
+        self.series_format = series_format
+        self.scores = series_scores(series_format)
+        self.probabilities = tuple(series_score_probabilities([map_win_probability], series_format)[0].tolist())
+        self.team1_win_probability = sum(self.probabilities[:len(self.scores) // 2])
+    
+    def score_probability(self, team1_maps: int, team2_maps: int) -> float:
+        """Get the probability of one final score.
+        
+        Args:
+            team1_maps: Maps won by team 1.
+            team2_maps: Maps won by team 2.
+        
+        Returns:
+            Probability of the score, or 0.0 if the series cannot end that way.
+        """
+        try:
+            return self.probabilities[self.scores.index((team1_maps, team2_maps))]
+        except ValueError:
+            return 0.0
+
+
+@lru_cache(maxsize=SERIES_CACHE_SIZE)
+def _odds_for_map_key(key: int, series_format: int) -> SeriesOdds:
+    return SeriesOdds(key / PROBABILITY_RESOLUTION, series_format)
+
+
+def get_series_odds(map_win_probability: float, series_format: int = 3) -> SeriesOdds:
+    """Get the cached series odds for a map-win probability.
+    
+    Args:
+        map_win_probability: Probability that team 1 wins any single map.
+        series_format: Number of maps (3 or 5).
+    
+    Returns:
+        SeriesOdds for the quantized probability.
+    """
+    return _odds_for_map_key(quantize_probability(map_win_probability), series_format)
+
+
+@lru_cache(maxsize=SERIES_CACHE_SIZE)
+def _odds_for_rating_keys(team1_key: int, team2_key: int, series_format: int) -> SeriesOdds:
+    chance = round_win_chance(team1_key / RATING_RESOLUTION, team2_key / RATING_RESOLUTION)
+    return SeriesOdds(get_map_distribution(chance).team1_win_probability, series_format)
+
+
+def get_rating_series_odds(team1_rating: float, team2_rating: float, series_format: int = 3) -> SeriesOdds:
+    """Get the cached series odds for two team ratings.
+    
+    The round-win chance is team1's share of the combined rating, as in the
+    match engines.
+    
+    Args:
+        team1_rating: First team's rating.
+        team2_rating: Second team's rating.
+        series_format: Number of maps (3 or 5).
+    
+    Returns:
+        SeriesOdds for the quantized rating pair.
+    """
+    return _odds_for_rating_keys(
+        round(team1_rating * RATING_RESOLUTION), round(team2_rating * RATING_RESOLUTION), series_format
+    )
@@ -1,7 +1,17 @@
 """Main entry point for Valorant Manager Game."""
 
+import argparse
+import cProfile
+import time
 from core.console import console
-from managers import LeagueManager, GameManager
+from core.profiling import profiler
+from managers import LeagueManager, GameManager, AsyncGameManager, MatchManager, StorageManager, SaveManager
+from managers.progression_manager import PROGRESSION_MODELS
+from models import RATING_DISTRIBUTIONS
+from models.Team import TEAM_RATINGS
+
+# League data loaded unless --world names another file
+DEFAULT_WORLD = "data/leagues_and_teams.json"
 
 
 def main_menu() -> bool:
@@ -25,31 +35,234 @@ def main_menu() -> bool:
         return main_menu()
 
 
-def start_game() -> None:
-    """Initialize and start a new game."""
+def start_game(
+    output_mode: str = "full",
+    map_engine: str = "markov",
+    blocking_ui: bool = False,
+    team_strength: str = "roster",
+    rating_distribution: str = "uniform",
+    progression: list[str] | None = None,
+    world: str = DEFAULT_WORLD,
+    team_rating: str = "mean"
+) -> None:
+    """Initialize and start a new game.
+    
+    Args:
+        output_mode: Initial GameManager output mode.
+        map_engine: How maps are simulated; one of MatchManager.MAP_ENGINES.
+        blocking_ui: Use the blocking GameManager loop, which finishes every
+            action before reading the next input, instead of AsyncGameManager.
+        team_strength: What match odds are based on; one of
+            GameManager.TEAM_STRENGTHS.
+        rating_distribution: How player ratings are drawn; a key of
+            RATING_DISTRIBUTIONS.
+        progression: Progression models combined every offseason; keys of
+            PROGRESSION_MODELS.
+        world: League data file; JSON, or JSON Lines with one league per line.
+        team_rating: How team strength is computed from a roster; a key of
+            TEAM_RATINGS.
+    """
     console.print("[green]Game starting...[/green]")
     console.print("[bold]Initializing Game...[/bold]")
     
     # Select region and team
-    league_manager = LeagueManager()
+    league_manager = LeagueManager(world, rating_distribution=rating_distribution, team_rating=team_rating)
     selected_league = league_manager.select_region()
     user_team = league_manager.select_team_from_region(selected_league)
     
     # Run the game
-    game_manager = GameManager(user_team, league_manager.leagues)
+    manager_class = GameManager if blocking_ui else AsyncGameManager
+    game_manager = manager_class(
+        user_team, league_manager.leagues,
+        registry=league_manager.registry, output_mode=output_mode, map_engine=map_engine,
+        team_strength=team_strength, progression=progression
+    )
     game_manager.run()
 
 
-def main() -> None:
-    """Main entry point."""
+def run_headless(args: argparse.Namespace) -> None:
+    """Simulate whole seasons without prompts or Rich output.
+    
+    Args:
+        args: Parsed command line arguments.
+    """
+    league_manager = LeagueManager(
+        args.world, seed=args.seed, rating_distribution=args.rating_distribution, team_rating=args.team_rating
+    )
+    if args.team:
+        user_team = league_manager.find_team(args.team)
+        if user_team is None:
+            raise SystemExit(f"Unknown team: {args.team}")
+    else:
+        user_team = league_manager.find_team(league_manager.leagues[0]["teams"][0]["name"])
+    
+    storage_manager = StorageManager(args.db) if args.db else None
+    save_manager = SaveManager(args.save) if args.save else None
+    if save_manager and save_manager.exists():
+        game_manager = save_manager.load(
+            league_manager.leagues,
+            storage_manager=storage_manager,
+            match_history_limit=args.history_limit
+        )
+        print(f"Resumed from {args.save} at season {game_manager.current_season}, week {game_manager.current_week + 1}")
+        if game_manager.current_season > args.seasons:
+            game_manager.match_manager.close()
+            if storage_manager:
+                storage_manager.close()
+            raise SystemExit(
+                f"{args.save} is already past season {args.seasons}; "
+                f"pass --seasons {game_manager.current_season} or higher to keep playing"
+            )
+    else:
+        game_manager = GameManager(
+            user_team,
+            league_manager.leagues,
+            batch_simulation=args.batch,
+            seed=args.seed,
+            storage_manager=storage_manager,
+            match_history_limit=args.history_limit,
+            double_round_robin=args.double_round_robin,
+            registry=league_manager.registry,
+            save_manager=save_manager,
+            map_engine=args.map_engine,
+            team_strength=args.team_strength,
+            progression=args.progression
+        )
+    
+    total_matches = 0
+    total_maps = 0
+    seasons_played = 0
+    start = time.perf_counter()
+    
+    while game_manager.current_season <= args.seasons:
+        while not game_manager.is_season_over():
+            game_manager.play_week()
+        
+        # Every match has one winner and every map one winner
+        wins, _, maps_won, _ = game_manager.registry.records.sum(axis=0).tolist()
+        total_matches += wins
+        total_maps += maps_won
+        
+        season = game_manager.current_season
+        seasons_played += 1
+        game_manager.end_season()
+        
+        if not args.quiet:
+            record = game_manager.season_history.get(season)
+            if record:
+                print(
+                    f"Season {season}: {record['wins']}-{record['losses']} "
+                    f"(maps {record['maps_won']}-{record['maps_lost']}), rank #{record['rank']}"
+                )
+    
+    elapsed = time.perf_counter() - start
+    game_manager.match_manager.close()
+    if storage_manager:
+        storage_manager.close()
+    print(
+        f"Simulated {seasons_played} seasons ({total_matches} matches, {total_maps} maps) "
+        f"for {game_manager.user_team.name} in {elapsed:.2f}s: "
+        f"{total_matches / elapsed:,.0f} matches/sec, {total_maps / elapsed:,.0f} maps/sec"
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+    
+    Returns:
+        Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Valorant Manager Game")
+    parser.add_argument("--seasons", type=int, help="Simulate up to this season headlessly instead of playing interactively")
+    parser.add_argument("--team", help="Team to manage in headless mode (default: first team of the first league)")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible runs")
+    parser.add_argument("--batch", action="store_true", help="Use vectorized whole-week simulation")
+    parser.add_argument("--quiet", action="store_true", help="Only print the final summary")
+    parser.add_argument("--db", help="SQLite file to store match history and season records in")
+    parser.add_argument("--double-round-robin", action="store_true", help="Play every opponent twice per season in headless mode")
+    parser.add_argument("--save", help="Save file to checkpoint every week to; an existing save is resumed")
+    parser.add_argument("--history-limit", type=int, help="Keep only this many recent matches in memory, spilling older ones to disk")
+    parser.add_argument(
+        "--output-mode", choices=GameManager.OUTPUT_MODES, default="full",
+        help="How much to render after each week in interactive mode (default: full)"
+    )
+    parser.add_argument(
+        "--map-engine", choices=MatchManager.MAP_ENGINES, default="markov",
+        help="How maps are simulated: exact score distribution, round by round, or player duels (default: markov)"
+    )
+    parser.add_argument(
+        "--team-strength", choices=GameManager.TEAM_STRENGTHS, default="roster",
+        help="Base match odds on player ratings or on the teams' Elo ratings (default: roster)"
+    )
+    parser.add_argument(
+        "--team-rating", choices=list(TEAM_RATINGS), default="mean",
+        help="How team strength is computed from a roster: plain or role-weighted average (default: mean)"
+    )
+    parser.add_argument(
+        "--rating-distribution", choices=list(RATING_DISTRIBUTIONS), default="uniform",
+        help="How player ratings are drawn for new rosters (default: uniform)"
+    )
+    parser.add_argument(
+        "--progression", nargs="+", choices=list(PROGRESSION_MODELS), default=["random"],
+        help="Offseason progression models to combine (default: random)"
+    )
+    parser.add_argument(
+        "--world", default=DEFAULT_WORLD,
+        help=f"League data file: JSON, or JSON Lines (.jsonl) with one league per line (default: {DEFAULT_WORLD})"
+    )
+    parser.add_argument(
+        "--blocking-ui", action="store_true",
+        help="Finish each menu action before reading the next input (e.g. for scripted input)"
+    )
+    parser.add_argument("--profile", action="store_true", help="Print wall time and call counts per phase on exit")
+    parser.add_argument("--profile-output", help="Also write cProfile stats to this file (readable with pstats)")
+    return parser.parse_args()
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run the game headlessly or interactively.
+    
+    Args:
+        args: Parsed command line arguments.
+    """
+    if args.seasons is not None:
+        run_headless(args)
+        return
+    
     console.print("[bold cyan]Valorant Manager Game[/bold cyan]")
     
     while True:
         if main_menu():
-            start_game()
+            start_game(
+                args.output_mode, args.map_engine, args.blocking_ui, args.team_strength, args.rating_distribution,
+                args.progression, args.world, args.team_rating
+            )
         else:
             break
 
 
+def main() -> None:
+    """Main entry point."""
+    args = parse_args()
+    if args.profile or args.profile_output:
+        profiler.enable()
+    stats_profile = cProfile.Profile() if args.profile_output else None
+    
+    if stats_profile:
+        stats_profile.enable()
+    try:
+        run(args)
+    finally:
+        if stats_profile:
+            stats_profile.disable()
+            stats_profile.dump_stats(args.profile_output)
+        if profiler.enabled:
+            profiler.disable()
+            print()
+            print(profiler.format_report())
+            if stats_profile:
+                print(f"\ncProfile stats written to {args.profile_output}")
+
+
 if __name__ == "__main__":
     main()
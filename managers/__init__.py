@@ -2,10 +2,18 @@
 
 from .league_manager import LeagueManager
 from .game_manager import GameManager
+from .async_game_manager import AsyncGameManager
 from .schedule_manager import ScheduleManager
 from .roster_manager import RosterManager
+from .team_registry import TeamRegistry
 from .match_manager import MatchManager
 from .standings_manager import StandingsManager
+from .simulation_manager import SimulationManager
+from .projection_manager import ProjectionManager
+from .rating_manager import RatingManager
+from .progression_manager import ProgressionManager
+from .storage_manager import StorageManager
+from .save_manager import SaveManager
 
-__all__ = ["LeagueManager", "GameManager", "ScheduleManager", "RosterManager", "MatchManager", "StandingsManager"]
+__all__ = ["LeagueManager", "GameManager", "AsyncGameManager", "ScheduleManager", "RosterManager", "TeamRegistry", "MatchManager", "StandingsManager", "SimulationManager", "ProjectionManager", "RatingManager", "ProgressionManager", "StorageManager", "SaveManager"]
 
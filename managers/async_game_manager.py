@@ -0,0 +1,292 @@
+"""Manager for the asyncio-driven game loop."""
+
+import asyncio
+from typing import Callable
+from core.console import console
+from core.profiling import phase
+from models.WeekResults import WeekResults
+from .game_manager import GameManager
+
+
+class AsyncGameManager(GameManager):
+    """Runs the game loop on asyncio so simulation never blocks the menu.
+    
+    Advancing starts the simulation in the background: every league's week
+    is a separate task run in a worker thread, and its results are rendered
+    as soon as that league finishes. Meanwhile the menu stays available, so
+    the user can browse rosters, schedules and standings, queue more weeks,
+    or cancel a multi-week fast-forward. Cancelling lets the week in
+    progress finish, so every league is always on the same week.
+    
+    Every match draws from its own stream, so the results are the same as
+    the blocking GameManager's whatever order the leagues finish in.
+    
+    Menu actions that prompt for input also run in worker threads. Results
+    that finish while one of them is open are held back and rendered when
+    the user is back at the main menu.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the game manager; takes the same arguments as GameManager."""
+        super().__init__(*args, **kwargs)
+        self._simulation = None  # Background task playing weeks up to _target_week
+        self._target_week = 0
+        self._browsing = False
+        self._pending_output = []
+    
+    @property
+    def simulating(self) -> bool:
+        """True while weeks are being simulated in the background."""
+        return self._simulation is not None and not self._simulation.done()
+    
+    def run(self) -> None:
+        """Run the main game loop."""
+        asyncio.run(self.run_async())
+    
+    async def run_async(self) -> None:
+        """Run the main game loop on the current event loop."""
+        console.print(f"\n[bold]Starting Game with {self.user_team.name}[/bold]")
+        try:
+            while True:
+                self._display_menu()
+                choice = (await asyncio.to_thread(input, "> ")).strip()
+                
+                if not await self._handle_menu_choice_async(choice):
+                    break
+        finally:
+            await self.cancel_simulation()
+            self.match_manager.close()
+    
+    def _display_menu(self) -> None:
+        """Display the main menu, with the background simulation's progress."""
+        if self.simulating:
+            console.print(
+                f"\n[magenta]Simulating week {self.current_week + 1} "
+                f"(through week {self._target_week})...[/magenta]"
+            )
+        super()._display_menu()
+    
+    def _menu_options(self) -> list[tuple[str, str]]:
+        """Get the main menu entries.
+        
+        Returns:
+            List of (key, label) pairs in display order.
+        """
+        options = super()._menu_options()
+        if self.simulating:
+            options[1] = ("2", "Advance to Match (queue another week)")
+        return options[:-1] + [("10", "Fast Forward"), ("11", "Cancel Simulation"), options[-1]]
+    
+    async def _handle_menu_choice_async(self, choice: str) -> bool:
+        """Handle menu selection without blocking the event loop.
+        
+        Args:
+            choice: The user's menu selection.
+        
+        Returns:
+            False if the user wants to quit, True otherwise.
+        """
+        if choice == "2":
+            await self.advance_to_match_async()
+        elif choice == "10":
+            await self.fast_forward()
+        elif choice == "11":
+            if self.simulating:
+                console.print(f"[yellow]Stopping after week {self.current_week + 1}...[/yellow]")
+                self._simulation.cancel()
+            else:
+                console.print("[yellow]No simulation is running.[/yellow]")
+        elif choice == "0":
+            return self._handle_menu_choice(choice)
+        else:
+            await self._browse(self._handle_menu_choice, choice)
+        return True
+    
+    async def advance_to_match_async(self) -> None:
+        """Simulate the next week in the background, or queue it behind the running ones."""
+        if self.simulating:
+            self._queue_weeks(1)
+            console.print(f"[green]Queued; simulating through week {self._target_week}.[/green]")
+        elif self.is_season_over():
+            await self._browse(self._handle_season_end)
+        else:
+            self._queue_weeks(1)
+    
+    async def fast_forward(self) -> None:
+        """Ask how many weeks to simulate and start them in the background."""
+        if self.is_season_over():
+            console.print("[yellow]The regular season is over; advance to see the season summary.[/yellow]")
+            return
+        
+        first_week = self._target_week if self.simulating else self.current_week
+        remaining = self.schedule_manager.season_length - first_week
+        answer = (await asyncio.to_thread(
+            input, f"Weeks to simulate (Enter for the rest of the season, {remaining}): "
+        )).strip()
+        if not answer:
+            weeks = remaining
+        elif answer.isdigit() and int(answer) > 0:
+            weeks = int(answer)
+        else:
+            console.print("[red]Please enter a positive number of weeks.[/red]")
+            return
+        
+        self._queue_weeks(weeks)
+        console.print(f"[green]Simulating through week {self._target_week}.[/green]")
+    
+    async def cancel_simulation(self) -> None:
+        """Stop the background simulation after the week in progress and wait for it."""
+        task = self._simulation
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    
+    def _queue_weeks(self, weeks: int) -> None:
+        """Extend the background simulation, starting it if needed.
+        
+        Args:
+            weeks: Number of weeks to add; stops at the end of the regular season.
+        """
+        first_week = self._target_week if self.simulating else self.current_week
+        self._target_week = min(first_week + weeks, self.schedule_manager.season_length)
+        if not self.simulating:
+            self._simulation = asyncio.create_task(self._simulate_queued_weeks())
+            self._simulation.add_done_callback(self._on_simulation_done)
+    
+    async def _simulate_queued_weeks(self) -> None:
+        """Play weeks until the target week is reached."""
+        while self.current_week < self._target_week:
+            week = asyncio.ensure_future(self.play_week_async())
+            try:
+                await asyncio.shield(week)
+            except asyncio.CancelledError:
+                # Finish the week in progress so every league stays on the same week
+                await week
+                raise
+    
+    def _on_simulation_done(self, task: asyncio.Task) -> None:
+        """Report how the background simulation ended.
+        
+        Args:
+            task: The finished simulation task.
+        """
+        if self._simulation is task:
+            self._simulation = None
+            self._target_week = self.current_week
+        if task.cancelled():
+            message = f"[yellow]Simulation stopped after week {self.current_week}.[/yellow]"
+        elif task.exception() is not None:
+            message = f"[red]Simulation failed: {task.exception()!r}[/red]"
+        elif self.is_season_over():
+            message = "[bold green]Regular season complete! Advance to see the season summary.[/bold green]"
+        else:
+            return
+        self._emit(lambda: console.print(message))
+    
+    async def play_week_async(self) -> WeekResults:
+        """Simulate the current week with one task per league and move to the next week.
+        
+        Each league's results are rendered as soon as it finishes.
+        
+        Returns:
+            WeekResults mapping league names to their match results.
+        """
+        self.week_matches = {}
+        week = self.current_week
+        league_names = [league["name"] for league in self.leagues]
+        
+        if self.batch_simulation:
+            # One vectorized call covers every league
+            all_results = await asyncio.to_thread(
+                self.simulation_manager.simulate_week, self.schedule_manager, week, season=self.current_season,
+                match_records=self.week_matches if self.storage_manager else None
+            )
+            for league_name, results in all_results.items():
+                self._emit_league_results(league_name, results, week)
+        else:
+            finished = {}
+            for league_task in asyncio.as_completed([self._simulate_league(name) for name in league_names]):
+                league_name, results = await league_task
+                finished[league_name] = results
+                self._emit_league_results(league_name, results, week)
+            all_results = WeekResults.from_results(
+                self.registry.world, {league_name: finished[league_name] for league_name in league_names}
+            )
+        
+        # Storage connections belong to the event loop's thread
+        self._finish_week(all_results)
+        return all_results
+    
+    async def _simulate_league(self, league_name: str) -> tuple[str, list]:
+        """Simulate a league's current week in a worker thread.
+        
+        Args:
+            league_name: Name of the league.
+        
+        Returns:
+            Tuple of (league_name, results).
+        """
+        return league_name, await asyncio.to_thread(self._simulate_league_week, league_name)
+    
+    def _simulate_league_week(self, league_name: str) -> list:
+        """Simulate a league's current week, timed as its own phase.
+        
+        Args:
+            league_name: Name of the league.
+        
+        Returns:
+            The league's results, as returned by _simulate_week.
+        """
+        with phase(f"simulate_week[{league_name}]"):
+            return self._simulate_week(league_name)
+    
+    def _emit_league_results(self, league_name: str, results: list, week: int) -> None:
+        """Render a league's results now, or once the user is back at the menu.
+        
+        The renderables are built right away, so deferred output still shows
+        the records as they were after this week.
+        
+        Args:
+            league_name: Name of the league.
+            results: That league's results for the week.
+            week: Week number the results belong to (0-indexed).
+        """
+        renderables = self._league_result_renderables(league_name, results, week)
+        
+        def render() -> None:
+            for renderable in renderables:
+                console.print(renderable)
+        
+        if renderables:
+            self._emit(render)
+    
+    def _emit(self, render: Callable[[], None]) -> None:
+        """Run a render callback, deferring it while a menu action is open.
+        
+        Args:
+            render: Function that prints to the console.
+        """
+        if self._browsing:
+            self._pending_output.append(render)
+        else:
+            render()
+    
+    async def _browse(self, action: Callable, *args) -> None:
+        """Run a blocking, interactive menu action in a worker thread.
+        
+        Args:
+            action: Function to run, e.g. a view that prompts for input.
+            *args: Arguments passed to the action.
+        """
+        self._browsing = True
+        try:
+            await asyncio.to_thread(action, *args)
+        finally:
+            self._browsing = False
+            pending, self._pending_output = self._pending_output, []
+            for render in pending:
+                render()
@@ -2,67 +2,205 @@
 
 from rich.table import Table
 from core.console import console
+from core.profiling import phase, timed
+from core.rng import RNGService
 from models.Team import Team
+from models.WeekResults import WeekResults
 from .schedule_manager import ScheduleManager
 from .roster_manager import RosterManager
+from .team_registry import TeamRegistry
 from .match_manager import MatchManager
 from .standings_manager import StandingsManager
+from .simulation_manager import SimulationManager
+from .projection_manager import ProjectionManager
+from .rating_manager import RatingManager
+from .progression_manager import ProgressionManager
+from .storage_manager import StorageManager
+from .save_manager import SaveManager
 
 
 class GameManager:
     """Handles the main game loop and menu logic."""
     
-    def __init__(self, user_team: Team, leagues: list):
+    # full: every league's results; league: only the user's league;
+    # summary: one line about the user's team; silent: nothing. Results can
+    # always be rendered later with View Last Results.
+    OUTPUT_MODES = ("full", "league", "summary", "silent")
+    
+    # roster: match odds come from player ratings; elo: from the teams' Elo
+    # ratings, which follow their results
+    TEAM_STRENGTHS = ("roster", "elo")
+    
+    def __init__(
+        self,
+        user_team: Team,
+        leagues: list,
+        batch_simulation: bool = False,
+        seed: int | None = None,
+        storage_manager: StorageManager | None = None,
+        match_history_limit: int | None = None,
+        double_round_robin: bool = False,
+        registry: TeamRegistry | None = None,
+        save_manager: SaveManager | None = None,
+        output_mode: str = "full",
+        map_engine: str = "markov",
+        team_strength: str = "roster",
+        progression: list[str] | None = None
+    ):
         """Initialize the game manager.
         
         Args:
             user_team: The Team object the player is managing.
             leagues: List of all leagues (for schedule and roster access).
+            batch_simulation: Simulate each week for all leagues at once with
+                the vectorized SimulationManager instead of match by match.
+            seed: Optional root seed. Rosters, matches and rating updates all
+                draw from streams derived from it, so the same seed and mode
+                replay the same seasons. Serial and batch weeks draw from
+                different streams, so their results differ for one seed.
+                Ignored when a registry is passed; its RNG is used instead.
+            storage_manager: Optional StorageManager; when set, every week's
+                results and each season's record are written to it and the
+                in-memory match history is cleared after each week.
+            match_history_limit: If set, the MatchManager keeps only this many
+                recent matches in memory and spills older ones to disk.
+            double_round_robin: Play every opponent twice per season, home
+                and away; the season is twice as long.
+            registry: TeamRegistry shared with the LeagueManager the user team
+                was selected from. A new one is created if None.
+            save_manager: Optional SaveManager; a snapshot is written now and
+                at the start of every season, and a checkpoint after every
+                week. Use SaveManager.load to resume a saved game instead.
+            output_mode: How much is rendered after each week and at season
+                end; one of OUTPUT_MODES. Can be changed from the menu.
+            map_engine: How maps are simulated; one of MatchManager.MAP_ENGINES.
+            team_strength: What match odds are based on; one of
+                TEAM_STRENGTHS. Elo ratings are tracked for the power rankings
+                either way. The player engine always plays the rosters.
+            progression: Names of the progression models combined every
+                offseason; see ProgressionManager. Random changes if None.
         """
+        if output_mode not in self.OUTPUT_MODES:
+            raise ValueError(f"Unknown output mode: {output_mode}")
+        if team_strength not in self.TEAM_STRENGTHS:
+            raise ValueError(f"Unknown team strength: {team_strength}")
+        if team_strength == "elo" and map_engine == "players":
+            raise ValueError("The players engine plays the rosters and cannot use Elo team strength")
+        self.output_mode = output_mode
         self.leagues = leagues
-        self.schedule_manager = ScheduleManager(leagues)
-        self.roster_manager = RosterManager(leagues)
-        self.match_manager = MatchManager()
+        self.registry = registry or TeamRegistry(leagues, RNGService(seed))
+        self.rng = self.registry.rng
+        self.double_round_robin = double_round_robin
+        self.schedule_manager = ScheduleManager(leagues, double_round_robin)
+        self.roster_manager = RosterManager(leagues, self.registry)
+        self.map_engine = map_engine
+        self.team_strength = team_strength
+        self.rating_manager = RatingManager(leagues, self.registry)
+        strength_ratings = self.rating_manager if team_strength == "elo" else None
+        self.match_manager = MatchManager(
+            map_engine=map_engine, history_limit=match_history_limit, rating_manager=strength_ratings
+        )
         self.standings_manager = StandingsManager(leagues, self.roster_manager)
+        self.simulation_manager = SimulationManager(self.roster_manager, self.rng, map_engine, strength_ratings)
+        self.progression_manager = ProgressionManager(self.registry, self.rng, progression)
+        self.projection_manager = ProjectionManager(leagues, self.roster_manager, self.match_manager)
+        self.batch_simulation = batch_simulation
+        self.storage_manager = storage_manager
         
-        # Find the actual user team in the roster manager to ensure we reference the same object
-        self.user_team = None
-        for teams in self.roster_manager.teams_by_league.values():
-            for team in teams:
-                if team.name == user_team.name:
-                    self.user_team = team
-                    break
-            if self.user_team:
-                break
+        # Look the user team up in the registry to ensure we reference the same object
+        self.user_team = self.registry.get_team_by_id(user_team.id)
         
         # Fallback (shouldn't happen)
         if self.user_team is None:
             self.user_team = user_team
         
         self.current_week = 0
+        self.week_matches = {}  # (league_name, team1_name, team2_name) -> MatchRecord for the latest week
+        self.last_week_results = None  # (week, results by league) of the latest week, rendered on request
         self.current_season = 1
         self.season_history = {}  # Track records from completed seasons
+        
+        self.save_manager = save_manager
+        if self.save_manager:
+            self.save_manager.save(self)
     
     def run(self) -> None:
         """Run the main game loop."""
         console.print(f"\n[bold]Starting Game with {self.user_team.name}[/bold]")
-        while True:
-            self._display_menu()
-            choice = input("> ").strip()
-            
-            if not self._handle_menu_choice(choice):
-                break
+        try:
+            while True:
+                self._display_menu()
+                choice = input("> ").strip()
+                
+                if not self._handle_menu_choice(choice):
+                    break
+        finally:
+            self.match_manager.close()
     
     def _display_menu(self) -> None:
         """Display the main menu."""
         console.print("\n[bold]Main Menu[/bold]")
         console.print(f"[cyan]Team: {self.user_team.name}[/cyan]")
-        console.print(f"[yellow]Season {self.current_season} - Week {self.current_week + 1}/11[/yellow]")
-        console.print("[1] View Roster")
-        console.print("[2] Advance to Match")
-        console.print("[3] View Schedule")
-        console.print("[4] View Standings")
-        console.print("[0] Quit")
+        console.print(f"[yellow]Season {self.current_season} - Week {self.current_week + 1}/{self.schedule_manager.season_length}[/yellow]")
+        next_match = self._next_match_odds()
+        if next_match:
+            console.print(f"[magenta]{next_match}[/magenta]")
+        for key, label in self._menu_options():
+            console.print(f"[{key}] {label}")
+    
+    def _menu_options(self) -> list[tuple[str, str]]:
+        """Get the main menu entries.
+        
+        Returns:
+            List of (key, label) pairs in display order.
+        """
+        return [
+            ("1", "View Roster"),
+            ("2", "Advance to Match"),
+            ("3", "View Schedule"),
+            ("4", "View Standings"),
+            ("5", "View Projections"),
+            ("6", "View Last Results"),
+            ("7", f"Output Mode ({self.output_mode})"),
+            ("8", "Power Rankings"),
+            ("9", "Season History"),
+            ("0", "Quit")
+        ]
+    
+    def _next_match_odds(self) -> str | None:
+        """Describe the user team's match this week with its pre-match odds.
+        
+        Returns:
+            One line of text, or None if the user team has no match this week.
+        """
+        if self.is_season_over():
+            return None
+        league_name = self.registry.league_of_id(self.user_team.id)
+        schedule = self.schedule_manager.schedules[league_name]
+        # Smaller leagues finish before the longest one
+        if self.current_week >= len(schedule):
+            return None
+        fixture = next(
+            (
+                (team1_name, team2_name)
+                for team1_name, team2_name in schedule[self.current_week]
+                if self.user_team.name in (team1_name, team2_name)
+            ),
+            None
+        )
+        if fixture is None:
+            return None
+        
+        opponent = self.registry.get_team(fixture[1] if fixture[0] == self.user_team.name else fixture[0], league_name)
+        odds = self.match_manager.series_odds(
+            self.user_team, opponent, 3,
+            self.rng.generator("odds", self.current_season, league_name, self.current_week)
+        )
+        sweep = odds.score_probability(2, 0)
+        return (
+            f"Next match: vs {opponent.name} - {odds.team1_win_probability:.0%} to win "
+            f"({sweep:.0%} to sweep 2-0)"
+        )
     
     def _handle_menu_choice(self, choice: str) -> bool:
         """Handle menu selection.
@@ -84,6 +222,16 @@ class GameManager:
             self.view_schedule()
         elif choice == "4":
             self.view_standings()
+        elif choice == "5":
+            self.view_projections()
+        elif choice == "6":
+            self.view_last_results()
+        elif choice == "7":
+            self.select_output_mode()
+        elif choice == "8":
+            self.view_power_rankings()
+        elif choice == "9":
+            self.view_season_history()
         else:
             console.print("[red]Invalid option![/red]")
         
@@ -95,52 +243,106 @@ class GameManager:
     
     def advance_to_match(self) -> None:
         """Advance to the next week and simulate all matches."""
-        if self.current_week >= 11:
+        if self.is_season_over():
             self._handle_season_end()
             return
         
-        console.print(f"\n[bold yellow]Simulating Week {self.current_week + 1}...[/bold yellow]\n")
+        if self.output_mode != "silent":
+            console.print(f"\n[bold yellow]Simulating Week {self.current_week + 1}...[/bold yellow]\n")
         
-        # Simulate all matches in all leagues
-        all_results = {}
-        for league in self.leagues:
-            league_name = league["name"]
-            all_results[league_name] = self._simulate_week(league_name)
+        all_results = self.play_week()
         
         # Display results
-        self._display_week_results(all_results)
+        self._show_week_results(all_results, self.current_week - 1)
+    
+    def is_season_over(self) -> bool:
+        """Check whether every week of the season has been played.
+        
+        Returns:
+            True if the regular season is complete.
+        """
+        return self.current_week >= self.schedule_manager.season_length
+    
+    def play_week(self) -> WeekResults:
+        """Simulate the current week in every league and move to the next week.
+        
+        Returns:
+            WeekResults mapping league names to their match results.
+        """
+        self.week_matches = {}
+        
+        # Simulate all matches in all leagues
+        if self.batch_simulation:
+            with phase("simulate_week[batch]"):
+                all_results = self.simulation_manager.simulate_week(
+                    self.schedule_manager, self.current_week, season=self.current_season,
+                    match_records=self.week_matches if self.storage_manager else None
+                )
+        else:
+            all_results = {}
+            for league in self.leagues:
+                league_name = league["name"]
+                with phase(f"simulate_week[{league_name}]"):
+                    all_results[league_name] = self._simulate_week(league_name)
+            all_results = WeekResults.from_results(self.registry.world, all_results)
+        
+        self._finish_week(all_results)
+        return all_results
+    
+    def _finish_week(self, all_results: WeekResults) -> None:
+        """Update Elo ratings, store a simulated week's results and move to the next week.
         
+        Args:
+            all_results: The current week's results in every league.
+        """
+        self.rating_manager.record_week(all_results)
+        if self.storage_manager:
+            with phase("storage_write"):
+                self.storage_manager.record_week(self.current_season, self.current_week, all_results, self.week_matches)
+            # History now lives in the database
+            self.match_manager.match_history.clear()
+        
+        self.last_week_results = (self.current_week, all_results)
         self.current_week += 1
+        if self.save_manager:
+            with phase("save_checkpoint"):
+                self.save_manager.checkpoint(self, self.current_week - 1, all_results)
     
-    def _simulate_week(self, league_name: str) -> dict:
+    def _simulate_week(self, league_name: str) -> list:
         """Simulate all matches for a week in a league.
         
         Args:
             league_name: Name of the league.
             
         Returns:
-            Dictionary of match results for the week.
+            List of (team1_name, team1_wins, team2_wins, team2_name) results
+            in schedule order.
         """
         schedule = self.schedule_manager.schedules[league_name]
-        teams_in_league = self.roster_manager.teams_by_league[league_name]
-        
-        # Create dict for easy team lookup
-        teams_dict = {team.name: team for team in teams_in_league}
+        # Smaller leagues finish before the longest one
+        if self.current_week >= len(schedule):
+            return []
         
         week_matches = schedule[self.current_week]
-        results = {}
-        
-        for team1_name, team2_name in week_matches:
-            team1 = teams_dict[team1_name]
-            team2 = teams_dict[team2_name]
-            
-            # Simulate the match
-            match = self.match_manager.simulate_match(team1, team2, series_format=3)
+        matchups = [
+            (self.registry.get_team(team1_name, league_name), self.registry.get_team(team2_name, league_name))
+            for team1_name, team2_name in week_matches
+        ]
+        
+        # Every match draws from its own stream
+        rngs = [
+            self.rng.stream("match", self.current_season, league_name, self.current_week, match_number)
+            for match_number in range(len(matchups))
+        ]
+        records = self.match_manager.simulate_series_batch(matchups, series_format=3, rngs=rngs)
+        results = []
+        
+        for (team1_name, team2_name), (team1, team2), record in zip(week_matches, matchups, records):
+            self.week_matches[(league_name, team1_name, team2_name)] = record
             
             # Store result with series score
-            match_key = f"{team1_name}_vs_{team2_name}"
-            team1_wins, team2_wins = match.get_series_score()
-            results[match_key] = (team1_name, team1_wins, team2_wins, team2_name)
+            team1_wins, team2_wins = record.get_series_score()
+            results.append((team1_name, team1_wins, team2_wins, team2_name))
             
             # Track maps won/lost
             team1.add_map_win(team1_wins)
@@ -153,25 +355,132 @@ class GameManager:
         
         return results
     
-    def _display_week_results(self, all_results: dict) -> None:
-        """Display the results of all matches for the week.
+    def _show_week_results(self, all_results: dict, week: int) -> None:
+        """Render a week's results according to the output mode.
         
         Args:
             all_results: Dictionary of results by league.
+            week: Week number the results belong to (0-indexed).
         """
         for league_name, results in all_results.items():
-            table = Table(title=f"{league_name} - Week {self.current_week + 1} Results")
-            table.add_column("Match", style="cyan")
-            table.add_column("Result", style="green")
-            
-            for idx, (match_key, result) in enumerate(results.items(), 1):
-                team1_name, team1_wins, team2_wins, team2_name = result
-                result_str = f"{team1_name} {team1_wins} - {team2_wins} {team2_name}"
-                table.add_row(str(idx), result_str)
+            self._show_league_results(league_name, results, week)
+    
+    def _show_league_results(self, league_name: str, results: list, week: int) -> None:
+        """Render one league's results for a week according to the output mode.
+        
+        Only full mode renders other leagues; league and summary mode render
+        the user's league.
+        
+        Args:
+            league_name: Name of the league.
+            results: That league's results for the week.
+            week: Week number the results belong to (0-indexed).
+        """
+        for renderable in self._league_result_renderables(league_name, results, week):
+            console.print(renderable)
+    
+    def _league_result_renderables(self, league_name: str, results: list, week: int) -> list:
+        """Build what _show_league_results prints, from the current records.
+        
+        Args:
+            league_name: Name of the league.
+            results: That league's results for the week.
+            week: Week number the results belong to (0-indexed).
+        
+        Returns:
+            List of Rich renderables, empty if the output mode hides the league.
+        """
+        if self.output_mode == "full":
+            return [self._week_results_table(league_name, results, week), ""]
+        if league_name != self.registry.league_of_id(self.user_team.id):
+            return []
+        if self.output_mode == "league":
+            return [self._week_results_table(league_name, results, week), ""]
+        if self.output_mode == "summary":
+            return [self._week_summary(week)]
+        return []
+    
+    def _week_summary(self, week: int) -> str:
+        """Describe the user team's week in one line.
+        
+        Args:
+            week: Week number the results belong to (0-indexed).
             
-            console.print(table)
+        Returns:
+            Summary line with the user's result and record.
+        """
+        name = self.user_team.name
+        record = f"({self.user_team.wins}-{self.user_team.losses})"
+        league_name = self.registry.league_of_id(self.user_team.id)
+        result = None
+        if week < len(self.schedule_manager.schedules[league_name]):
+            result = self.schedule_manager.results[league_name].get(week, name)
+        if result is None:
+            return f"Week {week + 1}: {name} had a bye {record}"
+        
+        team1_name, team1_wins, team2_wins, team2_name = result
+        user_wins, opponent_wins, opponent = (
+            (team1_wins, team2_wins, team2_name) if name == team1_name
+            else (team2_wins, team1_wins, team1_name)
+        )
+        outcome = "[green]W[/green]" if user_wins > opponent_wins else "[red]L[/red]"
+        return f"Week {week + 1}: {outcome} {name} {user_wins}-{opponent_wins} {opponent} {record}"
+    
+    def view_last_results(self) -> None:
+        """Render every league's results for the latest week, whatever the output mode."""
+        if self.last_week_results is None:
+            console.print("[yellow]No matches have been played yet.[/yellow]")
+            return
+        week, all_results = self.last_week_results
+        console.print()
+        self._display_week_results(all_results, week)
+    
+    def select_output_mode(self) -> None:
+        """Let the user pick how much is rendered after each week."""
+        console.print("\n[bold]Output Mode[/bold]")
+        for idx, mode in enumerate(self.OUTPUT_MODES, 1):
+            marker = " (current)" if mode == self.output_mode else ""
+            console.print(f"[{idx}] {mode.capitalize()}{marker}")
+        
+        choice = input("> ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(self.OUTPUT_MODES):
+            self.output_mode = self.OUTPUT_MODES[int(choice) - 1]
+            console.print(f"[green]Output mode set to {self.output_mode}.[/green]")
+        else:
+            console.print("[red]Invalid option![/red]")
+    
+    def _display_week_results(self, all_results: dict, week: int) -> None:
+        """Display the results of all matches for the week.
+        
+        Args:
+            all_results: Dictionary of results by league.
+            week: Week number the results belong to (0-indexed).
+        """
+        for league_name, results in all_results.items():
+            console.print(self._week_results_table(league_name, results, week))
             console.print()
     
+    def _week_results_table(self, league_name: str, results: list, week: int) -> Table:
+        """Build the results table of one league's week.
+        
+        Args:
+            league_name: Name of the league.
+            results: That league's results for the week.
+            week: Week number the results belong to (0-indexed).
+        
+        Returns:
+            Rich table with one row per match.
+        """
+        table = Table(title=f"{league_name} - Week {week + 1} Results")
+        table.add_column("Match", style="cyan")
+        table.add_column("Result", style="green")
+        
+        for idx, (team1_name, team1_wins, team2_wins, team2_name) in enumerate(results, 1):
+            result_str = f"{team1_name} {team1_wins} - {team2_wins} {team2_name}"
+            table.add_row(str(idx), result_str)
+        
+        return table
+    
     def view_schedule(self) -> None:
         """Display league schedules."""
         self.schedule_manager.view_schedule()
@@ -180,14 +489,39 @@ class GameManager:
         """Display league standings."""
         self.standings_manager.view_standings()
     
+    def view_projections(self) -> None:
+        """Display projected final standings."""
+        self.projection_manager.view_projections(self.schedule_manager, self.current_week)
+    
+    def view_power_rankings(self) -> None:
+        """Display teams ranked by Elo rating."""
+        self.rating_manager.view_power_rankings()
+    
+    def view_season_history(self) -> None:
+        """Render the career record and the latest offseason's rating changes, whatever the output mode."""
+        if not self.season_history:
+            console.print("[yellow]No season has been completed yet.[/yellow]")
+            return
+        self._display_season_history()
+        # Nothing to show after resuming a save, until the next offseason
+        if self.progression_manager.get_team_changes(self.user_team):
+            console.print()
+            self._display_player_rating_changes()
+    
     def _handle_season_end(self) -> None:
         """Handle the end of season - show summary and offer to continue."""
-        console.print("\n[bold cyan]SEASON {} COMPLETE![/bold cyan]\n".format(self.current_season))
-        
-        # Display final standings for user's league
         user_league = self._find_user_league()
-        if user_league:
-            self._display_season_summary(user_league)
+        if self.output_mode in ("full", "league"):
+            console.print("\n[bold cyan]SEASON {} COMPLETE![/bold cyan]\n".format(self.current_season))
+            
+            # Display final standings for user's league
+            if user_league:
+                self._display_season_summary(user_league)
+        elif self.output_mode == "summary" and user_league:
+            console.print(
+                f"\n[bold cyan]Season {self.current_season} complete:[/bold cyan] {self.user_team.name} "
+                f"finished #{self._get_user_team_rank(user_league)} ({self.user_team.wins}-{self.user_team.losses})"
+            )
         
         # Ask if user wants to continue
         while True:
@@ -207,11 +541,8 @@ class GameManager:
         Returns:
             League dictionary or None if not found.
         """
-        for league in self.leagues:
-            for team_data in league["teams"]:
-                if team_data["name"] == self.user_team.name:
-                    return league
-        return None
+        league_name = self.registry.league_of_id(self.user_team.id)
+        return next((league for league in self.leagues if league["name"] == league_name), None)
     
     def _display_season_summary(self, league: dict) -> None:
         """Display season summary for user's league.
@@ -221,11 +552,9 @@ class GameManager:
         """
         console.print(f"\n[bold]{league['name']} - Final Standings[/bold]\n")
         
-        teams = self.roster_manager.teams_by_league[league["name"]]
-        sorted_teams = self.standings_manager._sort_standings(teams)
-        
         # Show user's team rank and top 5
-        user_rank = next((i + 1 for i, t in enumerate(sorted_teams) if t.name == self.user_team.name), None)
+        user_rank = self.standings_manager.get_rank(league["name"], self.user_team)
+        top_teams = self.standings_manager.get_top_teams(league["name"], 5)
         
         table = Table(title="Top 5 Teams")
         table.add_column("Rank", style="cyan")
@@ -233,7 +562,7 @@ class GameManager:
         table.add_column("Record", style="yellow")
         table.add_column("Maps", style="blue")
         
-        for idx, team in enumerate(sorted_teams[:5], 1):
+        for idx, team in enumerate(top_teams, 1):
             matches_record = f"{team.wins}-{team.losses}"
             maps_record = f"{team.maps_won}-{team.maps_lost}"
             table.add_row(str(idx), team.name, matches_record, maps_record)
@@ -244,10 +573,49 @@ class GameManager:
             console.print(f"\n[cyan]Your team ({self.user_team.name}) finished: [bold]#{user_rank}[/bold][/cyan]")
     
     def _advance_to_next_season(self) -> None:
-        """Advance to the next season."""
-        console.print(f"\n[bold yellow]Advancing to Season {self.current_season + 1}...[/bold yellow]\n")
+        """Advance to the next season.
+        
+        The offseason tables are only rendered (and waited on) in the full and
+        league output modes; the other modes can still view them from the
+        Season History menu.
+        """
+        render = self.output_mode in ("full", "league")
+        if render:
+            console.print(f"\n[bold yellow]Advancing to Season {self.current_season + 1}...[/bold yellow]\n")
+        
+        self._record_season_history()
+        
+        self.progression_manager.progress(self.current_season)
+        if render:
+            self._display_player_rating_changes()
+            input("\nPress Enter to continue...")
+        
+        self._start_new_season()
+        
+        if render and self.season_history:
+            # Display season history
+            self._display_season_history()
+            input("\nPress Enter to continue...")
+        
+        if self.output_mode != "silent":
+            console.print(f"\n[green]Welcome to Season {self.current_season}![/green]")
+            console.print("[yellow]New schedules have been generated.[/yellow]\n")
+        
+        if render:
+            input("Press Enter to continue...")
+    
+    def end_season(self) -> None:
+        """Advance to the next season without any prompts or output.
         
-        # Save current season record to history
+        Applies the same offseason steps as _advance_to_next_season.
+        """
+        self._record_season_history()
+        self.progression_manager.progress(self.current_season)
+        self._start_new_season()
+    
+    @timed("offseason[history]")
+    def _record_season_history(self) -> None:
+        """Save the user team's record for the current season to history."""
         user_league = self._find_user_league()
         if user_league:
             teams = self.roster_manager.teams_by_league[user_league["name"]]
@@ -260,32 +628,29 @@ class GameManager:
                     "maps_lost": user_team_data.maps_lost,
                     "rank": self._get_user_team_rank(user_league)
                 }
-        
-        # Display player rating changes before and after
-        self._display_player_rating_changes()
-        
-        # Update player ratings
-        self._update_all_player_ratings()
-        
+                if self.storage_manager:
+                    self.storage_manager.record_season(
+                        self.current_season, self.user_team.name, self.season_history[self.current_season]
+                    )
+    
+    @timed("offseason[new_season]")
+    def _start_new_season(self) -> None:
+        """Reset team records and Elo carry-over, regenerate schedules and move to the next season."""
         # Reset all team records
-        for teams in self.roster_manager.teams_by_league.values():
-            for team in teams:
-                team.reset_record()
+        self.registry.reset_records()
+        
+        # Pull Elo ratings back toward the offseason rosters
+        self.rating_manager.start_new_season()
         
         # Regenerate schedule
-        self.schedule_manager = ScheduleManager(self.leagues)
+        self.schedule_manager = ScheduleManager(self.leagues, self.double_round_robin)
         
         # Increment season and reset week
         self.current_season += 1
         self.current_week = 0
         
-        # Display season history
-        self._display_season_history()
-        
-        console.print(f"\n[green]Welcome to Season {self.current_season}![/green]")
-        console.print("[yellow]New schedules have been generated.[/yellow]\n")
-        
-        input("Press Enter to continue...")
+        if self.save_manager:
+            self.save_manager.save(self)
     
     def _get_user_team_rank(self, league: dict) -> int:
         """Get the user team's rank in their league.
@@ -294,17 +659,12 @@ class GameManager:
             league: The league dictionary.
             
         Returns:
-            Rank number (1-12).
+            Rank number (1 to the number of teams in the league).
         """
-        teams = self.roster_manager.teams_by_league[league["name"]]
-        sorted_teams = self.standings_manager._sort_standings(teams)
-        for rank, team in enumerate(sorted_teams, 1):
-            if team.name == self.user_team.name:
-                return rank
-        return 12  # Default to last if not found
+        return self.standings_manager.get_rank(league["name"], self.user_team)
     
     def _display_player_rating_changes(self) -> None:
-        """Display player rating changes before and after season update."""
+        """Display the user team's rating changes from the latest offseason."""
         console.print("[bold]Player Rating Changes:[/bold]\n")
         
         table = Table(title=f"{self.user_team.name} - Offseason Updates")
@@ -314,30 +674,21 @@ class GameManager:
         table.add_column("New Rating", style="green")
         table.add_column("Change", style="magenta")
         
-        # Store old ratings
-        old_ratings = [(p.first_name, p.last_name, p.role, p.rating) for p in self.user_team.players]
-        
-        # Update ratings
-        self._update_all_player_ratings()
-        
         # Display changes
-        for idx, player in enumerate(self.user_team.players):
-            old_first, old_last, role, old_rating = old_ratings[idx]
-            new_rating = player.rating
+        for player, old_rating, new_rating in self.progression_manager.get_team_changes(self.user_team):
             change = new_rating - old_rating
             change_str = f"{change:+d}" if change != 0 else "0"
             change_color = "green" if change > 0 else "red" if change < 0 else "yellow"
             
             table.add_row(
                 f"{player.first_name} {player.last_name}",
-                role.capitalize(),
+                player.role.capitalize(),
                 str(old_rating),
                 str(new_rating),
                 f"[{change_color}]{change_str}[/{change_color}]"
             )
         
         console.print(table)
-        input("\nPress Enter to continue...")
     
     def _display_season_history(self) -> None:
         """Display the user team's season history."""
@@ -386,17 +737,3 @@ class GameManager:
         )
         
         console.print(table)
-        input("\nPress Enter to continue...")
-    
-    def _update_all_player_ratings(self) -> None:
-        """Update all player ratings randomly (change by 0-5 points)."""
-        import random
-        
-        for teams in self.roster_manager.teams_by_league.values():
-            for team in teams:
-                for player in team.players:
-                    # Random change from -5 to +5
-                    change = random.randint(-5, 5)
-                    new_rating = max(1, min(100, player.rating + change))  # Clamp between 1-100
-                    player.rating = new_rating
-
@@ -1,28 +1,51 @@
 """Manager for league and team selection."""
 
-import json
 from rich.table import Table
 from core.console import console
+from core.profiling import timed
+from core.rng import RNGService
+from models.RosterGenerator import RATING_DISTRIBUTIONS, RosterGenerator
 from models.Team import Team
+from models.WorldIndex import WorldIndex
+from .team_registry import TeamRegistry
 
 
 class LeagueManager:
     """Handles loading and selecting leagues and teams."""
     
-    def __init__(self, data_path: str = "data/leagues_and_teams.json"):
+    def __init__(
+        self,
+        data_path: str = "data/leagues_and_teams.json",
+        seed: int | None = None,
+        rating_distribution: str = "uniform",
+        team_rating: str = "mean"
+    ):
         """Initialize the league manager.
         
         Args:
-            data_path: Path to the JSON file containing leagues and teams.
+            data_path: Path to the JSON file containing leagues and teams, or
+                to a JSON Lines (.jsonl) file with one league object per line.
+            seed: Optional root seed for the shared team registry's rosters.
+            rating_distribution: How player ratings are drawn; a key of
+                models.RosterGenerator.RATING_DISTRIBUTIONS.
+            team_rating: How team strength is computed from a roster; a key
+                of models.Team.TEAM_RATINGS.
         """
+        if rating_distribution not in RATING_DISTRIBUTIONS:
+            raise ValueError(f"Unknown rating distribution: {rating_distribution}")
         self.data_path = data_path
         self.leagues = self._load_leagues()
+        roster_generator = RosterGenerator(rating_distribution=RATING_DISTRIBUTIONS[rating_distribution])
+        self.registry = TeamRegistry(self.leagues, RNGService(seed), roster_generator, team_rating)
     
-    def _load_leagues(self) -> list:
-        """Load all leagues from the JSON file."""
-        with open(self.data_path, "r") as f:
-            data = json.load(f)
-        return data["leagues"]
+    @timed("world_load")
+    def _load_leagues(self) -> WorldIndex:
+        """Index the names of all leagues and teams in the data file.
+        
+        Leagues are read like their JSON dictionaries; team lists and
+        rosters are only built when a league is first used.
+        """
+        return WorldIndex.load(self.data_path)
     
     def select_region(self) -> dict:
         """Display available regions and let user select one.
@@ -69,12 +92,9 @@ class LeagueManager:
         table.add_column("Number", style="cyan")
         table.add_column("Team Name", style="magenta")
         
-        teams = []
-        for idx, team_data in enumerate(league["teams"], 1):
-            team_model = Team(name=team_data["name"])
-            team_model.build_roster()
-            teams.append(team_model)
-            table.add_row(str(idx), team_data["name"])
+        team_names = [team_data["name"] for team_data in league["teams"]]
+        for idx, team_name in enumerate(team_names, 1):
+            table.add_row(str(idx), team_name)
         
         console.print(table)
         
@@ -82,12 +102,22 @@ class LeagueManager:
             try:
                 choice = input("\nEnter team number: ").strip()
                 team_idx = int(choice) - 1
-                if 0 <= team_idx < len(teams):
-                    selected_team = teams[team_idx]
+                if 0 <= team_idx < len(team_names):
+                    selected_team = self.registry.get_team(team_names[team_idx], league["name"])
                     console.print(f"[green]You selected {selected_team.name}![/green]")
                     return selected_team
                 else:
                     console.print("[red]Invalid team number. Please try again.[/red]")
             except ValueError:
                 console.print("[red]Please enter a valid number.[/red]")
-
+    
+    def find_team(self, team_name: str) -> Team | None:
+        """Find a team by name in any league without prompting.
+        
+        Args:
+            team_name: Name of the team (case-insensitive).
+            
+        Returns:
+            The Team object with roster initialized, or None if not found.
+        """
+        return self.registry.get_team(team_name)
@@ -1,8 +1,20 @@
 """Manager for simulating and tracking matches."""
 
+import json
+import os
 import random
+import tempfile
+import threading
+from collections import deque
+from typing import Iterator
+import numpy as np
+from core.map_odds import get_map_distribution
+from core.profiling import timed
+from core.round_engine import matchup_arrays, simulate_maps
+from core.series_odds import SeriesOdds, get_rating_series_odds, get_series_odds, round_win_chance
 from models.Team import Team
-from models.Match import Match, MapResult
+from models.Match import Match, MapResult, MatchRecord
+from .rating_manager import RatingManager
 
 
 class MatchManager:
@@ -19,114 +31,397 @@ class MatchManager:
         "Pearl"
     ]
     
-    def __init__(self):
-        """Initialize the match manager."""
-        self.match_history = []
+    MAP_ENGINES = ("markov", "rounds", "players")
     
-    def simulate_match(self, team1: Team, team2: Team, series_format: int = 3) -> Match:
+    # Maps simulated per matchup when estimating map-win chances with the
+    # player engine
+    MAP_WIN_SAMPLES = 256
+    
+    def __init__(
+        self,
+        map_engine: str = "markov",
+        history_limit: int | None = None,
+        spill_path: str | None = None,
+        rating_manager: RatingManager | None = None
+    ):
+        """Initialize the match manager.
+        
+        Args:
+            map_engine: How maps are simulated. "markov" samples the final score
+                from the exact score distribution in a single draw; "rounds"
+                plays every round out individually; "players" plays rounds as
+                duels between individual players with roles and an economy
+                (see core.round_engine).
+            history_limit: If set, keep only this many recent matches in memory
+                and append older ones to a file on disk. If None, every match
+                record is kept in memory.
+            spill_path: JSON Lines file older matches are appended to when
+                history_limit is set. Defaults to a temporary file that close()
+                removes.
+            rating_manager: Optional RatingManager; when set, round-win
+                chances come from the teams' Elo ratings instead of their
+                rosters. The player engine always plays the rosters.
+        """
+        if map_engine not in self.MAP_ENGINES:
+            raise ValueError(f"Unknown map engine: {map_engine}")
+        self.map_engine = map_engine
+        self.rating_manager = rating_manager
+        self.history_limit = history_limit
+        self._history_lock = threading.Lock()  # Leagues may be simulated from several threads
+        
+        self.spill_path = None
+        self._spill_file = None
+        self._owns_spill_file = False
+        if history_limit is None:
+            self.match_history = []
+        else:
+            self.match_history = deque()
+            if spill_path is None:
+                fd, spill_path = tempfile.mkstemp(prefix="match_history_", suffix=".jsonl")
+                os.close(fd)
+                self._owns_spill_file = True
+            self.spill_path = spill_path
+    
+    def simulate_match(
+        self,
+        team1: Team,
+        team2: Team,
+        series_format: int = 3,
+        rng: random.Random | None = None
+    ) -> Match:
         """Simulate a complete match between two teams.
         
         Args:
             team1: First team.
             team2: Second team.
             series_format: Number of maps (3 or 5).
+            rng: Random stream for the match; defaults to the random module.
             
         Returns:
             Completed Match object with all results.
         """
-        match = Match(team1=team1, team2=team2, series_format=series_format)
+        return self.simulate_series(team1, team2, series_format, rng).to_match(team1, team2)
+    
+    def simulate_series(
+        self,
+        team1: Team,
+        team2: Team,
+        series_format: int = 3,
+        rng: random.Random | None = None
+    ) -> MatchRecord:
+        """Simulate a complete match and return it as a compact record.
+        
+        This is the bulk simulation path: no pydantic models are built, and
+        teams are referenced by id. Team records are updated the same way as
+        in simulate_match.
+        
+        Args:
+            team1: First team.
+            team2: Second team.
+            series_format: Number of maps (3 or 5).
+            rng: Random stream for the match; defaults to the random module.
+            
+        Returns:
+            Completed MatchRecord.
+        """
+        rng = rng or random
+        if self.map_engine == "players":
+            return self.simulate_series_batch([(team1, team2)], series_format, [rng])[0]
+        
+        record = MatchRecord(team1.id, team2.id, series_format)
         
         # Select random maps for the series
-        selected_maps = random.sample(self.VALORANT_MAPS, series_format)
-        maps_to_win = (series_format // 2) + 1
+        selected_maps = rng.sample(self.VALORANT_MAPS, series_format)
+        team1_win_chance = self._round_win_chance(team1, team2)
         
         for map_name in selected_maps:
-            if match.completed:
+            if record.completed:
                 break
             
-            # Simulate map
-            map_result = self._simulate_map(team1, team2, map_name)
-            match.add_map_result(map_result)
+            team1_score, team2_score = self._simulate_map_score(team1_win_chance, rng)
+            record.add_map(map_name, team1_score, team2_score)
+        
+        self._finish_series(team1, team2, record)
+        return record
+    
+    def simulate_series_batch(
+        self,
+        matchups: list[tuple[Team, Team]],
+        series_format: int = 3,
+        rngs: list[random.Random] | None = None
+    ) -> list[MatchRecord]:
+        """Simulate several matches, e.g. a league's week.
+        
+        With the player engine every map slot of every match is played in a
+        single vectorized call, and maps after a series is decided are
+        discarded; the other engines simulate the matches one by one.
+        
+        Args:
+            matchups: List of (team1, team2) pairs.
+            series_format: Number of maps (3 or 5).
+            rngs: Random stream per match; defaults to the random module.
+        
+        Returns:
+            Completed MatchRecord per matchup, in order.
+        """
+        rngs = rngs or [random] * len(matchups)
+        if self.map_engine != "players":
+            return [
+                self.simulate_series(team1, team2, series_format, rng)
+                for (team1, team2), rng in zip(matchups, rngs)
+            ]
+        
+        selected_maps = [rng.sample(self.VALORANT_MAPS, series_format) for rng in rngs]
+        generator = np.random.default_rng([rng.getrandbits(64) for rng in rngs])
+        team1_scores, team2_scores = self._play_player_maps(matchups, series_format, generator)
+        
+        records = []
+        for idx, ((team1, team2), map_names) in enumerate(zip(matchups, selected_maps)):
+            record = MatchRecord(team1.id, team2.id, series_format)
+            start = idx * series_format
+            for map_name, team1_score, team2_score in zip(
+                map_names, team1_scores[start:start + series_format], team2_scores[start:start + series_format]
+            ):
+                record.add_map(map_name, team1_score, team2_score)
+                if record.completed:
+                    break
+            
+            self._finish_series(team1, team2, record)
+            records.append(record)
+        return records
+    
+    def _finish_series(self, team1: Team, team2: Team, record: MatchRecord) -> None:
+        """Update the team records for a finished series and add it to the history.
         
-        # Update team records
-        if match.winner == team1.name:
+        Args:
+            team1: First team.
+            team2: Second team.
+            record: The completed match record.
+        """
+        if record.team1_map_wins > record.team2_map_wins:
             team1.add_win()
             team2.add_loss()
         else:
             team2.add_win()
             team1.add_loss()
         
-        self.match_history.append(match)
-        return match
+        self._add_to_history(record)
     
-    def _simulate_map(self, team1: Team, team2: Team, map_name: str) -> MapResult:
+    def _add_to_history(self, record: MatchRecord) -> None:
+        """Add a finished match to the history, spilling the oldest to disk if needed.
+        
+        Args:
+            record: The completed match record.
+        """
+        with self._history_lock:
+            self.match_history.append(record)
+            if self.history_limit is not None and len(self.match_history) > self.history_limit:
+                if self._spill_file is None:
+                    self._spill_file = open(self.spill_path, "a")
+                self._spill_file.write(json.dumps(self.match_history.popleft().to_dict()) + "\n")
+    
+    def _simulate_map(self, team1: Team, team2: Team, map_name: str, rng: random.Random | None = None) -> MapResult:
         """Simulate a single map to completion (13 wins, or 2 rounds ahead after 24).
         
         Args:
             team1: First team.
             team2: Second team.
             map_name: Name of the map being played.
+            rng: Random stream for the map; defaults to the random module.
             
         Returns:
             MapResult with final score and winner.
         """
-        team1_score = 0
-        team2_score = 0
+        rng = rng or random
+        if self.map_engine == "players":
+            generator = np.random.default_rng(rng.getrandbits(64))
+            team1_scores, team2_scores = self._play_player_maps([(team1, team2)], 1, generator)
+            team1_score, team2_score = team1_scores[0], team2_scores[0]
+        else:
+            team1_score, team2_score = self._simulate_map_score(self._round_win_chance(team1, team2), rng)
+        return MapResult(
+            map_name=map_name,
+            team1_score=team1_score,
+            team2_score=team2_score,
+            winner=team1.name if team1_score > team2_score else team2.name
+        )
+    
+    @timed("simulate_map")
+    def _simulate_map_score(self, team1_win_chance: float, rng: random.Random) -> tuple[int, int]:
+        """Simulate the final score of a map with the configured engine.
         
-        team1_rating = team1.get_team_rating()
-        team2_rating = team2.get_team_rating()
+        Args:
+            team1_win_chance: Probability that team1 wins any single round.
+            rng: Random stream (or the random module) to draw from.
+            
+        Returns:
+            Tuple of (team1_score, team2_score).
+        """
+        if self.map_engine == "markov":
+            return get_map_distribution(team1_win_chance).sample(rng.random())
+        return self._play_rounds(team1_win_chance, rng)
+    
+    @timed("simulate_map[players]")
+    def _play_player_maps(
+        self,
+        matchups: list[tuple[Team, Team]],
+        maps_per_matchup: int,
+        generator: np.random.Generator
+    ) -> tuple[list[int], list[int]]:
+        """Play maps with the player engine.
+        
+        Args:
+            matchups: List of (team1, team2) pairs.
+            maps_per_matchup: Number of maps to play per matchup.
+            generator: NumPy generator to draw from.
+        
+        Returns:
+            Tuple of (team1_scores, team2_scores) lists, maps_per_matchup
+            consecutive entries per matchup.
+        """
+        ratings, roles = matchup_arrays(
+            [(team1.players, team2.players) for team1, team2 in matchups], maps_per_matchup
+        )
+        team1_scores, team2_scores = simulate_maps(ratings, roles, generator)
+        return team1_scores.tolist(), team2_scores.tolist()
+    
+    def map_win_probabilities(
+        self,
+        matchups: list[tuple[Team, Team]],
+        generator: np.random.Generator | None = None
+    ) -> np.ndarray:
+        """Get the probability that team1 wins a map, for each matchup.
+        
+        The Markov and round engines share an exact closed form. The player
+        engine has none, so MAP_WIN_SAMPLES maps per matchup are simulated in
+        one batch and the win rate is used.
         
-        # Normalize ratings to win probabilities
-        total_rating = team1_rating + team2_rating
-        team1_win_chance = team1_rating / total_rating if total_rating > 0 else 0.5
+        Args:
+            matchups: List of (team1, team2) pairs.
+            generator: NumPy generator for the player engine's samples;
+                freshly seeded if None.
+        
+        Returns:
+            Array of map-win probabilities for team1, one per matchup.
+        """
+        if self.map_engine != "players":
+            return np.array([
+                get_map_distribution(self._round_win_chance(team1, team2)).team1_win_probability
+                for team1, team2 in matchups
+            ])
+        if not matchups:
+            return np.zeros(0)
+        
+        ratings, roles = matchup_arrays(
+            [(team1.players, team2.players) for team1, team2 in matchups], self.MAP_WIN_SAMPLES
+        )
+        team1_scores, team2_scores = simulate_maps(ratings, roles, generator or np.random.default_rng())
+        return (team1_scores > team2_scores).reshape(len(matchups), -1).mean(axis=1)
+    
+    def series_odds(
+        self,
+        team1: Team,
+        team2: Team,
+        series_format: int = 3,
+        generator: np.random.Generator | None = None
+    ) -> SeriesOdds:
+        """Get the exact outcome probabilities of a series without simulating it.
+        
+        Odds for roster strength are cached by team rating pair, and odds
+        for Elo strength by map-win probability. The player engine's
+        map-win probability is estimated as in map_win_probabilities.
+        
+        Args:
+            team1: First team.
+            team2: Second team.
+            series_format: Number of maps (3 or 5).
+            generator: NumPy generator for the player engine's samples;
+                freshly seeded if None.
+        
+        Returns:
+            SeriesOdds for team1.
+        """
+        if self.map_engine == "players":
+            return get_series_odds(float(self.map_win_probabilities([(team1, team2)], generator)[0]), series_format)
+        if self.rating_manager is not None:
+            return get_series_odds(
+                get_map_distribution(self._round_win_chance(team1, team2)).team1_win_probability, series_format
+            )
+        return get_rating_series_odds(team1.get_team_rating(), team2.get_team_rating(), series_format)
+    
+    def _round_win_chance(self, team1: Team, team2: Team) -> float:
+        """Get the probability that team1 wins any single round against team2.
+        
+        Args:
+            team1: First team.
+            team2: Second team.
+            
+        Returns:
+            Round-win probability for team1.
+        """
+        if self.rating_manager is not None:
+            return self.rating_manager.round_win_chance(team1, team2)
+        
+        return round_win_chance(team1.get_team_rating(), team2.get_team_rating())
+    
+    def _play_rounds(self, team1_win_chance: float, rng: random.Random) -> tuple[int, int]:
+        """Play a map out round by round.
+        
+        Args:
+            team1_win_chance: Probability that team1 wins any single round.
+            rng: Random stream (or the random module) to draw from.
+            
+        Returns:
+            Tuple of (team1_score, team2_score).
+        """
+        team1_score = 0
+        team2_score = 0
         
         # Play rounds until a team reaches 13 or wins by 2 after 24
         while True:
             # Determine round winner (higher rated team has better chance)
-            if random.random() < team1_win_chance:
+            if rng.random() < team1_win_chance:
                 team1_score += 1
             else:
                 team2_score += 1
             
             # Check win conditions
-            if team1_score >= 13:
-                return MapResult(
-                    map_name=map_name,
-                    team1_score=team1_score,
-                    team2_score=team2_score,
-                    winner=team1.name
-                )
-            elif team2_score >= 13:
-                return MapResult(
-                    map_name=map_name,
-                    team1_score=team1_score,
-                    team2_score=team2_score,
-                    winner=team2.name
-                )
+            if team1_score >= 13 or team2_score >= 13:
+                return team1_score, team2_score
             
             # Check overtime condition (both at 12)
             if team1_score >= 12 and team2_score >= 12:
                 # Sudden death: first to 2 rounds ahead
-                min_score = min(team1_score, team2_score)
                 while abs(team1_score - team2_score) < 2:
-                    if random.random() < team1_win_chance:
+                    if rng.random() < team1_win_chance:
                         team1_score += 1
                     else:
                         team2_score += 1
-                
-                # Return final result
-                return MapResult(
-                    map_name=map_name,
-                    team1_score=team1_score,
-                    team2_score=team2_score,
-                    winner=team1.name if team1_score > team2_score else team2.name
-                )
-    
-    def get_match_history(self) -> list:
-        """Get all simulated matches.
+                return team1_score, team2_score
+    
+    def get_match_history(self) -> Iterator:
+        """Iterate over all simulated matches, oldest first.
         
-        Returns:
-            List of Match objects.
+        With a history limit, matches spilled to disk are read back first,
+        followed by the ones still in memory.
+        
+        Yields:
+            MatchRecord objects.
         """
-        return self.match_history
+        if self._spill_file is not None:
+            self._spill_file.flush()
+        if self.spill_path is not None and os.path.exists(self.spill_path):
+            with open(self.spill_path) as f:
+                for line in f:
+                    yield MatchRecord.from_dict(json.loads(line))
+        yield from list(self.match_history)
+    
+    def close(self) -> None:
+        """Close the spill file, deleting it if it was a temporary file."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        if self._owns_spill_file and os.path.exists(self.spill_path):
+            os.remove(self.spill_path)
+            self._owns_spill_file = False
 
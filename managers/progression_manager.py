@@ -0,0 +1,192 @@
+"""Manager for offseason player progression."""
+
+from typing import Callable
+import numpy as np
+from core.profiling import timed
+from core.rng import RNGService
+from models.Player import Player, ROLES
+from models.Team import Team
+from .team_registry import TeamRegistry
+
+# A progression model maps every player's state to a rating change, for the
+# whole population at once: model(ratings, roles, ages, generator) -> changes.
+# Ratings and changes are floats, roles are indices into ROLES and ages are in
+# years. The changes of several models are added up and then rounded.
+ProgressionModel = Callable[[np.ndarray, np.ndarray, np.ndarray, np.random.Generator], np.ndarray]
+
+# Mean and spread of the yearly rating change by role: roles that rely on
+# mechanics develop faster but less predictably than the supporting roles.
+ROLE_GROWTH = {
+    "duelist": (0.5, 3.0),
+    "initiator": (0.5, 2.0),
+    "controller": (0.3, 1.5),
+    "flex": (0.3, 2.5),
+    "sentinel": (0.2, 1.5)
+}
+
+
+def random_walk(
+    ratings: np.ndarray,
+    roles: np.ndarray,
+    ages: np.ndarray,
+    generator: np.random.Generator
+) -> np.ndarray:
+    """Move every rating by a uniform whole number of points from -5 to +5.
+    
+    Args:
+        ratings: Current ratings.
+        roles: Role indices.
+        ages: Ages in years.
+        generator: NumPy generator to draw from.
+    
+    Returns:
+        Rating changes.
+    """
+    return generator.integers(-5, 6, size=len(ratings)).astype(np.float64)
+
+
+def regression_to_mean(mean: float = 50.0, rate: float = 0.1) -> ProgressionModel:
+    """Build a model that pulls ratings toward a league-wide mean.
+    
+    Args:
+        mean: Rating players regress toward.
+        rate: Fraction of the distance to the mean closed each offseason.
+    
+    Returns:
+        Progression model.
+    """
+    def model(ratings: np.ndarray, roles: np.ndarray, ages: np.ndarray, generator: np.random.Generator) -> np.ndarray:
+        return (mean - ratings) * rate
+    return model
+
+
+def role_growth(growth: dict | None = None) -> ProgressionModel:
+    """Build a model where the expected change and its spread depend on the role.
+    
+    Args:
+        growth: (mean, standard deviation) of the change per role name;
+            ROLE_GROWTH if None. Roles missing from it do not change.
+    
+    Returns:
+        Progression model.
+    """
+    growth = growth or ROLE_GROWTH
+    means = np.array([growth.get(role, (0.0, 0.0))[0] for role in ROLES])
+    spreads = np.array([growth.get(role, (0.0, 0.0))[1] for role in ROLES])
+    
+    def model(ratings: np.ndarray, roles: np.ndarray, ages: np.ndarray, generator: np.random.Generator) -> np.ndarray:
+        return generator.normal(means[roles], spreads[roles])
+    return model
+
+
+def age_curve(
+    peak_age: float = 26.0,
+    growth: float = 1.0,
+    decline: float = 1.0,
+    max_change: float = 6.0
+) -> ProgressionModel:
+    """Build a model where young players improve and veterans decline.
+    
+    Args:
+        peak_age: Age at which players stop improving.
+        growth: Points gained per year a player is below the peak age.
+        decline: Points lost per year a player is past the peak age.
+        max_change: Largest change in either direction.
+    
+    Returns:
+        Progression model.
+    """
+    def model(ratings: np.ndarray, roles: np.ndarray, ages: np.ndarray, generator: np.random.Generator) -> np.ndarray:
+        years = ages - peak_age
+        return np.clip(np.where(years < 0, -growth * years, -decline * years), -max_change, max_change)
+    return model
+
+
+PROGRESSION_MODELS = {
+    "random": random_walk,
+    "regression": regression_to_mean(),
+    "roles": role_growth(),
+    "age": age_curve()
+}
+
+
+class ProgressionManager:
+    """Applies one offseason of player progression to every team at once.
+    
+    The progression models read the rating, role and age columns of the
+    registry's PlayerStore; their changes are summed, rounded and clamped to
+    the rating bounds and everyone ages a year, all as column operations.
+    Only the Player models that have already been built are then refreshed
+    from the store; leagues nobody has looked at stay as bare columns. The
+    ratings before and after are kept until the next offseason, so the
+    changes can be displayed without recomputing them.
+    
+    Each offseason draws from one ("progression", season) stream, so the
+    result only depends on the seed and the rosters.
+    """
+    
+    def __init__(self, registry: TeamRegistry, rng: RNGService | None = None, models: list[str] | None = None):
+        """Initialize the progression manager.
+        
+        Args:
+            registry: Shared TeamRegistry holding every team.
+            rng: RNGService to draw streams from; a freshly seeded one if None.
+            models: Names of the PROGRESSION_MODELS to combine; ["random"]
+                if None.
+        """
+        models = models or ["random"]
+        for name in models:
+            if name not in PROGRESSION_MODELS:
+                raise ValueError(f"Unknown progression model: {name}")
+        self.registry = registry
+        self.rng = rng or RNGService()
+        self.models = list(models)
+        
+        # Results of the latest offseason, indexed by team id
+        self._old_ratings = None
+        self._new_ratings = None
+        self._offsets = None
+    
+    @timed("offseason[progression]")
+    def progress(self, season: int) -> None:
+        """Apply one offseason of progression to every player.
+        
+        Args:
+            season: Season that just ended, used to pick the random stream.
+        """
+        store = self.registry.draw_all_players()
+        old_ratings = store.ratings
+        
+        generator = self.rng.generator("progression", season)
+        ratings = old_ratings.astype(np.float64)
+        roles = store.roles.astype(np.int64)
+        ages = store.ages.astype(np.float64)
+        changes = np.zeros(len(store))
+        for name in self.models:
+            changes += PROGRESSION_MODELS[name](ratings, roles, ages, generator)
+        store.apply_rating_changes(np.rint(changes))
+        store.ages += 1
+        self.registry.refresh_players()
+        
+        self._old_ratings = old_ratings
+        self._new_ratings = store.ratings.copy()
+        self._offsets = store.offsets
+    
+    def get_team_changes(self, team: Team) -> list[tuple[Player, int, int]]:
+        """Get the rating changes of a team's players in the latest offseason.
+        
+        Args:
+            team: Team to look up.
+        
+        Returns:
+            List of (player, old_rating, new_rating) in roster order; empty
+            before the first offseason.
+        """
+        if self._offsets is None:
+            return []
+        start, end = self._offsets[team.id], self._offsets[team.id + 1]
+        return list(zip(
+            team.players,
+            self._old_ratings[start:end].tolist(),
+            self._new_ratings[start:end].tolist()
+        ))
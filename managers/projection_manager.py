@@ -0,0 +1,263 @@
+"""Manager for Monte Carlo season projections."""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from rich.table import Table
+from core.console import console
+from core.series_odds import series_score_probabilities, series_scores
+from .match_manager import MatchManager
+from .roster_manager import RosterManager
+from .schedule_manager import ScheduleManager
+
+# Trials are simulated in blocks of this size to bound memory per worker.
+TRIAL_BLOCK_SIZE = 20_000
+
+# Workers are started fresh rather than forked: projections may run while
+# simulation threads hold locks, and a forked child would inherit them held.
+WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _run_trials(
+    wins: np.ndarray,
+    map_diffs: np.ndarray,
+    fixtures: np.ndarray,
+    score_cdfs: np.ndarray,
+    scores: np.ndarray,
+    trials: int,
+    seed_sequence: np.random.SeedSequence
+) -> np.ndarray:
+    """Simulate season completions and count final ranks.
+    
+    Runs in a worker process, so it only takes and returns plain arrays.
+    
+    Args:
+        wins: Current match wins per team.
+        map_diffs: Current map differential per team.
+        fixtures: Remaining fixtures as (team1_idx, team2_idx) rows.
+        score_cdfs: Cumulative probabilities of the final series scores, one
+            row per fixture.
+        scores: Final series scores as (team1_maps, team2_maps) rows, in
+            score_cdfs column order.
+        trials: Number of season completions to simulate.
+        seed_sequence: Seed for this worker's independent RNG stream.
+    
+    Returns:
+        Array of shape (n_teams, n_teams) counting how often each team
+        finished at each rank (0-indexed).
+    """
+    rng = np.random.default_rng(seed_sequence)
+    n_teams = len(wins)
+    histogram = np.zeros(n_teams * n_teams, dtype=np.int64)
+    
+    remaining = trials
+    while remaining > 0:
+        block = min(remaining, TRIAL_BLOCK_SIZE)
+        remaining -= block
+        
+        block_wins = np.tile(wins, (block, 1))
+        block_diffs = np.tile(map_diffs, (block, 1))
+        
+        # One draw per series, inverted through its score distribution
+        for (team1_idx, team2_idx), score_cdf in zip(fixtures.tolist(), score_cdfs):
+            outcome = np.minimum(np.searchsorted(score_cdf, rng.random(block), side="right"), len(scores) - 1)
+            team1_maps = scores[outcome, 0]
+            team2_maps = scores[outcome, 1]
+            team1_series = team1_maps > team2_maps
+            
+            block_wins[:, team1_idx] += team1_series
+            block_wins[:, team2_idx] += ~team1_series
+            block_diffs[:, team1_idx] += team1_maps - team2_maps
+            block_diffs[:, team2_idx] += team2_maps - team1_maps
+        
+        # Same ordering as StandingsManager._sort_standings: wins, then map
+        # differential, ties kept in roster order by the stable sort.
+        diff_span = 2 * int(np.abs(block_diffs).max()) + 1
+        keys = block_wins.astype(np.int64) * diff_span + block_diffs
+        order = np.argsort(-keys, axis=1, kind="stable")
+        ranks = np.broadcast_to(np.arange(n_teams), order.shape)
+        histogram += np.bincount((order * n_teams + ranks).ravel(), minlength=n_teams * n_teams)
+    
+    return histogram.reshape(n_teams, n_teams)
+
+
+class ProjectionManager:
+    """Handles Monte Carlo projections of final standings."""
+    
+    PLAYOFF_SPOTS = 8
+    
+    def __init__(self, leagues: list, roster_manager: RosterManager, match_manager: MatchManager):
+        """Initialize the projection manager.
+        
+        Args:
+            leagues: List of league dictionaries from JSON.
+            roster_manager: RosterManager instance for accessing teams.
+            match_manager: MatchManager used to derive map-win probabilities.
+        """
+        self.leagues = leagues
+        self.roster_manager = roster_manager
+        self.match_manager = match_manager
+    
+    def project_league(
+        self,
+        league_name: str,
+        schedule_manager: ScheduleManager,
+        start_week: int,
+        trials: int = 100_000,
+        workers: int | None = None,
+        seed: int | None = None,
+        series_format: int = 3
+    ) -> dict:
+        """Project the final standings of a league.
+        
+        Simulates the remaining weeks of the schedule many times from the
+        current team records and counts where each team finishes. Every
+        series score is drawn from its exact distribution (core.series_odds)
+        instead of map by map. Trials are split across a process pool, each
+        worker with its own RNG stream.
+        
+        Args:
+            league_name: Name of the league.
+            schedule_manager: ScheduleManager with the season's schedules.
+            start_week: First week still to be played (0-indexed).
+            trials: Number of simulated season completions; must be positive.
+            workers: Number of worker processes (default: CPU count).
+            seed: Optional seed for reproducible projections.
+            series_format: Number of maps (3 or 5).
+        
+        Returns:
+            Dictionary mapping team names to a list of probabilities of
+            finishing at each rank (index 0 is first place).
+        """
+        if trials < 1:
+            raise ValueError(f"trials must be positive, got {trials}")
+        teams = self.roster_manager.teams_by_league[league_name]
+        team_index = {team.name: idx for idx, team in enumerate(teams)}
+        
+        fixtures = []
+        for week_matches in schedule_manager.schedules[league_name][start_week:]:
+            for team1_name, team2_name in week_matches:
+                fixtures.append((team_index[team1_name], team_index[team2_name]))
+        map_win_chances = self.match_manager.map_win_probabilities(
+            [(teams[team1_idx], teams[team2_idx]) for team1_idx, team2_idx in fixtures],
+            np.random.default_rng(seed)
+        )
+        
+        wins = np.array([team.wins for team in teams], dtype=np.int64)
+        map_diffs = np.array([team.maps_won - team.maps_lost for team in teams], dtype=np.int64)
+        fixtures = np.array(fixtures, dtype=np.int64).reshape(-1, 2)
+        score_cdfs = np.cumsum(series_score_probabilities(map_win_chances, series_format), axis=1)
+        scores = np.array(series_scores(series_format), dtype=np.int64)
+        
+        workers = min(workers or os.cpu_count() or 1, max(1, trials // TRIAL_BLOCK_SIZE))
+        seed_sequences = np.random.SeedSequence(seed).spawn(workers)
+        trial_counts = [trials // workers + (1 if i < trials % workers else 0) for i in range(workers)]
+        args = (wins, map_diffs, fixtures, score_cdfs, scores)
+        
+        if workers == 1:
+            histogram = _run_trials(*args, trial_counts[0], seed_sequences[0])
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(WORKER_START_METHOD)
+            ) as executor:
+                futures = [
+                    executor.submit(_run_trials, *args, count, seed_sequence)
+                    for count, seed_sequence in zip(trial_counts, seed_sequences)
+                ]
+                histogram = sum(future.result() for future in futures)
+        
+        probabilities = histogram / trials
+        return {team.name: probabilities[idx].tolist() for idx, team in enumerate(teams)}
+    
+    def playoff_odds(self, projection: dict, spots: int | None = None) -> dict:
+        """Get each team's probability of finishing in a playoff spot.
+        
+        Args:
+            projection: Result of project_league.
+            spots: Number of playoff spots (default PLAYOFF_SPOTS); 0 gives
+                every team 0.
+        
+        Returns:
+            Dictionary mapping team names to playoff probability.
+        """
+        spots = spots if spots is not None else self.PLAYOFF_SPOTS
+        if spots < 0:
+            raise ValueError(f"spots must not be negative, got {spots}")
+        return {name: sum(rank_odds[:spots]) for name, rank_odds in projection.items()}
+    
+    def view_projections(self, schedule_manager: ScheduleManager, start_week: int) -> None:
+        """Display projection viewing interface with league selection.
+        
+        Args:
+            schedule_manager: ScheduleManager with the season's schedules.
+            start_week: First week still to be played (0-indexed).
+        """
+        console.print("\n[bold]View Projections[/bold]")
+        
+        # Show league selection
+        table = Table(title="Select a League")
+        table.add_column("Number", style="cyan")
+        table.add_column("League", style="magenta")
+        
+        league_names = [league["name"] for league in self.leagues]
+        for idx, league_name in enumerate(league_names, 1):
+            table.add_row(str(idx), league_name)
+        
+        console.print(table)
+        
+        # Get league selection
+        while True:
+            try:
+                choice = input("\nEnter league number (or 0 to go back): ").strip()
+                league_idx = int(choice) - 1
+                
+                if choice == "0":
+                    return
+                
+                if 0 <= league_idx < len(league_names):
+                    selected_league_name = league_names[league_idx]
+                    self._display_projection(selected_league_name, schedule_manager, start_week)
+                    return
+                else:
+                    console.print("[red]Invalid league number. Please try again.[/red]")
+            except ValueError:
+                console.print("[red]Please enter a valid number.[/red]")
+    
+    def _display_projection(self, league_name: str, schedule_manager: ScheduleManager, start_week: int) -> None:
+        """Display the projected final standings for a league.
+        
+        Args:
+            league_name: Name of the league.
+            schedule_manager: ScheduleManager with the season's schedules.
+            start_week: First week still to be played (0-indexed).
+        """
+        with console.status(f"[bold yellow]Projecting {league_name}...[/bold yellow]"):
+            projection = self.project_league(league_name, schedule_manager, start_week)
+        playoff_odds = self.playoff_odds(projection)
+        
+        # Order by expected finishing position
+        expected_ranks = {
+            name: sum(rank * odds for rank, odds in enumerate(rank_odds, 1))
+            for name, rank_odds in projection.items()
+        }
+        
+        console.print()  # Add spacing
+        table = Table(title=f"{league_name} Projected Standings")
+        table.add_column("Team", style="green")
+        table.add_column("Avg Rank", style="cyan")
+        table.add_column("1st", style="yellow")
+        table.add_column(f"Top {self.PLAYOFF_SPOTS}", style="blue")
+        table.add_column("Last", style="red")
+        
+        for name in sorted(projection, key=expected_ranks.get):
+            table.add_row(
+                name,
+                f"{expected_ranks[name]:.2f}",
+                f"{projection[name][0]:.1%}",
+                f"{playoff_odds[name]:.1%}",
+                f"{projection[name][-1]:.1%}"
+            )
+        
+        console.print(table)
+        input("\nPress Enter to continue...")
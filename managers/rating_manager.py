@@ -0,0 +1,305 @@
+"""Manager for Elo team ratings and power rankings."""
+
+import threading
+from functools import lru_cache
+import numpy as np
+from rich.table import Table
+from core.console import console
+from core.map_odds import MapScoreDistribution
+from core.profiling import timed
+from models.Team import Team
+from models.WeekResults import WeekResults
+from .team_registry import TeamRegistry
+
+# Rating of a team whose roster is as strong as REFERENCE_TEAM_RATING
+BASE_ELO = 1500.0
+
+# Elo points per factor of ten in the odds of winning a map
+ELO_SCALE = 400.0
+
+# Rating change for a single map played entirely against expectation
+K_FACTOR = 16.0
+
+# Fraction of the way back to its roster-based rating a team's Elo moves
+# every offseason
+SEASON_REGRESSION = 0.3
+
+# Roster rating of the average opponent a team's starting Elo is measured against
+REFERENCE_TEAM_RATING = 50.0
+
+# Map-win chances are kept this far from 0 and 1 so ratings stay finite
+MIN_MAP_WIN_CHANCE = 0.001
+
+# Round-win chances the map-win lookup table is built at
+ODDS_TABLE_SIZE = 1001
+
+# Teams shown when ranking every league at once
+POWER_RANKINGS_SIZE = 25
+
+
+@lru_cache(maxsize=1)
+def _map_odds_table() -> tuple[np.ndarray, np.ndarray]:
+    """Get map-win chances for evenly spaced round-win chances.
+    
+    Returns:
+        Tuple of (round_win_chances, map_win_chances), both increasing.
+    """
+    round_win = np.linspace(0.0, 1.0, ODDS_TABLE_SIZE)
+    map_win = np.array([MapScoreDistribution(p).team1_win_probability for p in round_win.tolist()])
+    return round_win, np.maximum.accumulate(map_win)
+
+
+class RatingManager:
+    """Tracks an Elo rating for every team in every league.
+    
+    Ratings live in one array indexed by team id. A week's results are
+    applied with a single vectorized update: every map is scored as one Elo
+    game against the ratings from before the week, so the order leagues
+    finish in does not matter. A team's rating starts where its roster puts
+    it, measured as its map-win chance against a REFERENCE_TEAM_RATING
+    roster, and moves SEASON_REGRESSION of the way back there every
+    offseason, after player ratings have changed.
+    
+    Elo can also replace roster strength as the match engines' input: an
+    Elo difference gives a map-win chance, which is converted back to the
+    round-win chance that produces it.
+    """
+    
+    def __init__(self, leagues: list, registry: TeamRegistry):
+        """Initialize the rating manager.
+        
+        Args:
+            leagues: List of league dictionaries from JSON.
+            registry: Shared TeamRegistry the team ids refer to.
+        """
+        self.leagues = leagues
+        self.registry = registry
+        
+        # NaN until a team is first rated, so teams are only built when needed
+        self.ratings = np.full(registry.team_count, np.nan)
+        self.last_changes = np.zeros(registry.team_count)  # Change from the latest update
+        self._lock = threading.Lock()  # Leagues may be simulated from several threads
+    
+    def get_rating(self, team: Team) -> float:
+        """Get a team's Elo rating.
+        
+        Args:
+            team: Team to look up.
+        
+        Returns:
+            Current Elo rating.
+        """
+        return float(self.get_ratings(np.array([team.id]))[0])
+    
+    def get_ratings(self, team_ids: np.ndarray) -> np.ndarray:
+        """Get the Elo ratings of several teams, rating new teams from their rosters.
+        
+        Args:
+            team_ids: Array of team ids.
+        
+        Returns:
+            Array of Elo ratings in the same order.
+        """
+        with self._lock:
+            self._seed(team_ids)
+            return self.ratings[team_ids]
+    
+    def round_win_chance(self, team1: Team, team2: Team) -> float:
+        """Get the round-win chance for team1 implied by the two teams' Elo ratings.
+        
+        Args:
+            team1: First team.
+            team2: Second team.
+        
+        Returns:
+            Probability that team1 wins any single round.
+        """
+        return float(self.round_win_chances(np.array([team1.id]), np.array([team2.id]))[0])
+    
+    def round_win_chances(self, team1_ids: np.ndarray, team2_ids: np.ndarray) -> np.ndarray:
+        """Get the round-win chances implied by Elo for several matchups.
+        
+        Args:
+            team1_ids: Ids of the first teams.
+            team2_ids: Ids of the second teams, same length.
+        
+        Returns:
+            Array of round-win probabilities for team1, whose map-win
+            probabilities match the Elo expectations.
+        """
+        round_win, map_win = _map_odds_table()
+        expected = self._expected_score(self.get_ratings(team1_ids) - self.get_ratings(team2_ids))
+        return np.interp(expected, map_win, round_win)
+    
+    @timed("ratings_update")
+    def update(
+        self,
+        team1_ids: np.ndarray,
+        team2_ids: np.ndarray,
+        team1_maps: np.ndarray,
+        team2_maps: np.ndarray
+    ) -> None:
+        """Apply a batch of results in one vectorized Elo update.
+        
+        Every map is scored against the ratings from before the batch.
+        
+        Args:
+            team1_ids: Ids of the first teams.
+            team2_ids: Ids of the second teams.
+            team1_maps: Maps won by each first team.
+            team2_maps: Maps won by each second team.
+        """
+        team1_ids = np.asarray(team1_ids, dtype=np.int64)
+        team2_ids = np.asarray(team2_ids, dtype=np.int64)
+        team1_maps = np.asarray(team1_maps, dtype=np.float64)
+        team2_maps = np.asarray(team2_maps, dtype=np.float64)
+        
+        with self._lock:
+            self._seed(np.concatenate([team1_ids, team2_ids]))
+            expected = self._expected_score(self.ratings[team1_ids] - self.ratings[team2_ids])
+            delta = K_FACTOR * (team1_maps - (team1_maps + team2_maps) * expected)
+            
+            changes = np.zeros(len(self.ratings))
+            np.add.at(changes, team1_ids, delta)
+            np.add.at(changes, team2_ids, -delta)
+            self.ratings += changes
+            self.last_changes = changes
+    
+    def record_week(self, week_results: WeekResults) -> None:
+        """Apply a week's results from every league.
+        
+        Args:
+            week_results: The week's results; their team id and map arrays
+                are used directly.
+        """
+        if len(week_results.team1_ids):
+            self.update(
+                week_results.team1_ids, week_results.team2_ids, week_results.team1_maps, week_results.team2_maps
+            )
+    
+    @timed("offseason[elo]")
+    def start_new_season(self) -> None:
+        """Move every rated team part of the way back to its roster-based rating."""
+        with self._lock:
+            rated = np.flatnonzero(~np.isnan(self.ratings))
+            priors = self._roster_elo(rated)
+            self.ratings[rated] += SEASON_REGRESSION * (priors - self.ratings[rated])
+            self.last_changes = np.zeros(len(self.ratings))
+    
+    def _seed(self, team_ids: np.ndarray) -> None:
+        """Give teams without a rating their roster-based one; the lock must be held."""
+        new = np.unique(team_ids[np.isnan(self.ratings[team_ids])])
+        if len(new):
+            self.ratings[new] = self._roster_elo(new)
+    
+    def _roster_elo(self, team_ids: np.ndarray) -> np.ndarray:
+        """Convert roster strength to Elo.
+        
+        The Elo is the one whose expected score against a BASE_ELO team is
+        the team's map-win chance against a REFERENCE_TEAM_RATING roster.
+        
+        Args:
+            team_ids: Array of team ids.
+        
+        Returns:
+            Array of Elo ratings.
+        """
+        team_ratings = self.registry.team_ratings(team_ids)
+        total = team_ratings + REFERENCE_TEAM_RATING
+        chance = np.divide(team_ratings, total, out=np.full(len(team_ratings), 0.5), where=total > 0)
+        round_win, map_win = _map_odds_table()
+        map_chance = np.clip(np.interp(chance, round_win, map_win), MIN_MAP_WIN_CHANCE, 1.0 - MIN_MAP_WIN_CHANCE)
+        return BASE_ELO + ELO_SCALE * np.log10(map_chance / (1.0 - map_chance))
+    
+    def _expected_score(self, rating_difference: np.ndarray) -> np.ndarray:
+        """Get the Elo expected score (map-win chance) for rating differences."""
+        return 1.0 / (1.0 + 10.0 ** (-rating_difference / ELO_SCALE))
+    
+    def view_power_rankings(self) -> None:
+        """Display power rankings for one league or across all leagues."""
+        console.print("\n[bold]Power Rankings[/bold]")
+        
+        # Show league selection
+        table = Table(title="Select a League")
+        table.add_column("Number", style="cyan")
+        table.add_column("League", style="magenta")
+        
+        league_names = [league["name"] for league in self.leagues]
+        for idx, league_name in enumerate(league_names, 1):
+            table.add_row(str(idx), league_name)
+        table.add_row(str(len(league_names) + 1), "All Leagues")
+        
+        console.print(table)
+        
+        # Get league selection
+        while True:
+            try:
+                choice = input("\nEnter league number (or 0 to go back): ").strip()
+                league_idx = int(choice) - 1
+                
+                if choice == "0":
+                    return
+                
+                if 0 <= league_idx < len(league_names):
+                    self._display_power_rankings(league_names[league_idx])
+                    return
+                elif league_idx == len(league_names):
+                    self._display_power_rankings(None)
+                    return
+                else:
+                    console.print("[red]Invalid league number. Please try again.[/red]")
+            except ValueError:
+                console.print("[red]Please enter a valid number.[/red]")
+    
+    def _display_power_rankings(self, league_name: str | None) -> None:
+        """Display teams by Elo rating.
+        
+        Args:
+            league_name: Name of the league, or None for the top
+                POWER_RANKINGS_SIZE teams among every team rated so far.
+        """
+        if league_name is None:
+            with self._lock:
+                team_ids = np.flatnonzero(~np.isnan(self.ratings))
+            if not len(team_ids):
+                console.print("[yellow]No team has been rated yet; play a week first.[/yellow]")
+                return
+            title = "Power Rankings - All Leagues"
+        else:
+            team_ids = np.array([team.id for team in self.registry[league_name]])
+            title = f"{league_name} Power Rankings"
+        
+        ratings = self.get_ratings(team_ids)
+        changes = self.last_changes[team_ids]
+        order = np.argsort(-ratings, kind="stable")
+        if league_name is None:
+            order = order[:POWER_RANKINGS_SIZE]
+        
+        console.print()  # Add spacing
+        table = Table(title=title)
+        table.add_column("Rank", style="cyan")
+        table.add_column("Team", style="green")
+        if league_name is None:
+            table.add_column("League", style="magenta")
+        table.add_column("Elo", style="yellow")
+        table.add_column("Change", style="blue")
+        table.add_column("Record", style="yellow")
+        table.add_column("Roster", style="cyan")
+        
+        for rank, idx in enumerate(order.tolist(), 1):
+            team = self.registry.get_team_by_id(int(team_ids[idx]))
+            change = round(changes[idx])
+            change_str = f"{change:+d}" if change != 0 else "0"
+            row = [str(rank), team.name]
+            if league_name is None:
+                row.append(self.registry.league_of_id(team.id))
+            row += [
+                f"{ratings[idx]:.0f}",
+                change_str,
+                f"{team.wins}-{team.losses}",
+                f"{team.get_team_rating():.1f}"
+            ]
+            table.add_row(*row)
+        
+        console.print(table)
+        input("\nPress Enter to continue...")
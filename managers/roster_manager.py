@@ -3,35 +3,23 @@
 from rich.table import Table
 from core.console import console
 from models.Team import Team
+from .team_registry import TeamRegistry
 
 
 class RosterManager:
     """Handles team roster display."""
     
-    def __init__(self, leagues: list):
+    def __init__(self, leagues: list, registry: TeamRegistry | None = None):
         """Initialize the roster manager.
         
         Args:
             leagues: List of league dictionaries from JSON.
+            registry: Shared TeamRegistry; a new one is created if None.
         """
         self.leagues = leagues
-        self.teams_by_league = self._initialize_teams()
-    
-    def _initialize_teams(self) -> dict:
-        """Initialize all teams with rosters.
-        
-        Returns:
-            Dictionary mapping league names to lists of Team objects.
-        """
-        teams_by_league = {}
-        for league in self.leagues:
-            teams = []
-            for team_data in league["teams"]:
-                team = Team(name=team_data["name"])
-                team.build_roster()
-                teams.append(team)
-            teams_by_league[league["name"]] = teams
-        return teams_by_league
+        self.registry = registry or TeamRegistry(leagues)
+        # League name -> list of Team objects, built on first access
+        self.teams_by_league = self.registry
     
     def view_roster(self) -> None:
         """Display roster viewing interface with region and team selection."""
@@ -0,0 +1,366 @@
+"""Manager for saving and resuming full game state."""
+
+import json
+import mmap
+import os
+import struct
+import numpy as np
+from core.rng import RNGService
+from models.WeekResults import WeekResults
+from .team_registry import TeamRegistry
+
+MAGIC = b"VMGSAVE1"
+
+# Frame header: 4-byte kind tag and payload length
+FRAME_HEADER = struct.Struct("<4sQ")
+SNAPSHOT = b"SNAP"
+CHECKPOINT = b"WEEK"
+
+# Result rows: league index, week, team1 id, team2 id, team1 maps, team2 maps
+RESULT_COLUMNS = 6
+# Record rows: team id, wins, losses, maps won, maps lost
+RECORD_COLUMNS = 5
+
+# Keys every snapshot header carries
+SNAPSHOT_KEYS = (
+    "seed", "user_team_id", "current_season", "current_week", "season_history", "double_round_robin",
+    "batch_simulation", "map_engine", "team_strength", "progression", "team_count", "team_rating", "storage_run"
+)
+
+
+def _pack_array(array: np.ndarray) -> bytes:
+    """Encode an array as its row count followed by its raw little-endian data."""
+    array = np.ascontiguousarray(array)
+    return struct.pack("<Q", len(array)) + array.tobytes()
+
+
+def _unpack_array(buffer, offset: int, dtype: str, columns: int = 1) -> tuple[np.ndarray, int]:
+    """Decode an array written by _pack_array.
+    
+    Args:
+        buffer: Buffer to read from (bytes or a memory map).
+        offset: Position of the array's row count.
+        dtype: NumPy dtype of the elements.
+        columns: Number of columns per row.
+    
+    Returns:
+        Tuple of (array, offset just past the array). The array is a copy, so
+        the buffer can be closed afterwards.
+    """
+    (rows,) = struct.unpack_from("<Q", buffer, offset)
+    offset += 8
+    count = rows * columns
+    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).copy()
+    offset += array.nbytes
+    return (array.reshape(rows, columns) if columns > 1 else array), offset
+
+
+class SaveManager:
+    """Writes game state to a compact binary save file and loads it back.
+    
+    A save file starts with a full snapshot: game state as a small JSON
+    header, followed by team records, player ratings and roles, and the
+    season's results as packed integer arrays, Elo ratings and player ages. After every
+    week only that week's results and the records of the teams that played
+    are appended as a checkpoint frame; Elo ratings are rebuilt from them on
+    load. A new snapshot replaces the file at the start of each
+    season. Schedules are not stored; they are regenerated from the league
+    data. Loading memory-maps the file and replays the checkpoints, ignoring
+    a final frame left incomplete by a crash.
+    """
+    
+    def __init__(self, path: str, fsync: bool = False):
+        """Initialize the save manager.
+        
+        Args:
+            path: Path of the save file.
+            fsync: Force every frame to disk before returning, so a checkpoint
+                survives a power loss and not just a crash of the process.
+        """
+        self.path = path
+        self.fsync = fsync
+    
+    def exists(self) -> bool:
+        """Check whether the save file exists."""
+        return os.path.exists(self.path)
+    
+    def save(self, game_manager) -> None:
+        """Write a full snapshot, replacing any existing save.
+        
+        Args:
+            game_manager: GameManager whose state is saved.
+        """
+        registry = game_manager.registry
+        store = registry.draw_all_players()
+        
+        header = {
+            "seed": registry.rng.seed,
+            "user_team_id": game_manager.user_team.id,
+            "current_season": game_manager.current_season,
+            "current_week": game_manager.current_week,
+            "season_history": game_manager.season_history,
+            "double_round_robin": game_manager.double_round_robin,
+            "batch_simulation": game_manager.batch_simulation,
+            "map_engine": game_manager.map_engine,
+            "team_strength": game_manager.team_strength,
+            "progression": game_manager.progression_manager.models,
+            "team_count": registry.team_count,
+            "team_rating": registry.team_rating,
+            "storage_run": game_manager.storage_manager.run if game_manager.storage_manager else None,
+        }
+        records = np.column_stack((np.arange(registry.team_count), registry.records))
+        results = self._result_rows(game_manager, (
+            (league_name, week, result)
+            for league_name, store in game_manager.schedule_manager.results.built_items()
+            for week, result in store
+        ))
+        
+        payload = b"".join([
+            self._pack_header(header),
+            _pack_array(records.astype("<i4")),
+            _pack_array(store.ratings.astype("<i2")),
+            _pack_array(store.roles.astype("i1")),
+            _pack_array(store.team_sizes.astype("<i4")),
+            _pack_array(results),
+            _pack_array(game_manager.rating_manager.ratings.astype("<f8")),
+            _pack_array(store.ages.astype("<i2")),
+        ])
+        
+        # Write next to the old file and swap, so a crash never leaves no save
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(FRAME_HEADER.pack(SNAPSHOT, len(payload)))
+            f.write(payload)
+            self._flush(f)
+        os.replace(temp_path, self.path)
+    
+    def checkpoint(self, game_manager, week: int, week_results: WeekResults) -> None:
+        """Append one week's changes to the save file.
+        
+        Args:
+            game_manager: GameManager that just simulated the week.
+            week: Week number (0-indexed) that was simulated.
+            week_results: That week's results in every league.
+        """
+        if not self.exists():
+            self.save(game_manager)
+            return
+        
+        registry = game_manager.registry
+        played = np.unique(np.concatenate([week_results.team1_ids, week_results.team2_ids]))
+        results = np.column_stack((
+            week_results.leagues,
+            np.full(len(week_results.leagues), week),
+            week_results.team1_ids,
+            week_results.team2_ids,
+            week_results.team1_maps,
+            week_results.team2_maps
+        ))
+        
+        header = {"season": game_manager.current_season, "week": week}
+        payload = b"".join([
+            self._pack_header(header),
+            _pack_array(results.astype("<i4")),
+            _pack_array(np.column_stack((played, registry.records[played])).astype("<i4")),
+        ])
+        with open(self.path, "ab") as f:
+            f.write(FRAME_HEADER.pack(CHECKPOINT, len(payload)))
+            f.write(payload)
+            self._flush(f)
+    
+    def load(self, leagues: list, **game_options):
+        """Load a save file into a new GameManager.
+        
+        Args:
+            leagues: List of league dictionaries the save was made with.
+            **game_options: Extra GameManager arguments (e.g. storage_manager).
+        
+        Returns:
+            GameManager with the saved state, writing further checkpoints to
+            this save file.
+        """
+        from .game_manager import GameManager
+        
+        snapshot, checkpoints, valid_length = self._read()
+        header = snapshot["header"]
+        missing = [key for key in SNAPSHOT_KEYS if key not in header]
+        if missing:
+            raise ValueError(f"Save file header lacks {', '.join(missing)}: {self.path}")
+        
+        registry = TeamRegistry(leagues, RNGService(header["seed"]), team_rating=header["team_rating"])
+        if registry.team_count != header["team_count"]:
+            raise ValueError(f"Save file has {header['team_count']} teams, league data has {registry.team_count}")
+        self._restore_players(registry, snapshot)
+        user_team = registry.get_team_by_id(header["user_team_id"])
+        
+        game_manager = GameManager(
+            user_team,
+            leagues,
+            batch_simulation=header["batch_simulation"],
+            double_round_robin=header["double_round_robin"],
+            map_engine=header["map_engine"],
+            team_strength=header["team_strength"],
+            progression=header["progression"],
+            registry=registry,
+            **game_options
+        )
+        game_manager.current_season = header["current_season"]
+        game_manager.current_week = header["current_week"]
+        game_manager.season_history = {int(season): record for season, record in header["season_history"].items()}
+        
+        self._restore_records(registry, snapshot["records"])
+        self._restore_results(game_manager, snapshot["results"])
+        game_manager.rating_manager.ratings = snapshot["elo"]
+        
+        for checkpoint in checkpoints:
+            if checkpoint["header"]["season"] != game_manager.current_season:
+                continue
+            self._restore_records(registry, checkpoint["records"])
+            self._restore_results(game_manager, checkpoint["results"])
+            rows = checkpoint["results"]
+            if len(rows):
+                game_manager.rating_manager.update(rows[:, 2], rows[:, 3], rows[:, 4], rows[:, 5])
+            game_manager.current_week = checkpoint["header"]["week"] + 1
+        
+        # Standings indexes are rebuilt from the restored records on first use
+        game_manager.standings_manager.reset_indexes()
+        
+        # Keep writing the saved career's history run, minus weeks replayed next
+        storage_manager = game_manager.storage_manager
+        if storage_manager and header["storage_run"] is not None:
+            storage_manager.resume_run(header["storage_run"], game_manager.current_season, game_manager.current_week)
+        
+        # Drop a frame cut short by a crash so new checkpoints append cleanly
+        if valid_length < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_length)
+        
+        game_manager.save_manager = self
+        return game_manager
+    
+    def _read(self) -> tuple[dict, list, int]:
+        """Parse the save file through a memory map.
+        
+        Returns:
+            Tuple of (snapshot, checkpoints, length of the valid prefix).
+        """
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < len(MAGIC):
+                raise ValueError(f"Not a save file: {self.path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if data[:len(MAGIC)] != MAGIC:
+                    raise ValueError(f"Not a save file: {self.path}")
+                
+                snapshot = None
+                checkpoints = []
+                offset = len(MAGIC)
+                while offset + FRAME_HEADER.size <= size:
+                    kind, length = FRAME_HEADER.unpack_from(data, offset)
+                    start = offset + FRAME_HEADER.size
+                    if start + length > size:
+                        break
+                    if kind == SNAPSHOT:
+                        snapshot = self._parse_snapshot(data, start, start + length)
+                    elif kind == CHECKPOINT:
+                        checkpoints.append(self._parse_checkpoint(data, start))
+                    offset = start + length
+        
+        if snapshot is None:
+            raise ValueError(f"Save file has no snapshot: {self.path}")
+        return snapshot, checkpoints, offset
+    
+    def _parse_snapshot(self, data, offset: int, end: int) -> dict:
+        """Decode a snapshot frame's payload ending at end."""
+        header, offset = self._unpack_header(data, offset)
+        records, offset = _unpack_array(data, offset, "<i4", RECORD_COLUMNS)
+        ratings, offset = _unpack_array(data, offset, "<i2")
+        roles, offset = _unpack_array(data, offset, "i1")
+        team_sizes, offset = _unpack_array(data, offset, "<i4")
+        results, offset = _unpack_array(data, offset, "<i4", RESULT_COLUMNS)
+        if offset >= end:
+            raise ValueError(f"Save file snapshot lacks Elo ratings: {self.path}")
+        elo, offset = _unpack_array(data, offset, "<f8")
+        if offset >= end:
+            raise ValueError(f"Save file snapshot lacks player ages: {self.path}")
+        ages, offset = _unpack_array(data, offset, "<i2")
+        return {
+            "header": header,
+            "records": records,
+            "ratings": ratings,
+            "roles": roles,
+            "team_sizes": team_sizes,
+            "results": results,
+            "elo": elo,
+            "ages": ages,
+        }
+    
+    def _parse_checkpoint(self, data, offset: int) -> dict:
+        """Decode a checkpoint frame's payload."""
+        header, offset = self._unpack_header(data, offset)
+        results, offset = _unpack_array(data, offset, "<i4", RESULT_COLUMNS)
+        records, offset = _unpack_array(data, offset, "<i4", RECORD_COLUMNS)
+        return {"header": header, "results": results, "records": records}
+    
+    def _pack_header(self, header: dict) -> bytes:
+        """Encode a frame's JSON header with a length prefix."""
+        encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        return struct.pack("<I", len(encoded)) + encoded
+    
+    def _unpack_header(self, data, offset: int) -> tuple[dict, int]:
+        """Decode a frame's JSON header."""
+        (length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        return json.loads(bytes(data[offset:offset + length])), offset + length
+    
+    def _result_rows(self, game_manager, results) -> np.ndarray:
+        """Convert match results to integer rows.
+        
+        Args:
+            game_manager: GameManager whose registry maps names to ids.
+            results: Iterable of (league_name, week, (team1_name, team1_wins,
+                team2_wins, team2_name)).
+        
+        Returns:
+            Array with RESULT_COLUMNS columns.
+        """
+        registry = game_manager.registry
+        league_indices = {league["name"]: idx for idx, league in enumerate(game_manager.leagues)}
+        rows = []
+        for league_name, week, (team1_name, team1_wins, team2_wins, team2_name) in results:
+            rows.append((
+                league_indices[league_name], week,
+                registry.get_team(team1_name, league_name).id, registry.get_team(team2_name, league_name).id,
+                team1_wins, team2_wins
+            ))
+        return np.array(rows, dtype="<i4").reshape(-1, RESULT_COLUMNS)
+    
+    def _restore_players(self, registry: TeamRegistry, snapshot: dict) -> None:
+        """Load every player's rating, role and age into the registry's store."""
+        team_sizes = registry.players.team_sizes
+        if not np.array_equal(snapshot["team_sizes"], team_sizes):
+            raise ValueError(f"Save file roster sizes do not match the league data: {self.path}")
+        registry.load_players(snapshot["ratings"], snapshot["roles"], snapshot["ages"])
+    
+    def _restore_records(self, registry: TeamRegistry, records: np.ndarray) -> None:
+        """Set team records from saved record rows."""
+        registry.set_records(records[:, 0], records[:, 1:])
+    
+    def _restore_results(self, game_manager, rows: np.ndarray) -> None:
+        """Store saved result rows back into the ScheduleManager."""
+        team_names = game_manager.registry.world.team_names
+        by_week = {}
+        for league_idx, week, team1_id, team2_id, team1_wins, team2_wins in rows.tolist():
+            league_name = game_manager.leagues[league_idx]["name"]
+            team1_name = team_names[team1_id]
+            team2_name = team_names[team2_id]
+            by_week.setdefault((league_name, week), []).append((team1_name, team1_wins, team2_wins, team2_name))
+        for (league_name, week), results in by_week.items():
+            game_manager.schedule_manager.store_week_results(league_name, week, results)
+    
+    def _flush(self, f) -> None:
+        """Flush a file, and force it to disk if fsync is enabled."""
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
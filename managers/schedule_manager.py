@@ -1,94 +1,498 @@
 """Manager for generating and displaying league schedules."""
 
+from typing import Callable, Iterator, Mapping, Sequence
+import numpy as np
 from rich.table import Table
 from core.console import console
 from models.Team import Team
+from models.WorldIndex import WorldIndex
+
+
+class RoundRobin:
+    """Arithmetic round-robin (circle method) over team indices 0..n-1.
+    
+    Team 0 stays fixed while the others rotate one slot per round, so the
+    slot a team occupies in any round, and with it its opponent, is computed
+    directly instead of rotating a list. With an odd number of teams a
+    virtual team n is added and its opponent has a bye.
+    
+    In each round slot 0 meets slot n-1 and slot i meets slot n-1-i; the lower
+    slot is listed first (home). With home/away balancing the fixed team
+    alternates between home and away, and every other team is home at most
+    one more time than away per cycle. In a double round-robin the second
+    cycle repeats the first with home and away swapped.
+    """
+    
+    def __init__(self, team_count: int, double: bool = False, balance_home_away: bool = True):
+        """Initialize the schedule.
+        
+        Args:
+            team_count: Number of teams.
+            double: Play every opponent twice, once home and once away.
+            balance_home_away: Alternate the fixed team between home and away.
+        """
+        self.team_count = team_count
+        self.size = team_count + (team_count % 2)
+        self.rounds = max(self.size - 1, 0)
+        self.double = double
+        self.balance_home_away = balance_home_away
+        self._rotating = list(range(1, self.size))
+    
+    def __len__(self) -> int:
+        return self.rounds * (2 if self.double else 1)
+    
+    def _team_at(self, slot: int, round_num: int) -> int:
+        """Get the team occupying a slot in a round of the first cycle."""
+        if slot == 0:
+            return 0
+        return (slot - 1 - round_num) % self.rounds + 1
+    
+    def _slot_of(self, team: int, round_num: int) -> int:
+        """Get the slot a team occupies in a round of the first cycle."""
+        if team == 0:
+            return 0
+        return (team - 1 + round_num) % self.rounds + 1
+    
+    def _is_swapped(self, low_slot: int, week: int) -> bool:
+        """Check whether the team in the lower slot plays away this week."""
+        swapped = week >= self.rounds
+        if low_slot == 0 and self.balance_home_away and (week % self.rounds) % 2 == 1:
+            swapped = not swapped
+        return swapped
+    
+    def fixture(self, team: int, week: int) -> tuple[int, int] | None:
+        """Get a team's fixture in a week in O(1).
+        
+        Args:
+            team: Team index.
+            week: Week number (0-indexed).
+        
+        Returns:
+            Tuple of (home_team, away_team) indices, or None on a bye.
+        """
+        if not 0 <= week < len(self):
+            raise IndexError(f"Week {week} is outside the schedule")
+        round_num = week % self.rounds
+        slot = self._slot_of(team, round_num)
+        other_slot = 0 if slot == self.size - 1 else self.size - 1 - slot
+        opponent = self._team_at(other_slot, round_num)
+        if opponent >= self.team_count:
+            return None
+        
+        low_team, high_team = (team, opponent) if slot < other_slot else (opponent, team)
+        if self._is_swapped(min(slot, other_slot), week):
+            return (high_team, low_team)
+        return (low_team, high_team)
+    
+    def fixture_index(self, team: int, week: int) -> int:
+        """Get the position of a team's pairing within its week in O(1).
+        
+        Positions count every pairing of the round, including a bye against
+        the virtual team, so they range over 0..size/2-1 in every week.
+        
+        Args:
+            team: Team index.
+            week: Week number (0-indexed).
+        
+        Returns:
+            Pairing position (the lower of the two slots).
+        """
+        slot = self._slot_of(team, week % self.rounds)
+        return 0 if slot in (0, self.size - 1) else min(slot, self.size - 1 - slot)
+    
+    def meeting_weeks(self, team1: int, team2: int) -> list[int]:
+        """Get the weeks in which two teams play each other, in O(1).
+        
+        Teams a, b >= 1 share a pairing in round r when their slots add up to
+        n-1, i.e. a + b + 2r = 0 (mod n-1); n-1 is odd, so 2 has an inverse
+        and r is solved directly. Team 0 meets the team in slot n-1.
+        
+        Args:
+            team1: Index of the first team.
+            team2: Index of the second team.
+        
+        Returns:
+            Week numbers in order (one per cycle), or an empty list if the
+            teams are the same.
+        """
+        if team1 == team2 or self.rounds == 0:
+            return []
+        m = self.rounds
+        if team1 == 0 or team2 == 0:
+            round_num = (-(team1 + team2)) % m
+        else:
+            round_num = (-(team1 + team2) * ((m + 1) // 2)) % m
+        return [round_num + cycle * m for cycle in range(len(self) // m)]
+    
+    def opponent(self, team: int, week: int) -> int | None:
+        """Get a team's opponent in a week in O(1).
+        
+        Args:
+            team: Team index.
+            week: Week number (0-indexed).
+        
+        Returns:
+            Opponent index, or None on a bye.
+        """
+        fixture = self.fixture(team, week)
+        if fixture is None:
+            return None
+        return fixture[1] if fixture[0] == team else fixture[0]
+    
+    def week_fixtures(self, week: int) -> list[tuple[int, int]]:
+        """Get every fixture of a week.
+        
+        Args:
+            week: Week number (0-indexed).
+        
+        Returns:
+            List of (home_team, away_team) index tuples.
+        """
+        if not 0 <= week < len(self):
+            raise IndexError(f"Week {week} is outside the schedule")
+        round_num = week % self.rounds
+        half = self.size // 2
+        
+        # Slots 1..n-1 hold teams 1..n-1 rotated right by round_num
+        cut = self.rounds - round_num
+        slots = [0] + self._rotating[cut:] + self._rotating[:cut]
+        fixtures = list(zip(slots[:half], slots[:half - 1:-1]))
+        
+        second_cycle = week >= self.rounds
+        if second_cycle:
+            fixtures = [(team2, team1) for team1, team2 in fixtures]
+        if self._is_swapped(0, week) != second_cycle:
+            fixtures[0] = (fixtures[0][1], fixtures[0][0])
+        if self.size != self.team_count:
+            fixtures = [f for f in fixtures if f[0] < self.team_count and f[1] < self.team_count]
+        return fixtures
+    
+    def week_pairings(self, week: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get every fixture of a week as arrays.
+        
+        Args:
+            week: Week number (0-indexed).
+        
+        Returns:
+            Tuple of (home_teams, away_teams, positions) arrays in
+            week_fixtures order; positions are as given by fixture_index.
+        """
+        fixtures = self.week_fixtures(week)
+        home_teams = np.array([home for home, _ in fixtures], dtype=np.int64)
+        away_teams = np.array([away for _, away in fixtures], dtype=np.int64)
+        positions = np.array([self.fixture_index(home, week) for home, _ in fixtures], dtype=np.int64)
+        return home_teams, away_teams, positions
+
+
+class LeagueSchedule(Sequence):
+    """A league's schedule as a sequence of weeks of (team1_name, team2_name) tuples.
+    
+    Weeks are built from the RoundRobin when accessed, so large leagues do not
+    hold every fixture of the season in memory.
+    """
+    
+    def __init__(self, team_names: list[str], round_robin: RoundRobin):
+        """Initialize the schedule.
+        
+        Args:
+            team_names: Team name for each team index.
+            round_robin: Round-robin over the team indices.
+        """
+        self.team_names = team_names
+        self.round_robin = round_robin
+        self.team_indices = {name: index for index, name in enumerate(team_names)}
+    
+    def __len__(self) -> int:
+        return len(self.round_robin)
+    
+    def __getitem__(self, week):
+        if isinstance(week, slice):
+            return [self[w] for w in range(*week.indices(len(self)))]
+        if week < 0:
+            week += len(self)
+        names = self.team_names
+        return [(names[team1], names[team2]) for team1, team2 in self.round_robin.week_fixtures(week)]
+    
+    def fixture(self, team_name: str, week: int) -> tuple[str, str] | None:
+        """Get a team's fixture in a week.
+        
+        Args:
+            team_name: Name of the team.
+            week: Week number (0-indexed).
+        
+        Returns:
+            Tuple of (team1_name, team2_name), or None on a bye.
+        """
+        fixture = self.round_robin.fixture(self.team_indices[team_name], week)
+        if fixture is None:
+            return None
+        return (self.team_names[fixture[0]], self.team_names[fixture[1]])
+
+
+class ResultsStore:
+    """Series results of one league's season in preallocated arrays.
+    
+    Results are stored by (week, pairing position) in two int8 arrays of map
+    wins, with -1 for fixtures not played yet. A team's pairing position in a
+    week comes from the RoundRobin in O(1), so a team's result in a week,
+    its results this season and head-to-head results need no scan and no
+    string keys.
+    """
+    
+    UNPLAYED = -1
+    
+    def __init__(self, schedule: LeagueSchedule):
+        """Allocate storage for every fixture of the schedule.
+        
+        Args:
+            schedule: The league's schedule.
+        """
+        self.schedule = schedule
+        self.round_robin = schedule.round_robin
+        shape = (len(self.round_robin), self.round_robin.size // 2)
+        self.team1_maps = np.full(shape, self.UNPLAYED, dtype=np.int8)
+        self.team2_maps = np.full(shape, self.UNPLAYED, dtype=np.int8)
+    
+    def record(self, week: int, team1_name: str, team2_name: str, team1_maps: int, team2_maps: int) -> None:
+        """Store the result of a scheduled fixture.
+        
+        Args:
+            week: Week number (0-indexed).
+            team1_name: Name of one team.
+            team2_name: Name of the other team.
+            team1_maps: Maps won by team1_name.
+            team2_maps: Maps won by team2_name.
+        """
+        team1 = self.schedule.team_indices[team1_name]
+        position = self.round_robin.fixture_index(team1, week)
+        if self.round_robin.fixture(team1, week)[0] != team1:
+            team1_maps, team2_maps = team2_maps, team1_maps
+        self.team1_maps[week, position] = team1_maps
+        self.team2_maps[week, position] = team2_maps
+    
+    def record_positions(self, week: int, positions: np.ndarray, team1_maps: np.ndarray, team2_maps: np.ndarray) -> None:
+        """Store several results of a week by pairing position.
+        
+        Args:
+            week: Week number (0-indexed).
+            positions: Pairing position of each fixture (see RoundRobin.fixture_index).
+            team1_maps: Maps won by each fixture's home team.
+            team2_maps: Maps won by each fixture's away team.
+        """
+        self.team1_maps[week, positions] = team1_maps
+        self.team2_maps[week, positions] = team2_maps
+    
+    def get(self, week: int, team_name: str) -> tuple[str, int, int, str] | None:
+        """Get a team's result in a week in O(1).
+        
+        Args:
+            week: Week number (0-indexed).
+            team_name: Name of the team.
+        
+        Returns:
+            Tuple of (team1_name, team1_maps, team2_maps, team2_name) in
+            schedule order, or None on a bye or if not played yet.
+        """
+        team = self.schedule.team_indices[team_name]
+        fixture = self.round_robin.fixture(team, week)
+        if fixture is None:
+            return None
+        position = self.round_robin.fixture_index(team, week)
+        team1_maps = int(self.team1_maps[week, position])
+        if team1_maps == self.UNPLAYED:
+            return None
+        names = self.schedule.team_names
+        return (names[fixture[0]], team1_maps, int(self.team2_maps[week, position]), names[fixture[1]])
+    
+    def week_results(self, week: int) -> list[tuple[str, int, int, str]]:
+        """Get every played result of a week, in schedule order.
+        
+        Args:
+            week: Week number (0-indexed).
+        
+        Returns:
+            List of (team1_name, team1_maps, team2_maps, team2_name) tuples.
+        """
+        names = self.schedule.team_names
+        team1_maps = self.team1_maps[week].tolist()
+        team2_maps = self.team2_maps[week].tolist()
+        results = []
+        for team1, team2 in self.round_robin.week_fixtures(week):
+            position = self.round_robin.fixture_index(team1, week)
+            if team1_maps[position] != self.UNPLAYED:
+                results.append((names[team1], team1_maps[position], team2_maps[position], names[team2]))
+        return results
+    
+    def team_results(self, team_name: str) -> list[tuple[int, tuple[str, int, int, str]]]:
+        """Get a team's played results this season, one O(1) lookup per week.
+        
+        Args:
+            team_name: Name of the team.
+        
+        Returns:
+            List of (week, result) pairs in week order.
+        """
+        results = []
+        for week in range(len(self.round_robin)):
+            result = self.get(week, team_name)
+            if result is not None:
+                results.append((week, result))
+        return results
+    
+    def head_to_head(self, team1_name: str, team2_name: str) -> list[tuple[int, tuple[str, int, int, str]]]:
+        """Get the played results between two teams in O(1).
+        
+        Args:
+            team1_name: Name of one team.
+            team2_name: Name of the other team.
+        
+        Returns:
+            List of (week, result) pairs in week order.
+        """
+        team1 = self.schedule.team_indices[team1_name]
+        team2 = self.schedule.team_indices[team2_name]
+        results = []
+        for week in self.round_robin.meeting_weeks(team1, team2):
+            result = self.get(week, team1_name)
+            if result is not None:
+                results.append((week, result))
+        return results
+    
+    def __iter__(self) -> Iterator[tuple[int, tuple[str, int, int, str]]]:
+        """Iterate over every played result as (week, result) pairs."""
+        played_weeks = np.flatnonzero((self.team1_maps != self.UNPLAYED).any(axis=1))
+        for week in played_weeks.tolist():
+            for result in self.week_results(week):
+                yield week, result
+
+
+class LeagueTable(Mapping):
+    """Maps every league name to a value built the first time it is looked up.
+    
+    Iterates in league order like a dictionary built up front would, but a
+    league nobody has asked about yet costs nothing.
+    """
+    
+    def __init__(self, world: WorldIndex, build: Callable[[int], object]):
+        """Initialize the table.
+        
+        Args:
+            world: WorldIndex of the leagues.
+            build: Function building a league's value from its index.
+        """
+        self.world = world
+        self.build = build
+        self._values = {}
+    
+    def __getitem__(self, league_name: str):
+        value = self._values.get(league_name)
+        if value is None:
+            position = self.world.league_position(league_name)
+            if position is None:
+                raise KeyError(league_name)
+            value = self.build(position)
+            self._values[league_name] = value
+        return value
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.world.league_names)
+    
+    def __len__(self) -> int:
+        return len(self.world)
+    
+    def built_items(self) -> list[tuple[str, object]]:
+        """Get the (league_name, value) pairs built so far, in league order."""
+        return [(name, self._values[name]) for name in self.world.league_names if name in self._values]
 
 
 class ScheduleManager:
-    """Handles round-robin schedule generation and display."""
+    """Handles round-robin schedule generation and display.
+    
+    A league's schedule and results store are built the first time the
+    league is looked up, so starting a season in a world with thousands of
+    leagues does not wait for all of them.
+    """
     
-    def __init__(self, leagues: list):
+    def __init__(self, leagues: list, double_round_robin: bool = False):
         """Initialize the schedule manager.
         
         Args:
-            leagues: List of league dictionaries from JSON.
+            leagues: List of league dictionaries from JSON, or a WorldIndex.
+            double_round_robin: Play every opponent twice, home and away.
         """
         self.leagues = leagues
+        self.double_round_robin = double_round_robin
+        self.world = WorldIndex.from_leagues(leagues)
         self.schedules = self._generate_all_schedules()
         self.results = self._initialize_results()
+        
+        # Every league size gives the same number of weeks, so only one
+        # round-robin per size is needed
+        team_counts = set(np.diff(self.world.offsets).tolist())
+        self._season_length = max(
+            (len(RoundRobin(team_count, double=double_round_robin)) for team_count in team_counts), default=0
+        )
+    
+    @property
+    def season_length(self) -> int:
+        """Number of weeks in the season (the longest league schedule)."""
+        return self._season_length
     
-    def _initialize_results(self) -> dict:
-        """Initialize results dictionary for tracking match outcomes.
+    def _initialize_results(self) -> LeagueTable:
+        """Initialize results stores for tracking match outcomes.
         
         Returns:
-            Dictionary mapping league names to week results.
+            LeagueTable mapping league names to ResultsStore objects.
         """
-        results = {}
-        for league in self.leagues:
-            results[league["name"]] = {}
-        return results
+        return LeagueTable(self.world, lambda position: ResultsStore(self.schedules[self.world.league_names[position]]))
     
-    def _generate_all_schedules(self) -> dict:
-        """Generate round-robin schedules for all leagues.
+    def _generate_all_schedules(self) -> LeagueTable:
+        """Set up round-robin schedules for all leagues.
         
         Returns:
-            Dictionary mapping league names to their schedules.
+            LeagueTable mapping league names to their schedules.
         """
-        schedules = {}
-        for league in self.leagues:
-            schedules[league["name"]] = self._generate_round_robin(league["teams"])
-        return schedules
+        return LeagueTable(self.world, lambda position: self._schedule_teams(self.world.team_names_of(position)))
     
-    def _generate_round_robin(self, teams_data: list) -> list:
+    def _generate_round_robin(self, teams_data: list) -> LeagueSchedule:
         """Generate a round-robin schedule for a league.
         
         Uses the standard rotation algorithm to create a balanced schedule
-        where each team plays every other team exactly once.
+        where each team plays every other team once (twice in a double
+        round-robin).
         
         Args:
             teams_data: List of team data dictionaries.
             
         Returns:
-            List of weeks, where each week is a list of matchups (team_name tuples).
+            LeagueSchedule of weeks, where each week is a list of matchups
+            (team_name tuples).
         """
-        team_names = [team["name"] for team in teams_data]
-        n = len(team_names)
+        return self._schedule_teams([team["name"] for team in teams_data])
+    
+    def _schedule_teams(self, team_names: list[str]) -> LeagueSchedule:
+        """Generate a round-robin schedule for a league's team names.
         
-        # Ensure even number of teams
-        if n % 2 == 1:
-            team_names.append("BYE")
-            n += 1
+        Args:
+            team_names: Names of the league's teams.
         
-        schedule = []
+        Returns:
+            LeagueSchedule over the teams.
+        """
+        return LeagueSchedule(team_names, RoundRobin(len(team_names), double=self.double_round_robin))
+    
+    def get_fixture(self, league_name: str, team_name: str, week: int) -> tuple[str, str] | None:
+        """Get a team's fixture in a week without scanning the schedule.
         
-        # Generate n-1 rounds (weeks)
-        for round_num in range(n - 1):
-            week_matches = []
-            
-            for i in range(n // 2):
-                # Calculate pairings using rotation algorithm
-                if i == 0:
-                    # First team vs last team (which rotates)
-                    team1 = team_names[0]
-                    team2 = team_names[n - 1]
-                else:
-                    # Other teams rotate around the circle
-                    team1 = team_names[i]
-                    team2 = team_names[n - 1 - i]
-                
-                if team1 != "BYE" and team2 != "BYE":
-                    week_matches.append((team1, team2))
-            
-            # Rotate teams for next round (keeping first team fixed)
-            if round_num < n - 2:
-                team_names = (
-                    [team_names[0]] + [team_names[-1]] + team_names[1:-1]
-                )
-            
-            schedule.append(week_matches)
+        Args:
+            league_name: Name of the league.
+            team_name: Name of the team.
+            week: Week number (0-indexed).
         
-        return schedule
+        Returns:
+            Tuple of (team1_name, team2_name), or None on a bye.
+        """
+        return self.schedules[league_name].fixture(team_name, week)
     
     def view_schedule(self) -> None:
         """Display schedule viewing interface."""
@@ -169,11 +573,10 @@ class ScheduleManager:
         table.add_column("Match", style="cyan")
         table.add_column("Result", style="green")
         
-        week_results = self.results[league_name].get(week_num, {})
+        results = self.results[league_name]
         
         for match_num, (team1, team2) in enumerate(matches, 1):
-            match_key = f"{team1}_vs_{team2}"
-            result_data = week_results.get(match_key)
+            result_data = results.get(week_num, team1)
             
             if result_data:
                 team1_name, team1_wins, team2_wins, team2_name = result_data
@@ -186,15 +589,100 @@ class ScheduleManager:
         console.print(table)
         input("\nPress Enter to continue...")
     
-    def store_week_results(self, league_name: str, week_num: int, results: dict) -> None:
+    def store_week_results(self, league_name: str, week_num: int, results: list) -> None:
         """Store the results for a week.
         
         Args:
             league_name: Name of the league.
             week_num: Week number (0-indexed).
-            results: Dictionary of match results {match_key: result_string}.
+            results: List of (team1_name, team1_wins, team2_wins, team2_name) tuples.
         """
-        if week_num not in self.results[league_name]:
-            self.results[league_name][week_num] = {}
-        self.results[league_name][week_num].update(results)
-
+        store = self.results[league_name]
+        for team1_name, team1_wins, team2_wins, team2_name in results:
+            store.record(week_num, team1_name, team2_name, team1_wins, team2_wins)
+    
+    def week_fixture_ids(self, week: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get every league's fixtures of a week as arrays, without building any schedule.
+        
+        Leagues of the same size share one RoundRobin, and a team's id is its
+        league's first id plus its index in the league.
+        
+        Args:
+            week: Week number (0-indexed).
+        
+        Returns:
+            Tuple of (leagues, team1_ids, team2_ids, positions): the league
+            position, home and away team ids and pairing position of every
+            fixture, by league and in schedule order within a league.
+        """
+        team_counts = np.diff(self.world.offsets)
+        columns = []
+        for team_count in np.unique(team_counts).tolist():
+            round_robin = RoundRobin(team_count, double=self.double_round_robin)
+            if week >= len(round_robin):
+                continue
+            home_teams, away_teams, positions = round_robin.week_pairings(week)
+            leagues = np.flatnonzero(team_counts == team_count)
+            first_ids = self.world.offsets[leagues][:, None]
+            columns.append((
+                np.repeat(leagues, len(positions)),
+                (first_ids + home_teams).ravel(),
+                (first_ids + away_teams).ravel(),
+                np.tile(positions, len(leagues))
+            ))
+        if not columns:
+            return tuple(np.zeros(0, dtype=np.int64) for _ in range(4))
+        
+        leagues, team1_ids, team2_ids, positions = (np.concatenate(column) for column in zip(*columns))
+        order = np.argsort(leagues, kind="stable")
+        return leagues[order], team1_ids[order], team2_ids[order], positions[order]
+    
+    def store_week_arrays(
+        self,
+        week: int,
+        leagues: np.ndarray,
+        positions: np.ndarray,
+        team1_maps: np.ndarray,
+        team2_maps: np.ndarray
+    ) -> None:
+        """Store a week's results in every league from week_fixture_ids arrays.
+        
+        Args:
+            week: Week number (0-indexed).
+            leagues: League position of each fixture, grouped by league.
+            positions: Pairing position of each fixture.
+            team1_maps: Maps won by each home team.
+            team2_maps: Maps won by each away team.
+        """
+        starts = np.flatnonzero(np.diff(leagues, prepend=-1))
+        ends = np.append(starts[1:], len(leagues))
+        league_names = self.world.league_names
+        for league, start, end in zip(leagues[starts].tolist(), starts.tolist(), ends.tolist()):
+            self.results[league_names[league]].record_positions(
+                week, positions[start:end], team1_maps[start:end], team2_maps[start:end]
+            )
+    
+    def get_team_results(self, league_name: str, team_name: str) -> list:
+        """Get a team's results this season without scanning other fixtures.
+        
+        Args:
+            league_name: Name of the league.
+            team_name: Name of the team.
+        
+        Returns:
+            List of (week, (team1_name, team1_wins, team2_wins, team2_name)) pairs.
+        """
+        return self.results[league_name].team_results(team_name)
+    
+    def get_head_to_head(self, league_name: str, team1_name: str, team2_name: str) -> list:
+        """Get the results between two teams this season.
+        
+        Args:
+            league_name: Name of the league.
+            team1_name: Name of one team.
+            team2_name: Name of the other team.
+        
+        Returns:
+            List of (week, (team1_name, team1_wins, team2_wins, team2_name)) pairs.
+        """
+        return self.results[league_name].head_to_head(team1_name, team2_name)
@@ -0,0 +1,298 @@
+"""Manager for batched, vectorized simulation of a whole week."""
+
+import numpy as np
+from core.map_odds import PROBABILITY_RESOLUTION, ROUNDS_TO_WIN, get_map_distribution
+from core.rng import RNGService
+from core.round_engine import PLAYERS_PER_TEAM, role_indices, simulate_maps
+from models.Match import MatchRecord
+from models.Player import ROLES
+from models.WeekResults import WeekResults
+from .match_manager import MatchManager
+from .rating_manager import RatingManager
+from .roster_manager import RosterManager
+from .schedule_manager import ScheduleManager
+
+# Round engine role index of each PlayerStore role code
+_ENGINE_ROLES = role_indices(ROLES)
+
+
+class SimulationManager:
+    """Simulates every fixture of a week across all leagues at once.
+    
+    Fixtures are taken from the schedule as team id arrays, round-win
+    probabilities come from the player store (or Elo), every map of a
+    league's series is drawn with one vectorized RNG call, and the results
+    are written to TeamRegistry.records and the ScheduleManager in bulk. No
+    Team model is built or updated per match, map results are not
+    materialized as MapResult objects and no Match is added to a
+    MatchManager history; the week comes back as array-backed WeekResults,
+    and MatchRecords with per-map scores are only built when asked for, e.g.
+    to store them. With the player engine, each league's maps are instead
+    played out in one vectorized core.round_engine call.
+    
+    Each league draws from its own ("batch", season, league, week) stream, so
+    a league's results do not depend on which other leagues are simulated.
+    Map names are drawn from it after the scores, so building MatchRecords
+    does not change the results.
+    """
+    
+    MAP_ENGINES = ("markov", "players")
+    
+    def __init__(
+        self,
+        roster_manager: RosterManager,
+        rng: RNGService | None = None,
+        map_engine: str = "markov",
+        rating_manager: RatingManager | None = None
+    ):
+        """Initialize the simulation manager.
+        
+        Args:
+            roster_manager: RosterManager whose registry holds the teams.
+            rng: RNGService to draw streams from; a freshly seeded one if None.
+            map_engine: "markov" samples every map score from its exact
+                distribution; "players" plays each league's maps with the
+                vectorized player engine (core.round_engine). MatchManager's
+                "rounds" engine has the same distribution as "markov" and is
+                simulated as such.
+            rating_manager: Optional RatingManager; when set, the "markov"
+                engine's round-win chances come from the teams' Elo ratings
+                instead of their rosters.
+        """
+        if map_engine == "rounds":
+            map_engine = "markov"
+        if map_engine not in self.MAP_ENGINES:
+            raise ValueError(f"Unknown map engine: {map_engine}")
+        self.roster_manager = roster_manager
+        self.rng = rng or RNGService()
+        self.map_engine = map_engine
+        self.rating_manager = rating_manager
+    
+    def simulate_week(
+        self,
+        schedule_manager: ScheduleManager,
+        week: int,
+        series_format: int = 3,
+        season: int = 1,
+        match_records: dict | None = None
+    ) -> WeekResults:
+        """Simulate all matches of a week in every league.
+        
+        Args:
+            schedule_manager: ScheduleManager with the season's schedules.
+            week: Week number (0-indexed).
+            series_format: Number of maps (3 or 5).
+            season: Season number, used to pick the random streams.
+            match_records: Optional dictionary to fill with a MatchRecord of
+                every series, keyed by (league_name, team1_name, team2_name)
+                like GameManager.week_matches.
+        
+        Returns:
+            WeekResults of every league, read like the dictionary
+            GameManager._simulate_week results are collected in.
+        """
+        registry = self.roster_manager.registry
+        leagues, team1_ids, team2_ids, positions = schedule_manager.week_fixture_ids(week)
+        if not len(leagues):
+            no_maps = np.zeros(0, dtype=np.int64)
+            return WeekResults(registry.world, leagues, team1_ids, team2_ids, no_maps, no_maps)
+        
+        # Each league's series are a contiguous run of the fixture arrays
+        starts = np.flatnonzero(np.diff(leagues, prepend=-1))
+        ends = np.append(starts[1:], len(leagues))
+        draws = []
+        map_scores = []
+        map_names = []
+        for league, start, end in zip(leagues[starts].tolist(), starts.tolist(), ends.tolist()):
+            generator = self.rng.generator("batch", season, registry.world.league_names[league], week)
+            if self.map_engine == "players":
+                ratings, roles = self._player_arrays(team1_ids[start:end], team2_ids[start:end], series_format)
+                map_scores.append(simulate_maps(ratings, roles, generator))
+            else:
+                draws.append(generator.random((end - start) * series_format))
+            if match_records is not None:
+                map_names.append(self._draw_map_names(end - start, series_format, generator))
+        
+        if self.map_engine == "players":
+            team1_scores = np.concatenate([team1_scores for team1_scores, _ in map_scores])
+            team2_scores = np.concatenate([team2_scores for _, team2_scores in map_scores])
+        else:
+            if self.rating_manager is not None:
+                team1_win_chance = self.rating_manager.round_win_chances(team1_ids, team2_ids)
+            else:
+                team1_ratings = registry.team_ratings(team1_ids)
+                total_ratings = team1_ratings + registry.team_ratings(team2_ids)
+                team1_win_chance = np.divide(
+                    team1_ratings, total_ratings,
+                    out=np.full(len(leagues), 0.5),
+                    where=total_ratings > 0
+                )
+            team1_scores, team2_scores = self._sample_map_scores(
+                np.repeat(team1_win_chance, series_format), np.concatenate(draws)
+            )
+        team1_maps, team2_maps = self._count_map_wins(team1_scores > team2_scores, series_format)
+        
+        if match_records is not None:
+            self._build_match_records(
+                match_records, (leagues, team1_ids, team2_ids), series_format, np.concatenate(map_names),
+                team1_scores, team2_scores, team1_maps + team2_maps
+            )
+        
+        registry.record_results(team1_ids, team2_ids, team1_maps, team2_maps)
+        schedule_manager.store_week_arrays(week, leagues, positions, team1_maps, team2_maps)
+        return WeekResults(registry.world, leagues, team1_ids, team2_ids, team1_maps, team2_maps)
+    
+    def _player_arrays(
+        self,
+        team1_ids: np.ndarray,
+        team2_ids: np.ndarray,
+        series_format: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Lay out the rosters of a batch of series for the player engine.
+        
+        Ratings and roles come straight from the registry's player store.
+        
+        Args:
+            team1_ids: Ids of the first teams.
+            team2_ids: Ids of the second teams.
+            series_format: Number of maps laid out per series.
+        
+        Returns:
+            Tuple of (ratings, roles) arrays of shape
+            (len(team1_ids) * series_format, 2, PLAYERS_PER_TEAM), like
+            core.round_engine.matchup_arrays.
+        """
+        store = self.roster_manager.registry.draw_players(np.concatenate([team1_ids, team2_ids]))
+        team1_ratings, team1_roles = store.rosters(team1_ids)
+        team2_ratings, team2_roles = store.rosters(team2_ids)
+        if team1_ratings.shape[1] != PLAYERS_PER_TEAM:
+            raise ValueError(f"The player engine needs {PLAYERS_PER_TEAM} players per team, got {team1_ratings.shape[1]}")
+        ratings = np.stack([team1_ratings, team2_ratings], axis=1).astype(np.float64)
+        roles = _ENGINE_ROLES[np.stack([team1_roles, team2_roles], axis=1)]
+        return np.repeat(ratings, series_format, axis=0), np.repeat(roles, series_format, axis=0)
+    
+    def _draw_map_names(self, n_series: int, series_format: int, generator: np.random.Generator) -> np.ndarray:
+        """Draw the maps of a batch of series, each without repeats.
+        
+        Args:
+            n_series: Number of series.
+            series_format: Number of maps per series (3 or 5).
+            generator: NumPy generator to draw from.
+        
+        Returns:
+            Array of indices into MatchManager.VALORANT_MAPS, one row per series.
+        """
+        keys = generator.random((n_series, len(MatchManager.VALORANT_MAPS)))
+        return np.argsort(keys, axis=1)[:, :series_format]
+    
+    def _build_match_records(
+        self,
+        match_records: dict,
+        fixtures: tuple[np.ndarray, np.ndarray, np.ndarray],
+        series_format: int,
+        map_names: np.ndarray,
+        team1_scores: np.ndarray,
+        team2_scores: np.ndarray,
+        maps_played: np.ndarray
+    ) -> None:
+        """Turn a week's vectorized map scores into MatchRecords.
+        
+        Args:
+            match_records: Dictionary to fill, keyed by (league_name,
+                team1_name, team2_name).
+            fixtures: Tuple of (leagues, team1_ids, team2_ids) arrays.
+            series_format: Number of maps (3 or 5).
+            map_names: Map indices, one row per series.
+            team1_scores: Round scores of team1, series_format per series.
+            team2_scores: Round scores of team2, in the same layout.
+            maps_played: Number of maps each series lasted.
+        """
+        world = self.roster_manager.registry.world
+        names = MatchManager.VALORANT_MAPS
+        leagues, team1_ids, team2_ids = fixtures
+        for league, team1_id, team2_id, series_maps, series_team1, series_team2, played in zip(
+            leagues.tolist(),
+            team1_ids.tolist(),
+            team2_ids.tolist(),
+            map_names.tolist(),
+            team1_scores.reshape(-1, series_format).tolist(),
+            team2_scores.reshape(-1, series_format).tolist(),
+            maps_played.tolist()
+        ):
+            record = MatchRecord(team1_id, team2_id, series_format)
+            for map_index, team1_score, team2_score in zip(series_maps[:played], series_team1, series_team2):
+                record.add_map(names[map_index], team1_score, team2_score)
+            match_records[(world.league_names[league], world.team_names[team1_id], world.team_names[team2_id])] = record
+    
+    def _count_map_wins(self, team1_won: np.ndarray, series_format: int) -> tuple[np.ndarray, np.ndarray]:
+        """Count the maps each team won in a batch of series.
+        
+        Maps after a series was already decided are discarded.
+        
+        Args:
+            team1_won: Whether team1 won each map slot, series_format per series.
+            series_format: Number of maps (3 or 5).
+        
+        Returns:
+            Tuple of (team1_map_wins, team2_map_wins) arrays.
+        """
+        maps_to_win = (series_format // 2) + 1
+        team1_won = team1_won.reshape(-1, series_format)
+        
+        team1_running = np.cumsum(team1_won, axis=1)
+        team2_running = np.cumsum(~team1_won, axis=1)
+        decided = np.maximum(team1_running, team2_running) >= maps_to_win
+        played = np.ones_like(team1_won)
+        played[:, 1:] = ~decided[:, :-1]
+        
+        team1_maps = (team1_won & played).sum(axis=1)
+        team2_maps = (~team1_won & played).sum(axis=1)
+        return team1_maps, team2_maps
+    
+    def _sample_map_scores(self, team1_win_chance: np.ndarray, u: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Sample final map scores from the exact score distributions.
+        
+        Vectorized counterpart of MapScoreDistribution.sample: one uniform draw
+        per map, inverted through the regulation CDF or the overtime tail.
+        
+        Args:
+            team1_win_chance: Round-win probability for team1, one per map.
+            u: Uniform draw for each map.
+        
+        Returns:
+            Tuple of (team1_scores, team2_scores) arrays.
+        """
+        keys = np.clip(np.rint(team1_win_chance * PROBABILITY_RESOLUTION), 0, PROBABILITY_RESOLUTION).astype(np.int64)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        distributions = [get_map_distribution(key / PROBABILITY_RESOLUTION) for key in unique_keys.tolist()]
+        
+        cdf = np.array([d.cdf for d in distributions])[inverse]
+        overtime = np.array([d.overtime_probability for d in distributions])[inverse]
+        regulation_scores = np.array(distributions[0].scores)
+        
+        idx = (cdf <= u[:, None]).sum(axis=1)
+        n_outcomes = len(regulation_scores)
+        
+        # Rounding can leave u past the CDF when no overtime is possible.
+        no_overtime = (idx == n_outcomes) & (overtime == 0)
+        idx[no_overtime] = (cdf[no_overtime] < cdf[no_overtime, -1:]).sum(axis=1)
+        in_regulation = idx < n_outcomes
+        
+        scores = regulation_scores[np.minimum(idx, n_outcomes - 1)]
+        team1_scores = scores[:, 0].copy()
+        team2_scores = scores[:, 1].copy()
+        
+        ot = ~in_regulation
+        if ot.any():
+            p = keys[ot] / PROBABILITY_RESOLUTION
+            split = 2.0 * p * (1.0 - p)
+            u_ot = np.clip((u[ot] - cdf[ot, -1]) / overtime[ot], 0.0, np.nextafter(1.0, 0.0))
+            extra_pairs = np.floor(np.log1p(-u_ot) / np.log(split)).astype(np.int64)
+            reached = split**extra_pairs
+            remainder = (u_ot - (1.0 - reached)) / reached
+            base = ROUNDS_TO_WIN - 1 + extra_pairs
+            team1_takes = remainder < p * p
+            team1_scores[ot] = np.where(team1_takes, base + 2, base)
+            team2_scores[ot] = np.where(team1_takes, base, base + 2)
+        
+        return team1_scores, team2_scores
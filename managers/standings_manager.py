@@ -1,7 +1,96 @@
 """Manager for displaying league standings."""
 
+import bisect
+import threading
 from rich.table import Table
 from core.console import console
+from core.profiling import phase, timed
+from models.Team import Team
+
+
+class StandingsIndex:
+    """Keeps one league's teams in standings order as their records change.
+    
+    Each team has a key of (-wins, -map differential, roster position), the
+    same ordering StandingsManager._sort_standings produces. Keys are held in
+    a sorted list that is patched in place whenever a team reports a record
+    change, so ranks are found by binary search without re-sorting.
+    
+    Updates and reads are serialized by a lock, so the index can be read
+    while another thread is simulating the league.
+    """
+    
+    def __init__(self, teams: list):
+        """Build the index and subscribe to record changes.
+        
+        Args:
+            teams: List of Team objects in roster order.
+        """
+        self.teams = list(teams)
+        self._positions = {team.name: idx for idx, team in enumerate(self.teams)}
+        self._lock = threading.Lock()
+        
+        # Subscribe before reading the records: a change that lands in
+        # between waits for the lock and then finds its key already current.
+        with self._lock:
+            for team in self.teams:
+                team.add_listener(self._on_record_change)
+            self._keys = {team.name: self._key(team) for team in self.teams}
+            self._order = sorted(self._keys.values())
+    
+    def close(self) -> None:
+        """Unsubscribe from the teams' record changes; the index stops updating."""
+        with self._lock:
+            for team in self.teams:
+                team.remove_listener(self._on_record_change)
+    
+    def _key(self, team: Team) -> tuple[int, int, int]:
+        """Get the sort key for a team's current record."""
+        return (-team.wins, -(team.maps_won - team.maps_lost), self._positions[team.name])
+    
+    def _on_record_change(self, team: Team) -> None:
+        """Move a team to its new place after its record changed."""
+        with self._lock:
+            old_key = self._keys[team.name]
+            new_key = self._key(team)
+            if new_key == old_key:
+                return
+            
+            del self._order[bisect.bisect_left(self._order, old_key)]
+            bisect.insort(self._order, new_key)
+            self._keys[team.name] = new_key
+    
+    def rank(self, team: Team) -> int:
+        """Get a team's current rank.
+        
+        Args:
+            team: Team in this league.
+            
+        Returns:
+            Rank number starting at 1.
+        """
+        with self._lock:
+            return bisect.bisect_left(self._order, self._keys[team.name]) + 1
+    
+    def top(self, k: int) -> list:
+        """Get the top teams in standings order.
+        
+        Args:
+            k: Number of teams to return.
+            
+        Returns:
+            List of up to k Team objects.
+        """
+        with self._lock:
+            return [self.teams[key[2]] for key in self._order[:k]]
+    
+    def sorted_teams(self) -> list:
+        """Get every team in standings order.
+        
+        Returns:
+            Sorted list of teams.
+        """
+        return self.top(len(self._order))
 
 
 class StandingsManager:
@@ -16,6 +105,51 @@ class StandingsManager:
         """
         self.leagues = leagues
         self.roster_manager = roster_manager
+        self.indexes = {}  # League name -> StandingsIndex, built on first use
+    
+    def get_index(self, league_name: str) -> StandingsIndex:
+        """Get the standings index for a league.
+        
+        Args:
+            league_name: Name of the league.
+            
+        Returns:
+            StandingsIndex kept up to date with the league's team records.
+        """
+        if league_name not in self.indexes:
+            with phase("standings_index"):
+                self.indexes[league_name] = StandingsIndex(self.roster_manager.teams_by_league[league_name])
+        return self.indexes[league_name]
+    
+    def reset_indexes(self) -> None:
+        """Close every standings index so they are rebuilt from the current records on next use."""
+        for index in self.indexes.values():
+            index.close()
+        self.indexes.clear()
+    
+    def get_rank(self, league_name: str, team: Team) -> int:
+        """Get a team's current rank in its league.
+        
+        Args:
+            league_name: Name of the league.
+            team: Team in that league.
+            
+        Returns:
+            Rank number starting at 1.
+        """
+        return self.get_index(league_name).rank(team)
+    
+    def get_top_teams(self, league_name: str, k: int) -> list:
+        """Get the top teams of a league in standings order.
+        
+        Args:
+            league_name: Name of the league.
+            k: Number of teams to return.
+            
+        Returns:
+            List of up to k Team objects.
+        """
+        return self.get_index(league_name).top(k)
     
     def view_standings(self) -> None:
         """Display standings viewing interface with region selection."""
@@ -56,11 +190,8 @@ class StandingsManager:
         Args:
             league_name: Name of the league.
         """
-        # Get teams in league
-        teams = self.roster_manager.teams_by_league[league_name]
-        
-        # Sort teams by record and map differential
-        sorted_teams = self._sort_standings(teams)
+        # Teams sorted by record and map differential
+        sorted_teams = self.get_index(league_name).sorted_teams()
         
         # Create standings table
         console.print()  # Add spacing
@@ -88,6 +219,7 @@ class StandingsManager:
         console.print(table)
         input("\nPress Enter to continue...")
     
+    @timed("standings_sort")
     def _sort_standings(self, teams: list) -> list:
         """Sort teams by wins/losses, then by map differential.
         
@@ -0,0 +1,234 @@
+"""Manager for persisting match history and careers to SQLite."""
+
+from typing import Iterator
+from sqlite_utils import Database
+from models.Match import MatchRecord
+
+
+class StorageManager:
+    """Stores match results and season history in a SQLite database.
+    
+    Each week is written in a single transaction, the database runs in WAL
+    mode, and reads are generators over indexed queries so history is only
+    loaded as it is consumed.
+    
+    Every career written to the database gets its own run id, so several
+    games can share one file without their seasons colliding; reads only see
+    the current run unless another one is asked for.
+    """
+    
+    def __init__(self, db_path: str = "data/history.db", run: int | None = None):
+        """Open (or create) the history database.
+        
+        Args:
+            db_path: Path to the SQLite file.
+            run: Id of the run to write to; a new run if None.
+        """
+        self.db = Database(db_path)
+        self.db.enable_wal()
+        self._create_tables()
+        
+        row = next(self.db.query("SELECT MAX(id) AS max_id FROM matches"))
+        self._next_match_id = (row["max_id"] or 0) + 1
+        self.run = run if run is not None else self._new_run_id()
+    
+    def _new_run_id(self) -> int:
+        """Get the next unused run id."""
+        row = next(self.db.query(
+            "SELECT MAX(run) AS max_run FROM (SELECT run FROM matches UNION ALL SELECT run FROM seasons)"
+        ))
+        return (row["max_run"] or 0) + 1
+    
+    def _create_tables(self) -> None:
+        """Create the tables and indexes if they do not exist yet."""
+        if not self.db["matches"].exists():
+            self.db["matches"].create({
+                "id": int,
+                "run": int,
+                "season": int,
+                "week": int,
+                "league": str,
+                "team1": str,
+                "team2": str,
+                "team1_maps": int,
+                "team2_maps": int,
+                "winner": str,
+            }, pk="id")
+            self.db["matches"].create_index(["run", "season", "week", "league"])
+            self.db["matches"].create_index(["team1", "run", "season"])
+            self.db["matches"].create_index(["team2", "run", "season"])
+        
+        if not self.db["maps"].exists():
+            self.db["maps"].create({
+                "match_id": int,
+                "map_number": int,
+                "map_name": str,
+                "team1_score": int,
+                "team2_score": int,
+                "winner": str,
+            }, pk=("match_id", "map_number"), foreign_keys=[("match_id", "matches", "id")])
+        
+        if not self.db["seasons"].exists():
+            self.db["seasons"].create({
+                "run": int,
+                "season": int,
+                "team": str,
+                "wins": int,
+                "losses": int,
+                "maps_won": int,
+                "maps_lost": int,
+                "rank": int,
+            }, pk=("run", "season", "team"))
+    
+    def resume_run(self, run: int, season: int, week: int) -> None:
+        """Continue writing an earlier run from a point in its career.
+        
+        Rows the run wrote from that point on (e.g. weeks played after the
+        save being resumed was written) are deleted, so they are not stored
+        twice when the weeks are played again.
+        
+        Args:
+            run: Id of the run to continue.
+            season: Season the game resumes in.
+            week: Week (0-indexed) the game resumes at.
+        """
+        self.run = run
+        later = "run = :run AND (season > :season OR (season = :season AND week >= :week))"
+        params = {"run": run, "season": season, "week": week}
+        with self.db.conn:
+            self.db.conn.execute(f"DELETE FROM maps WHERE match_id IN (SELECT id FROM matches WHERE {later})", params)
+            self.db.conn.execute(f"DELETE FROM matches WHERE {later}", params)
+            self.db.conn.execute("DELETE FROM seasons WHERE run = :run AND season >= :season", params)
+    
+    def record_week(
+        self,
+        season: int,
+        week: int,
+        all_results: dict,
+        matches: dict[tuple[str, str], MatchRecord] | None = None
+    ) -> None:
+        """Store every match of a week in one transaction.
+        
+        Args:
+            season: Season number.
+            week: Week number (0-indexed).
+            all_results: Dictionary of results by league, as returned by
+                GameManager.play_week.
+            matches: Optional match records for the week keyed by
+                (league_name, team1_name, team2_name); their map results are
+                stored alongside the series results.
+        """
+        matches = matches or {}
+        match_rows = []
+        map_rows = []
+        for league_name, results in all_results.items():
+            for team1_name, team1_wins, team2_wins, team2_name in results:
+                match_id = self._next_match_id
+                self._next_match_id += 1
+                winner = team1_name if team1_wins > team2_wins else team2_name
+                match_rows.append((match_id, self.run, season, week, league_name, team1_name, team2_name, team1_wins, team2_wins, winner))
+                
+                record = matches.get((league_name, team1_name, team2_name))
+                if record is not None:
+                    map_scores = zip(record.map_names, record.team1_scores, record.team2_scores)
+                    for map_number, (map_name, team1_score, team2_score) in enumerate(map_scores, 1):
+                        map_winner = team1_name if team1_score > team2_score else team2_name
+                        map_rows.append((match_id, map_number, map_name, team1_score, team2_score, map_winner))
+        
+        with self.db.conn:
+            self.db.conn.executemany(
+                "INSERT INTO matches (id, run, season, week, league, team1, team2, team1_maps, team2_maps, winner) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                match_rows
+            )
+            self.db.conn.executemany(
+                "INSERT INTO maps (match_id, map_number, map_name, team1_score, team2_score, winner) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                map_rows
+            )
+    
+    def record_season(self, season: int, team_name: str, record: dict) -> None:
+        """Store a team's final record for a season.
+        
+        Args:
+            season: Season number.
+            team_name: Name of the team.
+            record: Dictionary with wins, losses, maps_won, maps_lost and rank.
+        """
+        self.db["seasons"].upsert(
+            {"run": self.run, "season": season, "team": team_name, **record}, pk=("run", "season", "team")
+        )
+    
+    def iter_matches(
+        self,
+        season: int | None = None,
+        week: int | None = None,
+        league: str | None = None,
+        team: str | None = None,
+        run: int | None = None
+    ) -> Iterator[dict]:
+        """Iterate over stored matches, optionally filtered.
+        
+        Args:
+            season: Only matches from this season.
+            week: Only matches from this week (0-indexed).
+            league: Only matches from this league.
+            team: Only matches this team played in.
+            run: Only matches from this run; the current run if None.
+        
+        Yields:
+            Match rows as dictionaries, in the order they were played.
+        """
+        where = ["run = :run"]
+        params = {"run": self.run if run is None else run}
+        for column, value in (("season", season), ("week", week), ("league", league)):
+            if value is not None:
+                where.append(f"{column} = :{column}")
+                params[column] = value
+        
+        if team is None:
+            sql = "SELECT * FROM matches WHERE " + " AND ".join(where)
+        else:
+            # One indexed query per team column instead of an OR scan
+            params["team"] = team
+            filters = "".join(f" AND {clause}" for clause in where)
+            sql = (
+                f"SELECT * FROM matches WHERE team1 = :team{filters} "
+                f"UNION ALL SELECT * FROM matches WHERE team2 = :team{filters}"
+            )
+        yield from self.db.query(sql + " ORDER BY id", params)
+    
+    def iter_maps(self, match_id: int) -> Iterator[dict]:
+        """Iterate over the stored maps of a match.
+        
+        Args:
+            match_id: Id of the match row.
+        
+        Yields:
+            Map rows as dictionaries, in the order they were played.
+        """
+        yield from self.db.query(
+            "SELECT * FROM maps WHERE match_id = ? ORDER BY map_number", [match_id]
+        )
+    
+    def get_season_history(self, team_name: str, run: int | None = None) -> dict:
+        """Load a team's season-by-season records.
+        
+        Args:
+            team_name: Name of the team.
+            run: Run to read; the current run if None.
+        
+        Returns:
+            Dictionary mapping season numbers to record dictionaries.
+        """
+        return {
+            row["season"]: {key: row[key] for key in ("wins", "losses", "maps_won", "maps_lost", "rank")}
+            for row in self.db.query(
+                "SELECT * FROM seasons WHERE run = ? AND team = ? ORDER BY season",
+                [self.run if run is None else run, team_name]
+            )
+        }
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self.db.conn.close()
@@ -0,0 +1,350 @@
+"""Shared registry of every team in every league."""
+
+from typing import Iterator, Mapping
+import numpy as np
+from core.profiling import phase
+from core.rng import RNGService
+from models.Player import ROLES
+from models.PlayerStore import PlayerStore
+from models.RosterGenerator import RosterGenerator
+from models.Team import RECORD_FIELDS, TEAM_RATING_WEIGHTS, TEAM_RATINGS, Team
+from models.WorldIndex import WorldIndex
+
+
+class TeamRegistry(Mapping):
+    """Maps league names to their Team objects, building teams on demand.
+    
+    Only names and ids are indexed up front, in a WorldIndex. Every player's
+    rating, role and age is kept in one PlayerStore, ``players``, which is
+    the source of truth for them. A league's rosters are drawn into the store
+    in one RosterGenerator batch the first time they are needed, and its Team
+    and Player models are built over those rows the first time any of its
+    teams is looked up (get_team, get_team_by_id or registry[league_name]).
+    The same objects are returned from then on, so every manager sharing the
+    registry sees the same teams. Each league draws from its own ("roster",
+    league) stream, so the order leagues are drawn in does not change them.
+    
+    Players of built teams are views of their store rows: assigning a
+    rating, role or age writes through to the store, and bulk changes to the
+    store are copied into them with refresh_players. Replacing a team's
+    ``players`` list detaches it from the store.
+    
+    Team records work the same way: ``records`` holds every team's wins,
+    losses, maps won and maps lost (columns in RECORD_FIELDS order), built
+    teams write their changes through to it, and bulk updates such as
+    record_results are copied into built teams only.
+    """
+    
+    def __init__(
+        self,
+        leagues: list,
+        rng: RNGService | None = None,
+        roster_generator: RosterGenerator | None = None,
+        team_rating: str = "mean"
+    ):
+        """Index the teams of every league.
+        
+        Args:
+            leagues: List of league dictionaries from JSON, or a WorldIndex.
+            rng: RNGService rosters are drawn from; a freshly seeded one if None.
+            roster_generator: RosterGenerator that builds the rosters; uniform
+                ratings if None.
+            team_rating: How a team's strength is computed from its roster; a
+                key of models.Team.TEAM_RATINGS.
+        """
+        if team_rating not in TEAM_RATINGS:
+            raise ValueError(f"Unknown team rating: {team_rating}")
+        self.leagues = leagues
+        self.team_rating = team_rating
+        self.world = WorldIndex.from_leagues(leagues)  # Ids are assigned in league order
+        self.rng = rng or RNGService()
+        self.roster_generator = roster_generator or RosterGenerator()
+        
+        self.players = PlayerStore.empty(np.full(self.world.team_count, self.roster_generator.players_per_team))
+        self.records = np.zeros((self.world.team_count, len(RECORD_FIELDS)), dtype=np.int64)
+        
+        self._teams = [None] * self.world.team_count
+        self._league_teams = {}
+        self._drawn = np.zeros(len(self.world), dtype=bool)  # League rosters present in the store
+        self._built = np.zeros(self.world.team_count, dtype=bool)  # Teams with Team and Player models
+    
+    def __getitem__(self, league_name: str) -> list[Team]:
+        teams = self._league_teams.get(league_name)
+        if teams is None:
+            position = self.world.league_position(league_name)
+            if position is None:
+                raise KeyError(league_name)
+            teams = [self.get_team_by_id(team_id) for team_id in self.world.league_team_ids(position)]
+            self._league_teams[league_name] = teams
+        return teams
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.world.league_names)
+    
+    def __len__(self) -> int:
+        return len(self.world)
+    
+    @property
+    def team_count(self) -> int:
+        """Number of teams across all leagues."""
+        return self.world.team_count
+    
+    def get_team_by_id(self, team_id: int) -> Team:
+        """Get a team by id, building its league's rosters on first access.
+        
+        Args:
+            team_id: Id of the team.
+        
+        Returns:
+            The shared Team object.
+        """
+        team = self._teams[team_id]
+        if team is None:
+            self._build_league(self.world.league_of(team_id))
+            team = self._teams[team_id]
+        return team
+    
+    def _build_league(self, position: int) -> None:
+        """Build every team of a league and its roster over the store's rows.
+        
+        Args:
+            position: Index of the league in the world.
+        """
+        with phase("roster_build"):
+            self._draw_league(position)
+            team_ids = self.world.league_team_ids(position)
+            rows = self.players.team_players(team_ids.start, team_ids.stop)
+            shape = (len(team_ids), -1)
+            teams = self.roster_generator.build(
+                self.world.team_names_of(position),
+                list(team_ids),
+                self.players.ratings[rows].reshape(shape),
+                self.players.roles[rows].reshape(shape),
+                self.players.ages[rows].reshape(shape)
+            )
+            player_id = rows.start
+            for team, record in zip(teams, self.records[team_ids.start:team_ids.stop].tolist()):
+                if self.team_rating != "mean":
+                    team.set_strength_function(TEAM_RATINGS[self.team_rating])
+                team.set_record(*record)
+                team.bind_records(self.records)
+                for player in team.players:
+                    player.bind(self.players, player_id)
+                    player_id += 1
+                self._teams[team.id] = team
+            self._built[team_ids.start:team_ids.stop] = True
+    
+    def _draw_league(self, position: int) -> None:
+        """Draw a league's rosters into the store, unless they already are.
+        
+        Args:
+            position: Index of the league in the world.
+        """
+        if self._drawn[position]:
+            return
+        team_ids = self.world.league_team_ids(position)
+        ratings, roles, ages = self.roster_generator.draw(
+            len(team_ids), self.rng.generator("roster", self.world.league_names[position])
+        )
+        self.players.fill_teams(team_ids.start, ratings, roles, ages)
+        self._drawn[position] = True
+    
+    def draw_all_players(self) -> PlayerStore:
+        """Fill the store with every league's rosters, without building any models.
+        
+        Returns:
+            The complete PlayerStore.
+        """
+        with phase("roster_draw"):
+            for position in np.flatnonzero(~self._drawn).tolist():
+                self._draw_league(position)
+        return self.players
+    
+    def draw_players(self, team_ids: np.ndarray) -> PlayerStore:
+        """Make sure the store holds some teams' rosters, without building any models.
+        
+        Args:
+            team_ids: Ids of the teams.
+        
+        Returns:
+            The PlayerStore, with those teams' rows drawn.
+        """
+        positions = np.unique(np.searchsorted(self.world.offsets, team_ids, side="right") - 1)
+        missing = positions[~self._drawn[positions]].tolist()
+        if missing:
+            with phase("roster_draw"):
+                for position in missing:
+                    self._draw_league(position)
+        return self.players
+    
+    def team_ratings(self, team_ids: np.ndarray) -> np.ndarray:
+        """Get the strength of several teams straight from the player store.
+        
+        The same values Team.get_team_rating gives, computed as column
+        operations without building any Team models.
+        
+        Args:
+            team_ids: Ids of the teams.
+        
+        Returns:
+            Array of team strengths in the same order.
+        """
+        return self.draw_players(team_ids).team_ratings(team_ids, TEAM_RATING_WEIGHTS[self.team_rating])
+    
+    def load_players(self, ratings: np.ndarray, roles: np.ndarray, ages: np.ndarray) -> None:
+        """Replace every player's columns, e.g. from a save file.
+        
+        Args:
+            ratings: Rating of every player, by player id.
+            roles: Role code of every player.
+            ages: Age of every player.
+        """
+        if len(ratings) != len(self.players):
+            raise ValueError(f"Expected {len(self.players)} players, got {len(ratings)}")
+        self.players.ratings[:] = ratings
+        self.players.roles[:] = roles
+        self.players.ages[:] = ages
+        self._drawn[:] = True
+        self.refresh_players()
+    
+    def refresh_players(self, player_ids: np.ndarray | None = None) -> None:
+        """Copy store values into the Player views that have been built.
+        
+        Only fields that differ are assigned, so rating listeners fire for
+        real changes only. Players of teams that were never built are skipped;
+        their models will be built from the store when first looked up.
+        
+        Args:
+            player_ids: Ids of the players whose rows changed; every player
+                if None.
+        """
+        store = self.players
+        if player_ids is None:
+            player_ids = np.flatnonzero(self._built[store.teams])
+        else:
+            player_ids = np.asarray(player_ids, dtype=np.int64)
+            player_ids = player_ids[self._built[store.teams[player_ids]]]
+        team_ids = store.teams[player_ids]
+        for team_id, slot, rating, role, age in zip(
+            team_ids.tolist(),
+            (player_ids - store.offsets[team_ids]).tolist(),
+            store.ratings[player_ids].tolist(),
+            store.roles[player_ids].tolist(),
+            store.ages[player_ids].tolist()
+        ):
+            player = self._teams[team_id].players[slot]
+            if player.rating != rating:
+                player.rating = rating
+            if player.role != ROLES[role]:
+                player.role = ROLES[role]
+            if player.age != age:
+                player.age = age
+    
+    def record_results(
+        self,
+        team1_ids: np.ndarray,
+        team2_ids: np.ndarray,
+        team1_maps: np.ndarray,
+        team2_maps: np.ndarray
+    ) -> None:
+        """Add a batch of series results to the team records.
+        
+        The records array is updated in place, so a team may appear in
+        several series; only built teams are then refreshed.
+        
+        Args:
+            team1_ids: Ids of the first teams.
+            team2_ids: Ids of the second teams.
+            team1_maps: Maps won by each first team.
+            team2_maps: Maps won by each second team.
+        """
+        team1_won = np.asarray(team1_maps) > np.asarray(team2_maps)
+        team_ids = np.concatenate([team1_ids, team2_ids])
+        changes = np.column_stack((
+            np.concatenate([team1_won, ~team1_won]),
+            np.concatenate([~team1_won, team1_won]),
+            np.concatenate([team1_maps, team2_maps]),
+            np.concatenate([team2_maps, team1_maps])
+        ))
+        np.add.at(self.records, team_ids, changes)
+        self.refresh_records(team_ids)
+    
+    def set_records(self, team_ids: np.ndarray, records: np.ndarray) -> None:
+        """Replace some teams' records, e.g. from a save file.
+        
+        Args:
+            team_ids: Ids of the teams.
+            records: One row of RECORD_FIELDS values per team.
+        """
+        self.records[team_ids] = records
+        self.refresh_records(team_ids)
+    
+    def reset_records(self) -> None:
+        """Reset every team's record for a new season."""
+        self.records[:] = 0
+        self.refresh_records()
+    
+    def refresh_records(self, team_ids: np.ndarray | None = None) -> None:
+        """Copy records into the Team views that have been built.
+        
+        Each refreshed team notifies its listeners once. Teams that were never
+        built are skipped; they read their record when first looked up.
+        
+        Args:
+            team_ids: Ids of the teams whose records changed; every team if None.
+        """
+        if team_ids is None:
+            team_ids = np.flatnonzero(self._built)
+        else:
+            team_ids = np.unique(np.asarray(team_ids, dtype=np.int64))
+            team_ids = team_ids[self._built[team_ids]]
+        for team_id, record in zip(team_ids.tolist(), self.records[team_ids].tolist()):
+            self._teams[team_id].set_record(*record)
+    
+    def get_team(self, team_name: str, league_name: str | None = None) -> Team | None:
+        """Get a team by name, building it and its roster on first access.
+        
+        Team names are only unique within a league, so fixtures and results
+        are resolved with their league; without one, the last team of that
+        name in the world is returned.
+        
+        Args:
+            team_name: Name of the team (case-insensitive).
+            league_name: League to look the team up in; every league if None.
+        
+        Returns:
+            The shared Team object, or None if no team has that name.
+        """
+        if league_name is None:
+            team_id = self.world.team_id(team_name)
+        else:
+            position = self.world.league_position(league_name)
+            team_id = None if position is None else self.world.league_team_id(position, team_name)
+        if team_id is None:
+            return None
+        return self.get_team_by_id(team_id)
+    
+    def league_of(self, team_name: str) -> str | None:
+        """Get the name of the league a team plays in.
+        
+        Args:
+            team_name: Name of the team (case-insensitive).
+        
+        Returns:
+            League name, or None if no team has that name.
+        """
+        team_id = self.world.team_id(team_name)
+        if team_id is None:
+            return None
+        return self.league_of_id(team_id)
+    
+    def league_of_id(self, team_id: int) -> str:
+        """Get the name of the league a team plays in by its id.
+        
+        Args:
+            team_id: Id of the team.
+        
+        Returns:
+            League name.
+        """
+        return self.world.league_names[self.world.league_of(team_id)]
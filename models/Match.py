@@ -1,6 +1,6 @@
 """Match model for storing match data and results."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from .Team import Team
 
 
@@ -20,11 +20,18 @@ class Match(BaseModel):
     maps: list[MapResult] = Field(default_factory=list)
     winner: str = ""  # Name of the team that won the match
     completed: bool = False
+    _team1_wins: int = PrivateAttr(default=0)
+    _team2_wins: int = PrivateAttr(default=0)
     
     class Config:
         """Pydantic config."""
         arbitrary_types_allowed = True
     
+    def model_post_init(self, context) -> None:
+        """Count map wins for any maps passed in at construction."""
+        self._team1_wins = sum(1 for m in self.maps if m.winner == self.team1.name)
+        self._team2_wins = sum(1 for m in self.maps if m.winner == self.team2.name)
+    
     def add_map_result(self, map_result: MapResult) -> None:
         """Add a map result to the match.
         
@@ -32,19 +39,20 @@ class Match(BaseModel):
             map_result: MapResult object with scores and winner.
         """
         self.maps.append(map_result)
+        if map_result.winner == self.team1.name:
+            self._team1_wins += 1
+        elif map_result.winner == self.team2.name:
+            self._team2_wins += 1
         self._check_match_complete()
     
     def _check_match_complete(self) -> None:
         """Check if the match is complete based on map wins."""
         maps_to_win = (self.series_format // 2) + 1
         
-        team1_wins = sum(1 for m in self.maps if m.winner == self.team1.name)
-        team2_wins = sum(1 for m in self.maps if m.winner == self.team2.name)
-        
-        if team1_wins >= maps_to_win:
+        if self._team1_wins >= maps_to_win:
             self.winner = self.team1.name
             self.completed = True
-        elif team2_wins >= maps_to_win:
+        elif self._team2_wins >= maps_to_win:
             self.winner = self.team2.name
             self.completed = True
     
@@ -54,7 +62,131 @@ class Match(BaseModel):
         Returns:
             Tuple of (team1_map_wins, team2_map_wins).
         """
-        team1_wins = sum(1 for m in self.maps if m.winner == self.team1.name)
-        team2_wins = sum(1 for m in self.maps if m.winner == self.team2.name)
-        return (team1_wins, team2_wins)
+        return (self._team1_wins, self._team2_wins)
+    
+    def to_record(self) -> "MatchRecord":
+        """Get a compact, ID-based copy of the match.
+        
+        Returns:
+            MatchRecord referencing the teams by id.
+        """
+        record = MatchRecord(self.team1.id, self.team2.id, self.series_format)
+        for m in self.maps:
+            record.add_map(m.map_name, m.team1_score, m.team2_score)
+        return record
 
+
+class MatchRecord:
+    """Compact record of a series that references teams by integer id.
+    
+    Used on the simulation hot path instead of Match: no validation, no Team
+    references, and map wins are kept as running counters so completion and
+    series score checks are O(1). Convert with to_match() when a full Match
+    model is needed.
+    """
+    
+    __slots__ = (
+        "team1_id", "team2_id", "series_format", "map_names",
+        "team1_scores", "team2_scores", "team1_map_wins", "team2_map_wins", "completed"
+    )
+    
+    def __init__(self, team1_id: int, team2_id: int, series_format: int = 3):
+        """Initialize an empty series.
+        
+        Args:
+            team1_id: Id of the first team.
+            team2_id: Id of the second team.
+            series_format: Number of maps (3 or 5).
+        """
+        self.team1_id = team1_id
+        self.team2_id = team2_id
+        self.series_format = series_format
+        self.map_names = []
+        self.team1_scores = []
+        self.team2_scores = []
+        self.team1_map_wins = 0
+        self.team2_map_wins = 0
+        self.completed = False
+    
+    def add_map(self, map_name: str, team1_score: int, team2_score: int) -> None:
+        """Add a map result to the series.
+        
+        Args:
+            map_name: Name of the map played.
+            team1_score: Rounds won by team1.
+            team2_score: Rounds won by team2.
+        """
+        self.map_names.append(map_name)
+        self.team1_scores.append(team1_score)
+        self.team2_scores.append(team2_score)
+        if team1_score > team2_score:
+            self.team1_map_wins += 1
+        else:
+            self.team2_map_wins += 1
+        
+        maps_to_win = (self.series_format // 2) + 1
+        if self.team1_map_wins >= maps_to_win or self.team2_map_wins >= maps_to_win:
+            self.completed = True
+    
+    @property
+    def winner_id(self) -> int | None:
+        """Id of the team that won the series, or None if it is not complete."""
+        if not self.completed:
+            return None
+        return self.team1_id if self.team1_map_wins > self.team2_map_wins else self.team2_id
+    
+    def get_series_score(self) -> tuple[int, int]:
+        """Get the current series score (map wins).
+        
+        Returns:
+            Tuple of (team1_map_wins, team2_map_wins).
+        """
+        return (self.team1_map_wins, self.team2_map_wins)
+    
+    def to_dict(self) -> dict:
+        """Get a JSON-serializable copy of the record.
+        
+        Returns:
+            Dictionary with team ids, series format and per-map scores.
+        """
+        return {
+            "team1_id": self.team1_id,
+            "team2_id": self.team2_id,
+            "series_format": self.series_format,
+            "maps": [list(m) for m in zip(self.map_names, self.team1_scores, self.team2_scores)]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "MatchRecord":
+        """Rebuild a record from to_dict output.
+        
+        Args:
+            data: Dictionary produced by to_dict.
+        
+        Returns:
+            The restored MatchRecord.
+        """
+        record = cls(data["team1_id"], data["team2_id"], data["series_format"])
+        for map_name, team1_score, team2_score in data["maps"]:
+            record.add_map(map_name, team1_score, team2_score)
+        return record
+    
+    def to_match(self, team1: Team, team2: Team) -> Match:
+        """Build a full, validated Match model from the record.
+        
+        Args:
+            team1: Team with id team1_id.
+            team2: Team with id team2_id.
+        
+        Returns:
+            Match with a MapResult for every map played.
+        """
+        match = Match(team1=team1, team2=team2, series_format=self.series_format)
+        for map_name, team1_score, team2_score in zip(self.map_names, self.team1_scores, self.team2_scores):
+            match.add_map_result(MapResult(
+                map_name=map_name,
+                team1_score=team1_score,
+                team2_score=team2_score,
+                winner=team1.name if team1_score > team2_score else team2.name
+            ))
+        return match
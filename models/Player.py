@@ -1,8 +1,48 @@
-from pydantic import BaseModel, Field
+from typing import Any, Callable
+from pydantic import BaseModel, Field, PrivateAttr
+
+ROLES = ("duelist", "sentinel", "controller", "flex", "initiator")
 
 class Player(BaseModel):
     first_name: str
     last_name: str
     username: str
     rating: int = Field(ge=1, le=100)
-    role: str = Field(min_length=3, max_length=10)
\ No newline at end of file
+    role: str = Field(min_length=3, max_length=10)
+    age: int = Field(default=24, ge=15)
+    _rating_listeners: list = PrivateAttr(default_factory=list)
+    _store: Any = PrivateAttr(default=None)  # PlayerStore this player is a view of, if any
+    _player_id: int = PrivateAttr(default=-1)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        private = self.__pydantic_private__
+        if private["_store"] is not None and name in ("rating", "role", "age"):
+            private["_store"].set_field(private["_player_id"], name, value)
+        if name in ("rating", "role"):
+            for callback in private["_rating_listeners"]:
+                callback()
+    
+    def bind(self, store: Any, player_id: int) -> None:
+        """Make this player a view of a row of a PlayerStore.
+        
+        Later changes to the rating, role or age are written through to the
+        store. The store's values are not copied in; the fields must already
+        match them.
+        
+        Args:
+            store: PlayerStore holding the player.
+            player_id: Row of the player in the store.
+        """
+        private = self.__pydantic_private__
+        private["_store"] = store
+        private["_player_id"] = player_id
+    
+    def add_rating_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run whenever this player's rating or role changes.
+        
+        Args:
+            callback: Function called with no arguments after each change.
+        """
+        if callback not in self._rating_listeners:
+            self._rating_listeners.append(callback)
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""Column-oriented storage of every player's rating, role and age."""
+
+import numpy as np
+from .Player import ROLES
+
+ROLE_CODES = {role: code for code, role in enumerate(ROLES)}
+
+# Player fields whose values live in the store columns
+STORED_FIELDS = ("rating", "role", "age")
+
+
+class PlayerStore:
+    """Struct-of-arrays storage of players indexed by player id.
+    
+    Ratings, roles (as indices into ROLES) and ages live in contiguous NumPy
+    columns, and each team's players occupy one contiguous id range. The
+    columns are the source of truth: Player models bound to the store with
+    Player.bind are views that write their changes through to it, and bulk
+    work over every player (save files, offseason progression) runs as
+    column operations. After a bulk change, only the views that exist have
+    to be refreshed; see TeamRegistry.refresh_players.
+    """
+    
+    def __init__(
+        self,
+        ratings: np.ndarray,
+        roles: np.ndarray,
+        ages: np.ndarray,
+        team_sizes: np.ndarray
+    ):
+        """Initialize the store from prepared columns.
+        
+        Args:
+            ratings: Rating of each player, grouped by team.
+            roles: Role code (index into ROLES) of each player.
+            ages: Age of each player.
+            team_sizes: Number of players on each team.
+        """
+        self.ratings = np.asarray(ratings, dtype=np.int16)
+        self.roles = np.asarray(roles, dtype=np.int8)
+        self.ages = np.asarray(ages, dtype=np.int16)
+        
+        team_sizes = np.asarray(team_sizes, dtype=np.int64)
+        self.offsets = np.zeros(len(team_sizes) + 1, dtype=np.int64)
+        np.cumsum(team_sizes, out=self.offsets[1:])
+        self.teams = np.repeat(np.arange(len(team_sizes), dtype=np.int32), team_sizes)
+    
+    @classmethod
+    def empty(cls, team_sizes: np.ndarray) -> "PlayerStore":
+        """Allocate zeroed columns for teams of the given sizes.
+        
+        Args:
+            team_sizes: Number of players on each team.
+        
+        Returns:
+            A new PlayerStore to be filled with fill_teams.
+        """
+        size = int(np.sum(team_sizes))
+        return cls(np.zeros(size), np.zeros(size), np.zeros(size), team_sizes)
+    
+    def __len__(self) -> int:
+        return len(self.ratings)
+    
+    @property
+    def team_count(self) -> int:
+        """Number of teams in the store."""
+        return len(self.offsets) - 1
+    
+    @property
+    def team_sizes(self) -> np.ndarray:
+        """Number of players on each team."""
+        return np.diff(self.offsets)
+    
+    def team_players(self, first_team: int, end_team: int) -> slice:
+        """Get the player ids of a range of teams.
+        
+        Args:
+            first_team: Id of the first team.
+            end_team: Id one past the last team.
+        
+        Returns:
+            Slice of player ids, usable on every column.
+        """
+        return slice(int(self.offsets[first_team]), int(self.offsets[end_team]))
+    
+    def fill_teams(self, first_team: int, ratings: np.ndarray, roles: np.ndarray, ages: np.ndarray) -> None:
+        """Set the columns of consecutive teams.
+        
+        Args:
+            first_team: Id of the first team.
+            ratings: Ratings of the teams' players, one row per team.
+            roles: Role codes, one row per team.
+            ages: Ages, one row per team.
+        """
+        players = self.team_players(first_team, first_team + len(ratings))
+        self.ratings[players] = np.ravel(ratings)
+        self.roles[players] = np.ravel(roles)
+        self.ages[players] = np.ravel(ages)
+    
+    def team_ratings(self, team_ids: np.ndarray, role_weights: dict | None = None) -> np.ndarray:
+        """Compute the strength of several teams from the columns.
+        
+        Players are summed in roster order like the Python strength functions
+        do, so the result equals models.Team.mean_rating exactly and
+        role_weighted_rating (with its ROLE_WEIGHTS) up to float rounding.
+        
+        Args:
+            team_ids: Ids of the teams.
+            role_weights: Weight of each role name, or None for the mean rating.
+        
+        Returns:
+            Array of team strengths, 0.0 for an empty roster.
+        """
+        team_ids = np.asarray(team_ids, dtype=np.int64)
+        starts = self.offsets[team_ids]
+        sizes = self.offsets[team_ids + 1] - starts
+        if role_weights is not None:
+            weight_of = np.array([role_weights.get(role, 1.0) for role in ROLES])
+        
+        totals = np.zeros(len(team_ids))
+        weights = np.zeros(len(team_ids))
+        for slot in range(int(sizes.max(initial=0))):
+            playing = slot < sizes
+            player_ids = starts[playing] + slot
+            if role_weights is None:
+                totals[playing] += self.ratings[player_ids]
+                weights[playing] += 1.0
+            else:
+                slot_weights = weight_of[self.roles[player_ids]]
+                totals[playing] += slot_weights * self.ratings[player_ids]
+                weights[playing] += slot_weights
+        return np.divide(totals, weights, out=np.zeros(len(team_ids)), where=weights > 0)
+    
+    def rosters(self, team_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get the ratings and role codes of several teams, one row per team.
+        
+        Args:
+            team_ids: Ids of the teams, all with the same number of players.
+        
+        Returns:
+            Tuple of (ratings, roles) arrays of shape (len(team_ids), players).
+        """
+        team_ids = np.asarray(team_ids, dtype=np.int64)
+        sizes = self.offsets[team_ids + 1] - self.offsets[team_ids]
+        if len(sizes) and (sizes != sizes[0]).any():
+            raise ValueError("Teams have different numbers of players")
+        player_ids = self.offsets[team_ids][:, None] + np.arange(sizes[0] if len(sizes) else 0)
+        return self.ratings[player_ids], self.roles[player_ids]
+    
+    def set_field(self, player_id: int, name: str, value) -> None:
+        """Store one player's field; called by bound Player views.
+        
+        Args:
+            player_id: Id of the player.
+            name: One of STORED_FIELDS.
+            value: New value; a role name for "role".
+        """
+        if name == "rating":
+            self.ratings[player_id] = value
+        elif name == "role":
+            self.roles[player_id] = ROLE_CODES[value]
+        else:
+            self.ages[player_id] = value
+    
+    def apply_rating_changes(self, changes: np.ndarray) -> np.ndarray:
+        """Add a change to every player's rating, clamped between 1 and 100.
+        
+        Args:
+            changes: Whole-number rating change per player id.
+        
+        Returns:
+            Ids of the players whose rating changed.
+        """
+        old_ratings = self.ratings
+        self.ratings = np.clip(old_ratings + np.asarray(changes, dtype=np.int64), 1, 100).astype(np.int16)
+        return np.flatnonzero(self.ratings != old_ratings)
@@ -0,0 +1,232 @@
+"""Bulk generation of team rosters from vectorized random draws."""
+
+from functools import lru_cache
+from typing import Callable
+import numpy as np
+from .Player import Player, ROLES
+from .Team import Team
+
+# Bounds of Player.rating
+MIN_RATING = 1
+MAX_RATING = 100
+
+# Ages of newly generated players, inclusive
+MIN_AGE = 18
+MAX_AGE = 30
+
+
+def uniform_ratings(generator: np.random.Generator, size: int) -> np.ndarray:
+    """Draw ratings uniformly from MIN_RATING to MAX_RATING, like Team.build_roster.
+    
+    Args:
+        generator: NumPy generator to draw from.
+        size: Number of ratings.
+    
+    Returns:
+        Integer ratings.
+    """
+    return generator.integers(MIN_RATING, MAX_RATING + 1, size=size)
+
+
+def normal_ratings(generator: np.random.Generator, size: int) -> np.ndarray:
+    """Draw ratings from a bell curve around 50: most players are average.
+    
+    Args:
+        generator: NumPy generator to draw from.
+        size: Number of ratings.
+    
+    Returns:
+        Integer ratings, clipped to the rating bounds.
+    """
+    return np.clip(np.rint(generator.normal(50.0, 15.0, size=size)), MIN_RATING, MAX_RATING).astype(np.int64)
+
+
+def skewed_ratings(generator: np.random.Generator, size: int) -> np.ndarray:
+    """Draw ratings with a long upper tail: many weak players and a few stars.
+    
+    Args:
+        generator: NumPy generator to draw from.
+        size: Number of ratings.
+    
+    Returns:
+        Integer ratings.
+    """
+    return MIN_RATING + np.rint(generator.beta(2.0, 5.0, size=size) * (MAX_RATING - MIN_RATING)).astype(np.int64)
+
+
+RATING_DISTRIBUTIONS = {
+    "uniform": uniform_ratings,
+    "normal": normal_ratings,
+    "skewed": skewed_ratings
+}
+
+
+@lru_cache(maxsize=None)
+def _private_defaults(model_class: type) -> tuple:
+    """Get (name, default_factory, default) for every private attribute of a model class."""
+    return tuple(
+        (name, private.default_factory, private.default)
+        for name, private in model_class.__private_attributes__.items()
+    )
+
+
+def _construct(model_class: type, values: dict):
+    """Build a model from already checked field values.
+    
+    Sets the same state as model_construct, which in pydantic 2 is pure
+    Python and slower than validating; private attributes get fresh defaults.
+    This is the only place models are built without it, and the tests compare
+    its output against validated models.
+    
+    Args:
+        model_class: Pydantic model class.
+        values: Value for every field of the model.
+    
+    Returns:
+        Model instance.
+    """
+    model = model_class.__new__(model_class)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", set(values))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", {
+        name: default_factory() if default_factory is not None else default
+        for name, default_factory, default in _private_defaults(model_class)
+    })
+    return model
+
+
+class RosterGenerator:
+    """Builds rosters for many teams in one pass.
+    
+    Every rating and role of the batch is drawn with one vectorized call
+    each and checked once against the Player field constraints; the Team and
+    Player models are then built without per-player validation. Names follow
+    the Team.build_roster pattern.
+    """
+    
+    def __init__(
+        self,
+        players_per_team: int = 5,
+        rating_distribution: Callable[[np.random.Generator, int], np.ndarray] = uniform_ratings
+    ):
+        """Initialize the generator.
+        
+        Args:
+            players_per_team: Number of players on each team.
+            rating_distribution: Function drawing that many integer ratings
+                from a NumPy generator, e.g. one of RATING_DISTRIBUTIONS.
+        """
+        self.players_per_team = players_per_team
+        self.rating_distribution = rating_distribution
+        self._first_names = [f"Player{slot + 1}" for slot in range(players_per_team)]
+    
+    def draw(self, n_teams: int, generator: np.random.Generator) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Draw and check the ratings, roles and ages of a batch.
+        
+        Args:
+            n_teams: Number of teams.
+            generator: NumPy generator to draw from.
+        
+        Returns:
+            Tuple of (ratings, roles, ages) arrays of shape (n_teams,
+            players_per_team); roles are indices into ROLES.
+        """
+        shape = (n_teams, self.players_per_team)
+        ratings = np.asarray(self.rating_distribution(generator, n_teams * self.players_per_team)).reshape(shape)
+        if ratings.size and (ratings.min() < MIN_RATING or ratings.max() > MAX_RATING):
+            raise ValueError(f"Rating distribution drew ratings outside {MIN_RATING}-{MAX_RATING}")
+        roles = generator.integers(0, len(ROLES), size=shape)
+        ages = generator.integers(MIN_AGE, MAX_AGE + 1, size=shape)
+        return ratings, roles, ages
+    
+    def generate(
+        self,
+        team_names: list[str],
+        generator: np.random.Generator,
+        team_ids: list[int] | None = None
+    ) -> list[Team]:
+        """Build teams with random rosters.
+        
+        Args:
+            team_names: Names of the teams.
+            generator: NumPy generator to draw from.
+            team_ids: Id of each team; -1 for all if None.
+        
+        Returns:
+            List of Team objects in team_names order.
+        """
+        ratings, roles, ages = self.draw(len(team_names), generator)
+        return self.build(team_names, team_ids if team_ids is not None else [-1] * len(team_names), ratings, roles, ages)
+    
+    def build(
+        self,
+        team_names: list[str],
+        team_ids: list[int],
+        ratings: np.ndarray,
+        roles: np.ndarray,
+        ages: np.ndarray
+    ) -> list[Team]:
+        """Build teams from already drawn and checked roster columns.
+        
+        Args:
+            team_names: Names of the teams.
+            team_ids: Id of each team.
+            ratings: Ratings, one row of players_per_team per team.
+            roles: Role indices into ROLES, in the same layout.
+            ages: Ages, in the same layout.
+        
+        Returns:
+            List of Team objects in team_names order.
+        """
+        first_names = self._first_names
+        return [
+            self._build_team(team_name, team_id, first_names, team_ratings, team_roles, team_ages)
+            for team_name, team_id, team_ratings, team_roles, team_ages in zip(
+                team_names, team_ids, ratings.tolist(), roles.tolist(), ages.tolist()
+            )
+        ]
+    
+    def _build_team(
+        self,
+        team_name: str,
+        team_id: int,
+        first_names: list[str],
+        ratings: list[int],
+        roles: list[int],
+        ages: list[int]
+    ) -> Team:
+        """Build one team of a checked batch.
+        
+        Args:
+            team_name: Name of the team.
+            team_id: Id of the team.
+            first_names: First name of each roster slot.
+            ratings: Rating of each player.
+            roles: Role index of each player.
+            ages: Age of each player.
+        
+        Returns:
+            Team with its roster.
+        """
+        prefix = team_name.lower()
+        players = [
+            _construct(Player, {
+                "first_name": first_name,
+                "last_name": "Smith",
+                "username": f"{prefix}_{first_name.lower()}",
+                "rating": rating,
+                "role": ROLES[role],
+                "age": age
+            })
+            for first_name, rating, role, age in zip(first_names, ratings, roles, ages)
+        ]
+        return _construct(Team, {
+            "name": team_name,
+            "id": team_id,
+            "players": players,
+            "wins": 0,
+            "losses": 0,
+            "maps_won": 0,
+            "maps_lost": 0
+        })
@@ -1,45 +1,194 @@
-from pydantic import BaseModel, Field
-from .Player import Player
+from typing import Any, Callable
+from pydantic import BaseModel, Field, PrivateAttr
+from .Player import Player, ROLES
 import random
 
+# Relative impact of each role on team strength for role_weighted_rating.
+ROLE_WEIGHTS = {
+    "duelist": 1.2,
+    "initiator": 1.1,
+    "controller": 1.0,
+    "flex": 1.0,
+    "sentinel": 0.9
+}
+
+def mean_rating(players: list[Player]) -> float:
+    """Average rating of a roster (the default team strength).
+    
+    Args:
+        players: Players on the team.
+        
+    Returns:
+        Mean player rating, or 0.0 for an empty roster.
+    """
+    if not players:
+        return 0.0
+    return sum(p.rating for p in players) / len(players)
+
+def role_weighted_rating(players: list[Player]) -> float:
+    """Role-weighted average rating of a roster.
+    
+    Args:
+        players: Players on the team.
+        
+    Returns:
+        Average rating weighted by ROLE_WEIGHTS, or 0.0 for an empty roster.
+    """
+    if not players:
+        return 0.0
+    weights = [ROLE_WEIGHTS.get(p.role, 1.0) for p in players]
+    return sum(w * p.rating for w, p in zip(weights, players)) / sum(weights)
+
+# Team strength functions selectable by name (e.g. from the command line)
+TEAM_RATINGS = {
+    "mean": mean_rating,
+    "role_weighted": role_weighted_rating
+}
+
+# Role weights of each strength function, for computing it over PlayerStore
+# columns (PlayerStore.team_ratings); None weighs every player equally
+TEAM_RATING_WEIGHTS = {
+    "mean": None,
+    "role_weighted": ROLE_WEIGHTS
+}
+
+# Record fields of a team, in the column order of TeamRegistry.records
+RECORD_FIELDS = ("wins", "losses", "maps_won", "maps_lost")
+_RECORD_COLUMNS = {name: column for column, name in enumerate(RECORD_FIELDS)}
+
 class Team(BaseModel):
     name: str
+    id: int = -1  # Index assigned by RosterManager; referenced by MatchRecord
     players: list[Player] = Field(default_factory=list)
     wins: int = 0
     losses: int = 0
     maps_won: int = 0
     maps_lost: int = 0
-
-    def build_roster(self) -> None: 
+    _listeners: list = PrivateAttr(default_factory=list)
+    _strength_function: Callable[[list[Player]], float] = PrivateAttr(default=mean_rating)
+    _rating: float | None = PrivateAttr(default=None)
+    _rating_listening: bool = PrivateAttr(default=False)  # Listening to the current roster's players
+    _records: Any = PrivateAttr(default=None)  # Records array this team's record is a view of, if any
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "players":
+            self.invalidate_rating()
+        elif name in _RECORD_COLUMNS:
+            records = self.__pydantic_private__["_records"]
+            if records is not None:
+                records[self.id, _RECORD_COLUMNS[name]] = value
+    
+    def bind_records(self, records: Any) -> None:
+        """Make this team's record a view of its row of a records array.
+        
+        Later changes to wins, losses, maps_won and maps_lost are written
+        through to row ``id``. The array's values are not copied in; use
+        set_record for that.
+        
+        Args:
+            records: Array with one row per team id and RECORD_FIELDS columns,
+                e.g. TeamRegistry.records.
+        """
+        self.__pydantic_private__["_records"] = records
+    
+    def build_roster(self, rng: random.Random | None = None) -> None: 
         # Generate 5 random players
-        self.players = []
+        rng = rng or random
+        players = []
         for i in range(5):
             player = Player(
                 first_name=f"Player{i+1}",
                 last_name="Smith",
                 username=f"{self.name.lower()}_player{i+1}",
-                rating=random.randint(1, 100),
-                role=random.choice(["duelist", "sentinel", "controller", "flex", "initiator"])
+                rating=rng.randint(1, 100),
+                role=rng.choice(ROLES)
             )
-            self.players.append(player)
+            players.append(player)
+        self.players = players
     
     def get_team_rating(self) -> float:
-        """Get the average team rating based on player ratings.
+        """Get the team rating based on player ratings.
+        
+        The value comes from the team's strength function (the average player
+        rating by default) and is cached until ``players`` is assigned or a
+        player's rating or role changes. Editing the list in place
+        (``players[i] = ...``, ``players.append(...)``) needs an explicit
+        invalidate_rating().
         
         Returns:
-            Average rating of all players on the team.
+            Team rating.
+        """
+        # Private attributes are read directly; pydantic's __getattr__ would
+        # cost more than the cache saves.
+        private = self.__pydantic_private__
+        if not private["_rating_listening"]:
+            for player in self.players:
+                player.add_rating_listener(self._drop_rating)
+            private["_rating_listening"] = True
+            private["_rating"] = None
+        
+        if private["_rating"] is None:
+            private["_rating"] = private["_strength_function"](self.players)
+        return private["_rating"]
+    
+    def invalidate_rating(self) -> None:
+        """Drop the cached team rating after the roster changed.
+        
+        The team also subscribes to rating changes of any new players the
+        next time the rating is computed.
+        """
+        private = self.__pydantic_private__
+        private["_rating"] = None
+        private["_rating_listening"] = False
+    
+    def _drop_rating(self) -> None:
+        """Drop the cached team rating after a player's rating or role changed."""
+        self.__pydantic_private__["_rating"] = None
+    
+    def set_strength_function(self, strength_function: Callable[[list[Player]], float]) -> None:
+        """Change how the team rating is computed from the roster.
+        
+        Args:
+            strength_function: Function mapping the player list to a rating,
+                e.g. mean_rating or role_weighted_rating.
+        """
+        self._strength_function = strength_function
+        self.invalidate_rating()
+    
+    def add_listener(self, callback: Callable[["Team"], None]) -> None:
+        """Register a callback to run whenever the team's record changes.
+        
+        Args:
+            callback: Function called with this team after each change.
         """
-        if not self.players:
-            return 0.0
-        return sum(p.rating for p in self.players) / len(self.players)
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[["Team"], None]) -> None:
+        """Stop running a callback registered with add_listener.
+        
+        Args:
+            callback: The registered callback; ignored if it is not registered.
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _notify(self) -> None:
+        """Tell listeners that the record changed."""
+        # Read the private attribute directly; going through pydantic's
+        # __getattr__ costs more than the record update itself.
+        for callback in self.__pydantic_private__["_listeners"]:
+            callback(self)
     
     def add_win(self) -> None:
         """Record a match win."""
         self.wins += 1
+        self._notify()
     
     def add_loss(self) -> None:
         """Record a match loss."""
         self.losses += 1
+        self._notify()
     
     def add_map_win(self, count: int = 1) -> None:
         """Record map wins.
@@ -48,6 +197,7 @@ class Team(BaseModel):
             count: Number of maps won (default 1).
         """
         self.maps_won += count
+        self._notify()
     
     def add_map_loss(self, count: int = 1) -> None:
         """Record map losses.
@@ -56,10 +206,27 @@ class Team(BaseModel):
             count: Number of maps lost (default 1).
         """
         self.maps_lost += count
+        self._notify()
+    
+    def set_record(self, wins: int, losses: int, maps_won: int, maps_lost: int) -> None:
+        """Replace the whole record and notify listeners once.
+        
+        Used to copy bulk changes to TeamRegistry.records into the model, so
+        the fields are set without being written back.
+        
+        Args:
+            wins: Match wins.
+            losses: Match losses.
+            maps_won: Maps won.
+            maps_lost: Maps lost.
+        """
+        self.__dict__.update(wins=wins, losses=losses, maps_won=maps_won, maps_lost=maps_lost)
+        self._notify()
     
     def reset_record(self) -> None:
         """Reset win/loss record."""
         self.wins = 0
         self.losses = 0
         self.maps_won = 0
-        self.maps_lost = 0
\ No newline at end of file
+        self.maps_lost = 0
+        self._notify()
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""A week's series results in every league, held as arrays."""
+
+from typing import Iterator, Mapping
+import numpy as np
+from .WorldIndex import WorldIndex
+
+
+class WeekResults(Mapping):
+    """Maps league names to a week's results, backed by team id and map arrays.
+    
+    Reads like a dictionary of (team1_name, team1_maps, team2_maps,
+    team2_name) lists by league, with every league present, but a league's
+    list is only built the first time it is looked up. Bulk consumers (Elo
+    updates, save checkpoints) read the arrays instead, so a batch week
+    creates no per-series Python objects unless someone asks for them.
+    
+    Series are held grouped by league: ``leagues`` gives each series' league
+    position, ``team1_ids`` and ``team2_ids`` its teams, and ``team1_maps``
+    and ``team2_maps`` the maps each side won.
+    """
+    
+    def __init__(
+        self,
+        world: WorldIndex,
+        leagues: np.ndarray,
+        team1_ids: np.ndarray,
+        team2_ids: np.ndarray,
+        team1_maps: np.ndarray,
+        team2_maps: np.ndarray
+    ):
+        """Initialize the results from prepared columns.
+        
+        Args:
+            world: WorldIndex the league positions and team ids refer to.
+            leagues: League position of each series, grouped by league.
+            team1_ids: Id of each series' first team.
+            team2_ids: Id of each series' second team.
+            team1_maps: Maps won by each first team.
+            team2_maps: Maps won by each second team.
+        """
+        self.world = world
+        self.leagues = np.asarray(leagues, dtype=np.int64)
+        self.team1_ids = np.asarray(team1_ids, dtype=np.int64)
+        self.team2_ids = np.asarray(team2_ids, dtype=np.int64)
+        self.team1_maps = np.asarray(team1_maps, dtype=np.int64)
+        self.team2_maps = np.asarray(team2_maps, dtype=np.int64)
+        self._lists = {}
+    
+    @classmethod
+    def from_results(cls, world: WorldIndex, all_results: Mapping) -> "WeekResults":
+        """Index a dictionary of results by league, e.g. from the serial engine.
+        
+        The given lists are kept and returned as they are.
+        
+        Args:
+            world: WorldIndex of the leagues.
+            all_results: Dictionary of (team1_name, team1_maps, team2_maps,
+                team2_name) lists by league name.
+        
+        Returns:
+            WeekResults over the same series.
+        """
+        rows = []
+        for league_name, results in all_results.items():
+            league = world.league_position(league_name)
+            for team1_name, team1_maps, team2_maps, team2_name in results:
+                rows.append((
+                    league,
+                    world.league_team_id(league, team1_name),
+                    world.league_team_id(league, team2_name),
+                    team1_maps,
+                    team2_maps
+                ))
+        columns = np.array(rows, dtype=np.int64).reshape(-1, 5).T
+        order = np.argsort(columns[0], kind="stable")
+        week_results = cls(world, *(column[order] for column in columns))
+        week_results._lists.update(all_results)
+        return week_results
+    
+    def __getitem__(self, league_name: str) -> list[tuple[str, int, int, str]]:
+        results = self._lists.get(league_name)
+        if results is None:
+            league = self.world.league_position(league_name)
+            if league is None:
+                raise KeyError(league_name)
+            start, end = np.searchsorted(self.leagues, [league, league + 1]).tolist()
+            names = self.world.team_names
+            results = [
+                (names[team1_id], team1_maps, team2_maps, names[team2_id])
+                for team1_id, team1_maps, team2_maps, team2_id in zip(
+                    self.team1_ids[start:end].tolist(),
+                    self.team1_maps[start:end].tolist(),
+                    self.team2_maps[start:end].tolist(),
+                    self.team2_ids[start:end].tolist()
+                )
+            ]
+            self._lists[league_name] = results
+        return results
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.world.league_names)
+    
+    def __len__(self) -> int:
+        return len(self.world)
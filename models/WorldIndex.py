@@ -0,0 +1,236 @@
+"""Compact index of every league and team name in a world."""
+
+import json
+from typing import Iterable, Iterator, Mapping, Sequence
+import numpy as np
+
+
+class LeagueRecord(Mapping):
+    """One league of a WorldIndex, read like its JSON dictionary.
+    
+    "name" and "teams" behave as in the parsed JSON, but the list of team
+    dictionaries is only built the first time "teams" is read.
+    """
+    
+    __slots__ = ("world", "position", "_teams")
+    
+    def __init__(self, world: "WorldIndex", position: int):
+        """Initialize the record.
+        
+        Args:
+            world: WorldIndex the league belongs to.
+            position: Index of the league in the world.
+        """
+        self.world = world
+        self.position = position
+        self._teams = None
+    
+    def __getitem__(self, key: str):
+        if key == "name":
+            return self.world.league_names[self.position]
+        if key == "teams":
+            if self._teams is None:
+                self._teams = [{"name": team_name} for team_name in self.world.team_names_of(self.position)]
+            return self._teams
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(("name", "teams"))
+    
+    def __len__(self) -> int:
+        return 2
+
+
+class WorldIndex(Sequence):
+    """League and team names of a world in a few flat columns.
+    
+    Team names are kept in one list in league order, so a team's position in
+    it is its team id, and league i's teams are ids offsets[i] to
+    offsets[i + 1]. Indexing gives a LeagueRecord, which reads like the
+    league's JSON dictionary, so the index can stand in for the parsed league
+    list; records, their team lists and the name lookups are built on first
+    use.
+    
+    JSON Lines worlds (one league object per line) are read line by line, so
+    only one league's parsed JSON is held at a time.
+    """
+    
+    def __init__(self, league_names: list[str], team_names: list[str], team_counts: list[int]):
+        """Initialize the index from prepared columns.
+        
+        Args:
+            league_names: Name of each league.
+            team_names: Name of every team, grouped by league.
+            team_counts: Number of teams in each league.
+        """
+        if sum(team_counts) != len(team_names):
+            raise ValueError(f"League sizes add up to {sum(team_counts)} teams, got {len(team_names)} names")
+        self.league_names = league_names
+        self.team_names = team_names
+        self.offsets = np.zeros(len(team_counts) + 1, dtype=np.int64)
+        np.cumsum(team_counts, out=self.offsets[1:])
+        
+        self._records = [None] * len(league_names)
+        self._league_positions = None  # League name -> position, built on first lookup
+        self._team_ids = None  # Lowercase team name -> id, built on first lookup
+        self._league_team_ids = {}  # League position -> lowercase team name -> id, built per league
+    
+    @classmethod
+    def from_leagues(cls, leagues: Sequence) -> "WorldIndex":
+        """Index a parsed league list.
+        
+        Args:
+            leagues: League dictionaries from JSON, or a WorldIndex, which is
+                returned as is.
+        
+        Returns:
+            WorldIndex of the leagues.
+        """
+        if isinstance(leagues, cls):
+            return leagues
+        league_names, team_names, team_counts = [], [], []
+        for league in leagues:
+            cls._add_league(league, league_names, team_names, team_counts)
+        return cls(league_names, team_names, team_counts)
+    
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "WorldIndex":
+        """Index a JSON Lines world, one league object per line.
+        
+        Args:
+            lines: Lines of JSON; blank lines are skipped.
+        
+        Returns:
+            WorldIndex of the leagues.
+        """
+        league_names, team_names, team_counts = [], [], []
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                league = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid league on line {line_number}: {e}") from e
+            cls._add_league(league, league_names, team_names, team_counts)
+        return cls(league_names, team_names, team_counts)
+    
+    @classmethod
+    def load(cls, path: str) -> "WorldIndex":
+        """Index a world file.
+        
+        Args:
+            path: A .jsonl file with one league per line, or a JSON file with
+                a "leagues" list.
+        
+        Returns:
+            WorldIndex of the file's leagues.
+        """
+        with open(path, "r") as f:
+            if path.endswith(".jsonl"):
+                return cls.from_lines(f)
+            return cls.from_leagues(json.load(f)["leagues"])
+    
+    @staticmethod
+    def _add_league(league: dict, league_names: list, team_names: list, team_counts: list) -> None:
+        """Append one league dictionary's names to the columns being built."""
+        league_teams = [team_data["name"] for team_data in league["teams"]]
+        league_names.append(league["name"])
+        team_names.extend(league_teams)
+        team_counts.append(len(league_teams))
+    
+    def __len__(self) -> int:
+        return len(self.league_names)
+    
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[p] for p in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        record = self._records[position]
+        if record is None:
+            record = LeagueRecord(self, position)
+            self._records[position] = record
+        return record
+    
+    @property
+    def team_count(self) -> int:
+        """Number of teams across all leagues."""
+        return len(self.team_names)
+    
+    def league_team_ids(self, position: int) -> range:
+        """Get the team ids of a league.
+        
+        Args:
+            position: Index of the league.
+        
+        Returns:
+            Range of team ids.
+        """
+        return range(int(self.offsets[position]), int(self.offsets[position + 1]))
+    
+    def team_names_of(self, position: int) -> list[str]:
+        """Get the team names of a league.
+        
+        Args:
+            position: Index of the league.
+        
+        Returns:
+            Team names in team id order.
+        """
+        return self.team_names[self.offsets[position]:self.offsets[position + 1]]
+    
+    def league_position(self, league_name: str) -> int | None:
+        """Get the index of a league.
+        
+        Args:
+            league_name: Name of the league.
+        
+        Returns:
+            Index of the league, or None if no league has that name.
+        """
+        if self._league_positions is None:
+            self._league_positions = {name: position for position, name in enumerate(self.league_names)}
+        return self._league_positions.get(league_name)
+    
+    def team_id(self, team_name: str) -> int | None:
+        """Get a team's id by name.
+        
+        Args:
+            team_name: Name of the team (case-insensitive).
+        
+        Returns:
+            Team id, or None if no team has that name.
+        """
+        if self._team_ids is None:
+            self._team_ids = {name.lower(): team_id for team_id, name in enumerate(self.team_names)}
+        return self._team_ids.get(team_name.lower())
+    
+    def league_team_id(self, position: int, team_name: str) -> int | None:
+        """Get a team's id by name within one league.
+        
+        Unlike team_id, this stays correct when leagues share team names.
+        
+        Args:
+            position: Index of the league.
+            team_name: Name of the team (case-insensitive).
+        
+        Returns:
+            Team id, or None if the league has no team with that name.
+        """
+        team_ids = self._league_team_ids.get(position)
+        if team_ids is None:
+            start = int(self.offsets[position])
+            team_ids = {name.lower(): start + i for i, name in enumerate(self.team_names_of(position))}
+            self._league_team_ids[position] = team_ids
+        return team_ids.get(team_name.lower())
+    
+    def league_of(self, team_id: int) -> int:
+        """Get the index of the league a team plays in.
+        
+        Args:
+            team_id: Id of the team.
+        
+        Returns:
+            Index of the league.
+        """
+        return int(np.searchsorted(self.offsets, team_id, side="right")) - 1
@@ -1,5 +1,9 @@
 from .Player import Player
 from .Team import Team
-from .Match import Match, MapResult
+from .Match import Match, MapResult, MatchRecord
+from .PlayerStore import PlayerStore
+from .RosterGenerator import RosterGenerator, RATING_DISTRIBUTIONS
+from .WorldIndex import WorldIndex, LeagueRecord
+from .WeekResults import WeekResults
 
-__all__ = ["Player", "Team", "Match", "MapResult"]
+__all__ = ["Player", "Team", "Match", "MapResult", "MatchRecord", "PlayerStore", "RosterGenerator", "RATING_DISTRIBUTIONS", "WorldIndex", "LeagueRecord", "WeekResults"]
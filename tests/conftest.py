@@ -0,0 +1,33 @@
+"""Shared fixtures for the test suite."""
+
+import json
+import pytest
+from managers import GameManager, LeagueManager
+
+
+@pytest.fixture
+def make_game(tmp_path):
+    """Build a seeded GameManager over a small generated world.
+    
+    The returned factory takes a list of (league_name, team_names) pairs,
+    the id of the user's team (the first team by default) and extra
+    GameManager arguments.
+    """
+    def factory(leagues: list[tuple[str, list[str]]], user_team_id: int = 0, seed: int = 7, **options) -> GameManager:
+        world_path = tmp_path / "world.json"
+        world_path.write_text(json.dumps({
+            "leagues": [
+                {"name": league_name, "teams": [{"name": team_name} for team_name in team_names]}
+                for league_name, team_names in leagues
+            ]
+        }))
+        league_manager = LeagueManager(str(world_path), seed=seed)
+        registry = league_manager.registry
+        return GameManager(
+            registry.get_team_by_id(user_team_id),
+            league_manager.leagues,
+            seed=seed,
+            registry=registry,
+            **options
+        )
+    return factory
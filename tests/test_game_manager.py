@@ -0,0 +1,30 @@
+"""Tests for the game loop's season transitions and menu views."""
+
+import pytest
+
+TEAM_NAMES = [f"Team {i}" for i in range(6)]
+
+
+@pytest.mark.parametrize("output_mode", ["summary", "silent"])
+def test_offseason_output_can_be_viewed_later(make_game, monkeypatch, capsys, output_mode):
+    game = make_game([("League", TEAM_NAMES)], output_mode=output_mode)
+    game.view_season_history()
+    assert "No season has been completed yet" in capsys.readouterr().out
+    
+    while not game.is_season_over():
+        game.play_week()
+    monkeypatch.setattr("builtins.input", lambda prompt="": "y")
+    game._handle_season_end()
+    assert game.current_season == 2
+    
+    # The quiet modes skip the offseason tables while advancing
+    output = capsys.readouterr().out
+    assert "Season History" not in output
+    assert "Player Rating Changes" not in output
+    
+    game.view_season_history()
+    output = capsys.readouterr().out
+    assert "Season History" in output
+    assert "Player Rating Changes" in output
+    for player in game.user_team.players:
+        assert player.last_name in output
@@ -0,0 +1,73 @@
+"""Tests for the Markov-chain map score distribution against the round loop."""
+
+import random
+from collections import Counter
+import pytest
+from core.map_odds import ROUNDS_TO_WIN, MapScoreDistribution, get_map_distribution
+from managers import MatchManager
+
+
+def round_loop_distribution(p: float) -> tuple[dict[tuple[int, int], float], float]:
+    """Walk the round loop's states exactly, up to 12-12.
+    
+    Returns:
+        Probability of every regulation final score, and of reaching 12-12.
+    """
+    states = {(0, 0): 1.0}
+    finals = {}
+    overtime = 0.0
+    while states:
+        next_states = {}
+        for (team1_score, team2_score), probability in states.items():
+            for score, chance in (((team1_score + 1, team2_score), p), ((team1_score, team2_score + 1), 1 - p)):
+                if ROUNDS_TO_WIN in score:
+                    finals[score] = finals.get(score, 0.0) + probability * chance
+                elif score == (ROUNDS_TO_WIN - 1, ROUNDS_TO_WIN - 1):
+                    overtime += probability * chance
+                else:
+                    next_states[score] = next_states.get(score, 0.0) + probability * chance
+        states = next_states
+    return finals, overtime
+
+
+@pytest.mark.parametrize("p", [0.0, 0.2, 0.45, 0.5, 0.73, 1.0])
+def test_distribution_matches_round_loop_exactly(p):
+    distribution = MapScoreDistribution(p)
+    finals, overtime = round_loop_distribution(p)
+    
+    probabilities = [distribution.cdf[0]] + [b - a for a, b in zip(distribution.cdf, distribution.cdf[1:])]
+    for score, probability in zip(distribution.scores, probabilities):
+        assert probability == pytest.approx(finals.get(score, 0.0), abs=1e-12)
+    assert distribution.overtime_probability == pytest.approx(overtime, abs=1e-12)
+    assert distribution.cdf[-1] + distribution.overtime_probability == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("p", [0.35, 0.5, 0.6])
+def test_sampled_scores_match_round_loop(p):
+    maps = 40_000
+    distribution = get_map_distribution(p)
+    markov_rng = random.Random(1)
+    rounds_rng = random.Random(2)
+    play_rounds = MatchManager(map_engine="rounds")._play_rounds
+    
+    markov = Counter(distribution.sample(markov_rng.random()) for _ in range(maps))
+    rounds = Counter(play_rounds(p, rounds_rng) for _ in range(maps))
+    
+    def summary(counts: Counter) -> tuple[float, float, float]:
+        team1_wins = sum(n for (team1_score, team2_score), n in counts.items() if team1_score > team2_score)
+        overtime = sum(n for score, n in counts.items() if min(score) >= ROUNDS_TO_WIN - 1)
+        rounds_played = sum(n * sum(score) for score, n in counts.items())
+        return team1_wins / maps, overtime / maps, rounds_played / maps
+    
+    markov_win, markov_overtime, markov_rounds = summary(markov)
+    rounds_win, rounds_overtime, rounds_rounds = summary(rounds)
+    assert markov_win == pytest.approx(distribution.team1_win_probability, abs=0.01)
+    assert markov_win == pytest.approx(rounds_win, abs=0.015)
+    assert markov_overtime == pytest.approx(rounds_overtime, abs=0.01)
+    assert markov_rounds == pytest.approx(rounds_rounds, abs=0.15)
+    
+    # Every sampled score is one the round loop can produce
+    for team1_score, team2_score in markov:
+        assert max(team1_score, team2_score) >= ROUNDS_TO_WIN
+        if min(team1_score, team2_score) >= ROUNDS_TO_WIN - 1:
+            assert abs(team1_score - team2_score) == 2
@@ -0,0 +1,72 @@
+"""Tests for the player store as the source of truth behind Player views."""
+
+import numpy as np
+from managers import TeamRegistry
+from core.rng import RNGService
+
+LEAGUES = [
+    {"name": "North", "teams": [{"name": f"North {i}"} for i in range(4)]},
+    {"name": "South", "teams": [{"name": f"South {i}"} for i in range(3)]},
+]
+
+
+def store_rows(registry, team):
+    players = registry.players
+    rows = slice(int(players.offsets[team.id]), int(players.offsets[team.id + 1]))
+    return players.ratings[rows].tolist(), players.roles[rows].tolist(), players.ages[rows].tolist()
+
+
+def test_views_match_store_rows_in_any_draw_order():
+    eager = TeamRegistry(LEAGUES, RNGService(3))
+    eager.draw_all_players()
+    lazy = TeamRegistry(LEAGUES, RNGService(3))
+    
+    # Drawing columns alone builds no models
+    assert not eager._built.any()
+    for team in reversed([lazy.get_team_by_id(team_id) for team_id in range(lazy.team_count)]):
+        assert store_rows(lazy, team) == store_rows(eager, team)
+        ratings, roles, ages = store_rows(lazy, team)
+        assert [player.rating for player in team.players] == ratings
+        assert [player.age for player in team.players] == ages
+
+
+def test_assignments_write_through_to_the_store():
+    registry = TeamRegistry(LEAGUES, RNGService(3))
+    team = registry.get_team("South 1")
+    player = team.players[2]
+    
+    player.rating = 77
+    player.role = "sentinel"
+    player.age = 31
+    ratings, roles, ages = store_rows(registry, team)
+    assert (ratings[2], roles[2], ages[2]) == (77, 1, 31)
+
+
+def test_refresh_updates_built_views_only():
+    registry = TeamRegistry(LEAGUES, RNGService(3))
+    north = registry["North"]
+    rating = north[0].get_team_rating()
+    store = registry.draw_all_players()
+    
+    store.ratings[:] = 100
+    store.ages += 1
+    registry.refresh_players()
+    assert all(player.rating == 100 for team in north for player in team.players)
+    # The rating cache saw the change through the player listeners
+    assert north[0].get_team_rating() == 100 != rating
+    assert not registry._built[len(north):].any()
+    
+    # South was built after the change, straight from the store
+    south = registry["South"]
+    assert [player.age for player in south[0].players] == store_rows(registry, south[0])[2]
+    assert all(player.rating == 100 for player in south[0].players)
+
+
+def test_load_players_replaces_columns_and_views():
+    registry = TeamRegistry(LEAGUES, RNGService(3))
+    team = registry.get_team("North 3")
+    size = len(registry.players)
+    
+    registry.load_players(np.full(size, 42), np.zeros(size), np.full(size, 20))
+    assert [(player.rating, player.role, player.age) for player in team.players] == [(42, "duelist", 20)] * 5
+    assert store_rows(registry, registry.get_team("South 2")) == ([42] * 5, [0] * 5, [20] * 5)
@@ -0,0 +1,52 @@
+"""Tests for offseason progression on the player store."""
+
+import numpy as np
+from core.rng import RNGService
+from managers import ProgressionManager, TeamRegistry
+from managers.progression_manager import PROGRESSION_MODELS
+
+LEAGUES = [
+    {"name": f"League {league}", "teams": [{"name": f"Team {league}-{i}"} for i in range(6)]}
+    for league in range(4)
+]
+
+
+def test_progress_updates_columns_without_building_leagues():
+    registry = TeamRegistry(LEAGUES, RNGService(8))
+    team = registry.get_team("Team 2-3")
+    store = registry.draw_all_players()
+    ratings, roles, ages = store.ratings.copy(), store.roles.copy(), store.ages.copy()
+    
+    manager = ProgressionManager(registry, registry.rng, ["random", "age"])
+    manager.progress(1)
+    
+    # The same changes, computed directly from the columns
+    generator = RNGService(8).generator("progression", 1)
+    changes = sum(
+        PROGRESSION_MODELS[name](ratings.astype(np.float64), roles.astype(np.int64), ages.astype(np.float64), generator)
+        for name in ("random", "age")
+    )
+    np.testing.assert_array_equal(store.ratings, np.clip(ratings + np.rint(changes), 1, 100))
+    np.testing.assert_array_equal(store.ages, ages + 1)
+    np.testing.assert_array_equal(store.roles, roles)
+    assert registry._built.sum() == 6
+    
+    # The built league's views follow the store
+    rows = slice(int(store.offsets[team.id]), int(store.offsets[team.id + 1]))
+    assert [player.rating for player in team.players] == store.ratings[rows].tolist()
+    assert [player.age for player in team.players] == store.ages[rows].tolist()
+    assert manager.get_team_changes(team) == list(zip(
+        team.players, ratings[rows].tolist(), store.ratings[rows].tolist()
+    ))
+
+
+def test_changes_are_kept_until_the_next_offseason():
+    registry = TeamRegistry(LEAGUES, RNGService(8))
+    team = registry.get_team("Team 0-0")
+    manager = ProgressionManager(registry, registry.rng)
+    assert manager.get_team_changes(team) == []
+    
+    manager.progress(1)
+    changes = manager.get_team_changes(team)
+    team.players[0].rating = 1 if team.players[0].rating != 1 else 2
+    assert manager.get_team_changes(team) == changes
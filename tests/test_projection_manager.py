@@ -0,0 +1,36 @@
+"""Tests for Monte Carlo standings projections."""
+
+import numpy as np
+import pytest
+from managers.projection_manager import TRIAL_BLOCK_SIZE
+
+TEAM_NAMES = [f"Team {i}" for i in range(8)]
+
+
+def test_worker_pool_matches_single_process(make_game):
+    game = make_game([("League", TEAM_NAMES)])
+    game.play_week()
+    game.play_week()
+    project = game.projection_manager.project_league
+    trials = 2 * TRIAL_BLOCK_SIZE
+    
+    pooled = project("League", game.schedule_manager, game.current_week, trials=trials, workers=2, seed=1)
+    single = project("League", game.schedule_manager, game.current_week, trials=trials, workers=1, seed=2)
+    
+    assert list(pooled) == TEAM_NAMES
+    for team_name in TEAM_NAMES:
+        assert sum(pooled[team_name]) == pytest.approx(1.0)
+        np.testing.assert_allclose(pooled[team_name], single[team_name], atol=0.02)
+    # Every rank is taken by exactly one team in each trial
+    np.testing.assert_allclose(np.sum(list(pooled.values()), axis=0), 1.0)
+
+
+def test_projection_arguments_are_checked(make_game):
+    game = make_game([("League", TEAM_NAMES)])
+    
+    with pytest.raises(ValueError):
+        game.projection_manager.project_league("League", game.schedule_manager, 0, trials=0)
+    projection = game.projection_manager.project_league("League", game.schedule_manager, 0, trials=1000, workers=1)
+    assert game.projection_manager.playoff_odds(projection, spots=0) == {team_name: 0.0 for team_name in TEAM_NAMES}
+    with pytest.raises(ValueError):
+        game.projection_manager.playoff_odds(projection, spots=-1)
@@ -0,0 +1,87 @@
+"""Tests for the vectorized Elo updates."""
+
+import numpy as np
+import pytest
+from core.rng import RNGService
+from managers import RatingManager, TeamRegistry
+from managers.rating_manager import ELO_SCALE, K_FACTOR
+
+LEAGUES = [
+    {"name": f"League {league}", "teams": [{"name": f"Team {league}-{i}"} for i in range(6)]}
+    for league in range(3)
+]
+
+
+def make_ratings(team_rating: str = "mean") -> RatingManager:
+    registry = TeamRegistry(LEAGUES, RNGService(5), team_rating=team_rating)
+    return RatingManager(LEAGUES, registry)
+
+
+def test_updates_are_zero_sum():
+    rating_manager = make_ratings()
+    generator = np.random.default_rng(1)
+    all_teams = np.arange(rating_manager.registry.team_count)
+    rating_manager.get_ratings(all_teams)
+    total = rating_manager.ratings.sum()
+    
+    for _ in range(5):
+        team1_ids, team2_ids = generator.permutation(all_teams).reshape(2, -1)
+        team1_maps = generator.integers(0, 3, len(team1_ids))
+        team2_maps = np.where(team1_maps == 2, generator.integers(0, 2, len(team1_ids)), 2)
+        rating_manager.update(team1_ids, team2_ids, team1_maps, team2_maps)
+        assert rating_manager.last_changes.sum() == pytest.approx(0.0, abs=1e-9)
+        assert rating_manager.ratings.sum() == pytest.approx(total, abs=1e-9)
+
+
+def test_a_team_playing_twice_in_a_batch_gets_both_changes():
+    rating_manager = make_ratings()
+    before = rating_manager.get_ratings(np.arange(3)).copy()
+    
+    rating_manager.update(np.array([0, 0]), np.array([1, 2]), np.array([2, 1]), np.array([0, 2]))
+    
+    # Both series are scored against the ratings from before the batch
+    expected = 1.0 / (1.0 + 10.0 ** (-(before[0] - before[1:]) / ELO_SCALE))
+    deltas = K_FACTOR * (np.array([2, 1]) - np.array([2, 3]) * expected)
+    np.testing.assert_allclose(rating_manager.last_changes[:3], [deltas.sum(), -deltas[0], -deltas[1]])
+    np.testing.assert_allclose(rating_manager.ratings[:3], before + rating_manager.last_changes[:3])
+    assert not rating_manager.last_changes[3:].any()
+
+
+def test_record_week_applies_the_named_results(make_game):
+    game = make_game([("East", [f"East {i}" for i in range(6)]), ("West", [f"West {i}" for i in range(5)])])
+    ratings = game.rating_manager.get_ratings(np.arange(game.registry.team_count)).copy()
+    week_results = game.play_week()
+    
+    # The same update from the results as read by league and team name
+    get_team = game.registry.get_team
+    rows = [
+        (get_team(team1_name, league_name).id, get_team(team2_name, league_name).id, team1_maps, team2_maps)
+        for league_name, results in week_results.items()
+        for team1_name, team1_maps, team2_maps, team2_name in results
+    ]
+    expected = RatingManager(game.leagues, game.registry)
+    expected.ratings = ratings
+    expected.update(*(np.array(column) for column in zip(*rows)))
+    
+    np.testing.assert_allclose(game.rating_manager.ratings, expected.ratings)
+    assert game.rating_manager.last_changes.sum() == pytest.approx(0.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("team_rating", ["mean", "role_weighted"])
+def test_starting_ratings_follow_the_team_models(team_rating):
+    rating_manager = make_ratings(team_rating)
+    registry = rating_manager.registry
+    team_ids = np.arange(registry.team_count)
+    
+    from_store = rating_manager.get_ratings(team_ids)
+    assert not registry._built.any()
+    np.testing.assert_allclose(
+        registry.team_ratings(team_ids),
+        [registry.get_team_by_id(team_id).get_team_rating() for team_id in team_ids.tolist()],
+        rtol=1e-12
+    )
+    
+    rebuilt = make_ratings(team_rating)
+    for team_id in team_ids.tolist():
+        rebuilt.registry.get_team_by_id(team_id)
+    np.testing.assert_allclose(rebuilt.get_ratings(team_ids), from_store, rtol=1e-12)
@@ -0,0 +1,56 @@
+"""Tests for bulk roster generation against validated models."""
+
+import numpy as np
+import pytest
+from models import Player, Team, RosterGenerator, RATING_DISTRIBUTIONS
+from models.Player import ROLES
+from models.RosterGenerator import MAX_AGE, MIN_AGE
+
+
+def validated_copy(team: Team) -> Team:
+    """Rebuild a team and its players through pydantic validation."""
+    return Team(
+        name=team.name,
+        id=team.id,
+        players=[Player(**player.model_dump()) for player in team.players]
+    )
+
+
+@pytest.mark.parametrize("distribution", list(RATING_DISTRIBUTIONS))
+def test_generated_teams_match_validated_models(distribution):
+    generator = RosterGenerator(rating_distribution=RATING_DISTRIBUTIONS[distribution])
+    teams = generator.generate(["Alpha", "Bravo", "Charlie"], np.random.default_rng(4), [3, 4, 5])
+    
+    for team in teams:
+        validated = validated_copy(team)
+        assert team == validated
+        assert team.model_fields_set == validated.model_fields_set | {"wins", "losses", "maps_won", "maps_lost"}
+        assert team.__pydantic_private__.keys() == validated.__pydantic_private__.keys()
+        for player, validated_player in zip(team.players, validated.players):
+            assert player.model_fields_set == validated_player.model_fields_set
+            assert player.__pydantic_private__ == validated_player.__pydantic_private__
+            assert player.role in ROLES
+            assert MIN_AGE <= player.age <= MAX_AGE
+    assert [team.id for team in teams] == [3, 4, 5]
+
+
+def test_generated_models_do_not_share_private_state():
+    first, second = RosterGenerator().generate(["Alpha", "Bravo"], np.random.default_rng(1))
+    
+    first.players[0].add_rating_listener(first.invalidate_rating)
+    first.add_listener(print)
+    assert second.players[0]._rating_listeners == []
+    assert first.players[1]._rating_listeners == []
+    assert second._listeners == []
+    
+    # Listeners and the rating cache behave as on validated teams
+    rating = first.get_team_rating()
+    first.players[0].rating = 1 if first.players[0].rating != 1 else 100
+    assert first.get_team_rating() != rating
+
+
+def test_out_of_range_ratings_are_rejected():
+    generator = RosterGenerator(rating_distribution=lambda rng, size: np.full(size, 101))
+    
+    with pytest.raises(ValueError, match="outside"):
+        generator.generate(["Alpha"], np.random.default_rng(0))
@@ -0,0 +1,73 @@
+"""Tests for the vectorized player engine against the exact map distribution."""
+
+import numpy as np
+import pytest
+from core.map_odds import ROUNDS_TO_WIN, MapScoreDistribution
+from core.round_engine import PLAYERS_PER_TEAM, ROLE_NAMES, _play_duels, simulate_maps
+
+MAPS = 20_000
+
+
+def play(team1_rating: float, team2_rating: float, seed: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    """Play MAPS maps between two rosters of flat ratings, one player per role."""
+    ratings = np.empty((MAPS, 2, PLAYERS_PER_TEAM))
+    ratings[:, 0] = team1_rating
+    ratings[:, 1] = team2_rating
+    roles = np.broadcast_to(np.arange(len(ROLE_NAMES)), ratings.shape)
+    return simulate_maps(ratings, roles, np.random.default_rng(seed))
+
+
+@pytest.mark.parametrize("team1_rating, team2_rating", [(50, 50), (60, 50), (45, 70)])
+def test_scores_roughly_match_markov_at_the_same_round_win_chance(team1_rating, team2_rating):
+    team1_scores, team2_scores = play(team1_rating, team2_rating)
+    
+    # Rounds are not independent (economy, sides), so the engine is compared
+    # with independent rounds at its own overall round-win chance
+    p = team1_scores.sum() / (team1_scores + team2_scores).sum()
+    distribution = MapScoreDistribution(p)
+    probabilities = np.diff(distribution.cdf, prepend=0.0)
+    markov_loser_score = (
+        sum(probability * min(score) for probability, score in zip(probabilities, distribution.scores))
+        + distribution.overtime_probability * (ROUNDS_TO_WIN - 1)
+    )
+    
+    assert np.mean(team1_scores > team2_scores) == pytest.approx(distribution.team1_win_probability, abs=0.05)
+    assert np.mean(np.minimum(team1_scores, team2_scores) >= ROUNDS_TO_WIN - 1) == pytest.approx(
+        distribution.overtime_probability, abs=0.05
+    )
+    assert np.minimum(team1_scores, team2_scores).mean() == pytest.approx(markov_loser_score, abs=1.0)
+
+
+@pytest.mark.parametrize("team1_rating, team2_rating", [(50, 50), (90, 10)])
+def test_every_map_ends_at_13_or_two_clear_in_overtime(team1_rating, team2_rating):
+    team1_scores, team2_scores = play(team1_rating, team2_rating, seed=8)
+    winner = np.maximum(team1_scores, team2_scores)
+    loser = np.minimum(team1_scores, team2_scores)
+    
+    regulation = loser < ROUNDS_TO_WIN - 1
+    assert (winner[regulation] == ROUNDS_TO_WIN).all()
+    assert (winner[~regulation] - loser[~regulation] == 2).all()
+    assert (loser >= 0).all()
+    if team1_rating == team2_rating:
+        assert (~regulation).any()
+
+
+def test_duels_after_a_wipe_count_no_deaths():
+    entries = np.zeros((3, 2, PLAYERS_PER_TEAM))
+    # Map 0: team 1 wins the first five duels, then would lose four.
+    # Map 1: team 1 loses every duel. Map 2: duels alternate, team 1 first.
+    thresholds = np.empty((2 * PLAYERS_PER_TEAM - 1, 3))
+    thresholds[:, 0] = [-1.0] * PLAYERS_PER_TEAM + [1.0] * (PLAYERS_PER_TEAM - 1)
+    thresholds[:, 1] = 1.0
+    thresholds[:, 2] = np.where(np.arange(len(thresholds)) % 2 == 0, -1.0, 1.0)
+    
+    team1_deaths, team2_deaths = _play_duels(entries, thresholds)
+    assert team1_deaths.tolist() == [0, PLAYERS_PER_TEAM, PLAYERS_PER_TEAM - 1]
+    assert team2_deaths.tolist() == [PLAYERS_PER_TEAM, 0, PLAYERS_PER_TEAM]
+
+
+def test_maps_are_reproducible_for_a_seed():
+    team1_scores, team2_scores = play(55, 50, seed=4)
+    again = play(55, 50, seed=4)
+    np.testing.assert_array_equal(team1_scores, again[0])
+    np.testing.assert_array_equal(team2_scores, again[1])
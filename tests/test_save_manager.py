@@ -0,0 +1,117 @@
+"""Tests for save files: snapshot and checkpoint round trips and crash recovery."""
+
+import os
+import numpy as np
+import pytest
+from managers import SaveManager, save_manager
+
+LEAGUES = [("North", [f"North {i}" for i in range(6)]), ("South", [f"South {i}" for i in range(5)])]
+
+
+def game_state(game) -> dict:
+    """Collect everything a save is expected to restore."""
+    registry = game.registry
+    teams = [registry.get_team_by_id(team_id) for team_id in range(registry.team_count)]
+    return {
+        "position": (game.current_season, game.current_week, game.user_team.id),
+        "records": [(team.wins, team.losses, team.maps_won, team.maps_lost) for team in teams],
+        "players": [[(player.rating, player.role, player.age) for player in team.players] for team in teams],
+        "results": {
+            league_name: list(game.schedule_manager.results[league_name])
+            for league_name, _ in LEAGUES
+        },
+        "season_history": game.season_history,
+        "elo": game.rating_manager.ratings.tolist(),
+    }
+
+
+def play_weeks(game, weeks: int) -> None:
+    for _ in range(weeks):
+        if game.is_season_over():
+            game.end_season()
+        game.play_week()
+
+
+def test_round_trip_mid_season(make_game, tmp_path):
+    game = make_game(LEAGUES, user_team_id=7, save_manager=SaveManager(str(tmp_path / "game.sav")))
+    play_weeks(game, 3)
+    
+    loaded = SaveManager(game.save_manager.path).load(game.leagues)
+    assert game_state(loaded) == game_state(game)
+    
+    # Both copies play on identically
+    play_weeks(game, 2)
+    play_weeks(loaded, 2)
+    assert game_state(loaded) == game_state(game)
+
+
+def test_round_trip_across_seasons(make_game, tmp_path):
+    game = make_game(LEAGUES, save_manager=SaveManager(str(tmp_path / "game.sav")), progression=["random", "age"])
+    play_weeks(game, 7)
+    assert game.current_season == 2
+    
+    loaded = SaveManager(game.save_manager.path).load(game.leagues)
+    assert game_state(loaded) == game_state(game)
+    assert loaded.progression_manager.models == ["random", "age"]
+
+
+def test_truncated_trailing_frame_is_dropped(make_game, tmp_path):
+    path = str(tmp_path / "game.sav")
+    game = make_game(LEAGUES, save_manager=SaveManager(path))
+    play_weeks(game, 2)
+    state_after_two_weeks = game_state(game)
+    valid_size = os.path.getsize(path)
+    
+    # A crash in the middle of writing week 3's checkpoint
+    play_weeks(game, 1)
+    with open(path, "r+b") as f:
+        f.truncate(valid_size + (os.path.getsize(path) - valid_size) // 2)
+    
+    loaded = SaveManager(path).load(game.leagues)
+    assert game_state(loaded) == state_after_two_weeks
+    assert os.path.getsize(path) == valid_size
+    
+    # New checkpoints append cleanly after the cut
+    play_weeks(loaded, 1)
+    assert game_state(SaveManager(path).load(game.leagues)) == game_state(loaded)
+    assert game_state(loaded) == game_state(game)
+
+
+def test_round_trip_before_the_first_week(make_game, tmp_path):
+    game = make_game(LEAGUES, save_manager=SaveManager(str(tmp_path / "game.sav")))
+    
+    loaded = SaveManager(game.save_manager.path).load(game.leagues)
+    assert loaded.current_week == 0
+    assert all(len(list(loaded.schedule_manager.results[name])) == 0 for name, _ in LEAGUES)
+    np.testing.assert_array_equal(loaded.rating_manager.ratings, game.rating_manager.ratings)
+
+
+def test_header_without_required_keys_is_rejected(make_game, tmp_path, monkeypatch):
+    pack_header = SaveManager._pack_header
+    
+    def pack_header_without_engine(self, header):
+        return pack_header(self, {key: value for key, value in header.items() if key != "map_engine"})
+    
+    monkeypatch.setattr(SaveManager, "_pack_header", pack_header_without_engine)
+    game = make_game(LEAGUES, save_manager=SaveManager(str(tmp_path / "game.sav")))
+    monkeypatch.undo()
+    
+    with pytest.raises(ValueError, match="map_engine"):
+        SaveManager(game.save_manager.path).load(game.leagues)
+
+
+def test_snapshot_without_elo_and_ages_is_rejected(make_game, tmp_path):
+    path = tmp_path / "game.sav"
+    game = make_game(LEAGUES, save_manager=SaveManager(str(path)))
+    
+    # Rewrite the snapshot without its last two arrays
+    data = path.read_bytes()
+    _, length = save_manager.FRAME_HEADER.unpack_from(data, len(save_manager.MAGIC))
+    payload = data[len(save_manager.MAGIC) + save_manager.FRAME_HEADER.size:][:length]
+    ages_size = 8 + 2 * 5 * game.registry.team_count
+    elo_size = 8 + 8 * game.registry.team_count
+    payload = payload[:-(ages_size + elo_size)]
+    path.write_bytes(save_manager.MAGIC + save_manager.FRAME_HEADER.pack(save_manager.SNAPSHOT, len(payload)) + payload)
+    
+    with pytest.raises(ValueError, match="Elo ratings"):
+        SaveManager(str(path)).load(game.leagues)
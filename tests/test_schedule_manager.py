@@ -0,0 +1,139 @@
+"""Tests for round-robin scheduling, results stores and seasons with unequal league sizes."""
+
+from itertools import combinations
+import pytest
+from managers.schedule_manager import RoundRobin, ScheduleManager
+
+
+@pytest.mark.parametrize("team_count", [2, 3, 7, 8, 12, 13])
+@pytest.mark.parametrize("double", [False, True])
+def test_round_robin_pairs_every_team_once_per_cycle(team_count, double):
+    round_robin = RoundRobin(team_count, double=double)
+    cycles = 2 if double else 1
+    
+    meetings = {pair: [] for pair in combinations(range(team_count), 2)}
+    for week in range(len(round_robin)):
+        teams_this_week = []
+        for home, away in round_robin.week_fixtures(week):
+            meetings[(min(home, away), max(home, away))].append(week)
+            teams_this_week += [home, away]
+        # Nobody plays twice in a week, and only odd leagues have a bye
+        assert len(teams_this_week) == len(set(teams_this_week))
+        assert len(teams_this_week) == team_count - team_count % 2
+    
+    assert all(len(weeks) == cycles for weeks in meetings.values())
+    if double:
+        # The second meeting swaps home and away
+        for (team1, team2), (first, second) in meetings.items():
+            assert round_robin.fixture(team1, first) == round_robin.fixture(team2, second)[::-1]
+
+
+@pytest.mark.parametrize("team_count", [2, 5, 8, 11, 12])
+@pytest.mark.parametrize("double", [False, True])
+def test_meeting_weeks_match_week_fixtures(team_count, double):
+    round_robin = RoundRobin(team_count, double=double)
+    
+    for team1, team2 in combinations(range(team_count), 2):
+        weeks = round_robin.meeting_weeks(team1, team2)
+        assert weeks == round_robin.meeting_weeks(team2, team1)
+        assert weeks == [
+            week for week in range(len(round_robin))
+            if round_robin.opponent(team1, week) == team2
+        ]
+    assert round_robin.meeting_weeks(0, 0) == []
+
+
+def test_fixture_agrees_with_week_fixtures():
+    round_robin = RoundRobin(9, double=True)
+    
+    for week in range(len(round_robin)):
+        fixtures = round_robin.week_fixtures(week)
+        for home, away in fixtures:
+            assert round_robin.fixture(home, week) == (home, away)
+            assert round_robin.fixture(away, week) == (home, away)
+        playing = {team for fixture in fixtures for team in fixture}
+        for team in set(range(9)) - playing:
+            assert round_robin.fixture(team, week) is None
+    
+    with pytest.raises(IndexError):
+        round_robin.fixture(0, len(round_robin))
+
+
+@pytest.mark.parametrize("batch_simulation", [False, True])
+def test_season_with_unequal_league_sizes(make_game, batch_simulation):
+    big = [f"Big {i}" for i in range(12)]
+    small = [f"Small {i}" for i in range(8)]
+    # The user plays in the small league, which runs out of weeks first
+    game = make_game([("Big", big), ("Small", small)], user_team_id=12, batch_simulation=batch_simulation)
+    assert game.schedule_manager.season_length == 11
+    
+    while not game.is_season_over():
+        game._next_match_odds()
+        all_results = game.play_week()
+        if game.current_week > 7:
+            assert all_results["Small"] == []
+        game._week_summary(game.current_week - 1)
+    
+    for team_names, weeks in ((big, 11), (small, 7)):
+        for team_name in team_names:
+            team = game.registry.get_team(team_name)
+            assert team.wins + team.losses == weeks
+    assert game._next_match_odds() is None
+
+
+@pytest.mark.parametrize("batch_simulation", [False, True])
+def test_results_store_matches_a_direct_tally(make_game, batch_simulation):
+    north = [f"North {i}" for i in range(7)]
+    south = [f"South {i}" for i in range(6)]
+    game = make_game([("North", north), ("South", south)], batch_simulation=batch_simulation, double_round_robin=True)
+    
+    # Tally every returned result by week, by team and as a record
+    by_week = {}
+    by_team = {}
+    records = {}
+    while not game.is_season_over():
+        week = game.current_week
+        for league_name, results in game.play_week().items():
+            by_week[(league_name, week)] = list(results)
+            for result in results:
+                team1_name, team1_wins, team2_wins, team2_name = result
+                for name, won, lost in ((team1_name, team1_wins, team2_wins), (team2_name, team2_wins, team1_wins)):
+                    by_team.setdefault(name, []).append((week, result))
+                    wins, losses, maps_won, maps_lost = records.get(name, (0, 0, 0, 0))
+                    records[name] = (wins + (won > lost), losses + (won < lost), maps_won + won, maps_lost + lost)
+    
+    schedule_manager = game.schedule_manager
+    for league_name, team_names in (("North", north), ("South", south)):
+        store = schedule_manager.results[league_name]
+        weeks = range(len(schedule_manager.schedules[league_name]))
+        for week in weeks:
+            assert store.week_results(week) == by_week[(league_name, week)]
+        assert list(store) == [(week, result) for week in weeks for result in by_week[(league_name, week)]]
+        
+        for team_name in team_names:
+            assert schedule_manager.get_team_results(league_name, team_name) == by_team[team_name]
+            team = game.registry.get_team(team_name, league_name)
+            assert (team.wins, team.losses, team.maps_won, team.maps_lost) == records[team_name]
+            assert game.registry.records[team.id].tolist() == list(records[team_name])
+            for opponent in team_names:
+                if opponent != team_name:
+                    assert schedule_manager.get_head_to_head(league_name, team_name, opponent) == [
+                        (week, result) for week, result in by_team[team_name] if opponent in (result[0], result[3])
+                    ]
+
+
+def test_league_tables_build_only_what_is_looked_up():
+    schedule_manager = ScheduleManager([
+        {"name": name, "teams": [{"name": f"{name} {i}"} for i in range(4)]} for name in ("A", "B", "C")
+    ])
+    results = schedule_manager.results
+    assert list(results) == ["A", "B", "C"] and len(results) == 3
+    assert results.built_items() == []
+    
+    store = results["B"]
+    assert results["B"] is store
+    assert [name for name, _ in results.built_items()] == ["B"]
+    assert [name for name, _ in schedule_manager.schedules.built_items()] == ["B"]
+    assert store.week_results(0) == [] and list(store) == []
+    with pytest.raises(KeyError):
+        results["D"]
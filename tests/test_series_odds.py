@@ -0,0 +1,61 @@
+"""Tests for exact series outcome probabilities."""
+
+import random
+from collections import Counter
+import numpy as np
+import pytest
+from core.series_odds import get_rating_series_odds, get_series_odds, series_score_probabilities, series_scores
+
+MAP_WIN_PROBABILITIES = np.array([0.0, 0.1, 0.37, 0.5, 0.64, 0.99, 1.0])
+
+
+@pytest.mark.parametrize("series_format", [1, 3, 5])
+def test_score_probabilities_sum_to_one(series_format):
+    probabilities = series_score_probabilities(MAP_WIN_PROBABILITIES, series_format)
+    
+    assert probabilities.shape == (len(MAP_WIN_PROBABILITIES), len(series_scores(series_format)))
+    assert (probabilities >= 0).all()
+    np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+
+
+@pytest.mark.parametrize("series_format", [3, 5])
+def test_score_probabilities_are_symmetric(series_format):
+    forward = series_score_probabilities(MAP_WIN_PROBABILITIES, series_format)
+    reverse = series_score_probabilities(1.0 - MAP_WIN_PROBABILITIES, series_format)
+    half = forward.shape[1] // 2
+    
+    np.testing.assert_allclose(forward[:, :half], reverse[:, half:])
+    np.testing.assert_allclose(forward[:, half:], reverse[:, :half])
+
+
+@pytest.mark.parametrize("series_format", [3, 5])
+def test_score_probabilities_match_simulated_series(series_format):
+    p = 0.58
+    series = 40_000
+    maps_to_win = series_format // 2 + 1
+    rng = random.Random(5)
+    
+    scores = Counter()
+    for _ in range(series):
+        team1_maps = team2_maps = 0
+        while max(team1_maps, team2_maps) < maps_to_win:
+            if rng.random() < p:
+                team1_maps += 1
+            else:
+                team2_maps += 1
+        scores[(team1_maps, team2_maps)] += 1
+    
+    odds = get_series_odds(p, series_format)
+    for score in series_scores(series_format):
+        assert scores[score] / series == pytest.approx(odds.score_probability(*score), abs=0.01)
+    assert odds.score_probability(0, 0) == 0.0
+    assert odds.team1_win_probability == pytest.approx(sum(odds.probabilities[:maps_to_win]))
+
+
+def test_rating_odds_favour_the_stronger_team():
+    even = get_rating_series_odds(60.0, 60.0)
+    favoured = get_rating_series_odds(70.0, 50.0)
+    
+    assert even.team1_win_probability == pytest.approx(0.5)
+    assert favoured.team1_win_probability > 0.5
+    assert get_rating_series_odds(50.0, 70.0).team1_win_probability == pytest.approx(1 - favoured.team1_win_probability)
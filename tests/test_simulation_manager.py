@@ -0,0 +1,87 @@
+"""Tests for batched week simulation against the serial engine."""
+
+import random
+from collections import Counter
+import numpy as np
+import pytest
+from core.rng import RNGService
+from managers import MatchManager, RosterManager, ScheduleManager, SimulationManager, TeamRegistry
+
+# 3000 series a week in a few large leagues
+LEAGUES = [{"name": f"League {i}", "teams": [{"name": f"Team {i}-{j}"} for j in range(240)]} for i in range(25)]
+SERIES_SCORES = [(2, 0), (2, 1), (1, 2), (0, 2)]
+
+
+def make_simulation(map_engine: str = "markov", seed: int = 2) -> tuple[TeamRegistry, SimulationManager]:
+    registry = TeamRegistry(LEAGUES, RNGService(seed))
+    return registry, SimulationManager(RosterManager(LEAGUES, registry), registry.rng, map_engine)
+
+
+def frequencies(scores: list[tuple[int, int]]) -> list[float]:
+    counts = Counter(scores)
+    return [counts[score] / len(scores) for score in SERIES_SCORES]
+
+
+@pytest.mark.parametrize("map_engine", ["markov", "players"])
+def test_batch_outcomes_match_the_serial_engine(map_engine):
+    registry, simulation_manager = make_simulation(map_engine)
+    results = simulation_manager.simulate_week(ScheduleManager(LEAGUES), 0)
+    batch = list(zip(results.team1_maps.tolist(), results.team2_maps.tolist()))
+    
+    # The same matchups through the serial engine
+    matchups = [
+        (registry.get_team_by_id(team1_id), registry.get_team_by_id(team2_id))
+        for team1_id, team2_id in zip(results.team1_ids.tolist(), results.team2_ids.tolist())
+    ]
+    records = MatchManager(map_engine).simulate_series_batch(
+        matchups, rngs=[random.Random(n) for n in range(len(matchups))]
+    )
+    serial = [record.get_series_score() for record in records]
+    
+    # Each frequency has a standard error of about 0.009 per engine
+    assert len(batch) == 3000
+    np.testing.assert_allclose(frequencies(batch), frequencies(serial), atol=0.04)
+    
+    # The stronger roster wins about as often in both
+    stronger = [team1.get_team_rating() > team2.get_team_rating() for team1, team2 in matchups]
+    batch_upsets = np.mean([(maps1 > maps2) != strong for (maps1, maps2), strong in zip(batch, stronger)])
+    serial_upsets = np.mean([(maps1 > maps2) != strong for (maps1, maps2), strong in zip(serial, stronger)])
+    assert batch_upsets < 0.5
+    assert abs(batch_upsets - serial_upsets) < 0.04
+
+
+def test_batch_weeks_are_deterministic_and_build_no_teams():
+    first_registry, first = make_simulation()
+    second_registry, second = make_simulation()
+    
+    for season in (1, 2):
+        first_results = first.simulate_week(ScheduleManager(LEAGUES), 0, season=season)
+        second_results = second.simulate_week(ScheduleManager(LEAGUES), 0, season=season)
+        np.testing.assert_array_equal(first_results.team1_maps, second_results.team1_maps)
+        np.testing.assert_array_equal(first_results.team2_maps, second_results.team2_maps)
+    np.testing.assert_array_equal(first_registry.records, second_registry.records)
+    assert first_registry.records[:, 0].sum() == 2 * 3000
+    assert not first_registry._built.any()
+
+
+def test_league_results_do_not_depend_on_other_leagues(make_game):
+    teams = [f"Team {i}" for i in range(6)]
+    alone = make_game([("North", teams)], batch_simulation=True)
+    together = make_game([("South", teams), ("North", teams)], batch_simulation=True)
+    
+    for _ in range(3):
+        assert alone.play_week()["North"] == together.play_week()["North"]
+
+
+def test_rounds_engine_falls_back_to_markov():
+    registry, markov = make_simulation()
+    rounds_registry, rounds = make_simulation("rounds")
+    assert rounds.map_engine == "markov"
+    
+    markov_results = markov.simulate_week(ScheduleManager(LEAGUES), 0)
+    rounds_results = rounds.simulate_week(ScheduleManager(LEAGUES), 0)
+    np.testing.assert_array_equal(markov_results.team1_maps, rounds_results.team1_maps)
+    np.testing.assert_array_equal(markov_results.team2_maps, rounds_results.team2_maps)
+    
+    with pytest.raises(ValueError, match="Unknown map engine"):
+        SimulationManager(RosterManager(LEAGUES, registry), map_engine="coin_flip")
@@ -0,0 +1,61 @@
+"""Tests for the incrementally maintained standings order."""
+
+import random
+
+TEAM_NAMES = [f"Team {i}" for i in range(10)]
+
+
+def assert_index_matches_sort(standings_manager, league_name, teams):
+    expected = standings_manager._sort_standings(teams)
+    index = standings_manager.get_index(league_name)
+    assert index.sorted_teams() == expected
+    assert index.top(3) == expected[:3]
+    # Ties keep roster order, as in the stable sort
+    for rank, team in enumerate(expected, 1):
+        assert index.rank(team) == rank
+
+
+def test_index_follows_a_season(make_game):
+    game = make_game([("League", TEAM_NAMES)])
+    teams = game.roster_manager.teams_by_league["League"]
+    
+    assert_index_matches_sort(game.standings_manager, "League", teams)
+    while not game.is_season_over():
+        game.play_week()
+        assert_index_matches_sort(game.standings_manager, "League", teams)
+
+
+def test_index_follows_arbitrary_record_changes(make_game):
+    game = make_game([("League", TEAM_NAMES)])
+    teams = game.roster_manager.teams_by_league["League"]
+    game.standings_manager.get_index("League")
+    rng = random.Random(3)
+    
+    for step in range(300):
+        team = rng.choice(teams)
+        change = rng.randrange(5)
+        if change == 0:
+            team.add_win()
+        elif change == 1:
+            team.add_loss()
+        elif change == 2:
+            team.add_map_win(rng.randint(1, 2))
+        elif change == 3:
+            team.add_map_loss(rng.randint(1, 2))
+        elif step % 10 == 0:
+            team.reset_record()
+        assert_index_matches_sort(game.standings_manager, "League", teams)
+
+
+def test_reset_indexes_unsubscribes_old_index(make_game):
+    game = make_game([("League", TEAM_NAMES)])
+    teams = game.roster_manager.teams_by_league["League"]
+    old_index = game.standings_manager.get_index("League")
+    old_order = old_index.sorted_teams()
+    
+    game.standings_manager.reset_indexes()
+    teams[-1].add_win()
+    assert old_index.sorted_teams() == old_order
+    assert game.standings_manager.get_index("League") is not old_index
+    assert game.standings_manager.get_index("League").sorted_teams()[0] is teams[-1]
+
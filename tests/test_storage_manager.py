@@ -0,0 +1,37 @@
+"""Tests for the SQLite match history."""
+
+import pytest
+from managers import StorageManager
+
+TEAM_NAMES = [f"Team {i}" for i in range(6)]
+
+
+@pytest.mark.parametrize("batch_simulation", [False, True])
+def test_every_match_is_stored_with_its_maps(make_game, tmp_path, batch_simulation):
+    storage_manager = StorageManager(str(tmp_path / "history.db"))
+    game = make_game([("League", TEAM_NAMES)], batch_simulation=batch_simulation, storage_manager=storage_manager)
+    game.play_week()
+    game.play_week()
+    
+    matches = list(storage_manager.iter_matches())
+    assert len(matches) == 6
+    for match in matches:
+        maps = list(storage_manager.iter_maps(match["id"]))
+        assert len(maps) == match["team1_maps"] + match["team2_maps"]
+        assert len({row["map_name"] for row in maps}) == len(maps)
+        assert sum(row["winner"] == match["team1"] for row in maps) == match["team1_maps"]
+        assert sum(row["winner"] == match["team2"] for row in maps) == match["team2_maps"]
+        for row in maps:
+            assert max(row["team1_score"], row["team2_score"]) >= 13
+    storage_manager.close()
+
+
+def test_map_records_do_not_change_batch_results(make_game, tmp_path):
+    stored = make_game(
+        [("League", TEAM_NAMES)], batch_simulation=True, storage_manager=StorageManager(str(tmp_path / "history.db"))
+    )
+    plain = make_game([("League", TEAM_NAMES)], batch_simulation=True)
+    
+    for _ in range(3):
+        assert dict(stored.play_week()) == dict(plain.play_week())
+    stored.storage_manager.close()
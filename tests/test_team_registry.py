@@ -0,0 +1,51 @@
+"""Tests for team lookups in worlds where leagues share team names."""
+
+import numpy as np
+import pytest
+from managers import SaveManager
+
+TEAM_NAMES = ["Alpha", "Bravo", "Charlie", "Delta"]
+
+
+def test_get_team_resolves_names_within_a_league(make_game):
+    game = make_game([("East", TEAM_NAMES), ("West", TEAM_NAMES)])
+    registry = game.registry
+    
+    for league_name in ("East", "West"):
+        for team in registry[league_name]:
+            assert registry.get_team(team.name, league_name) is team
+            assert registry.get_team(team.name.upper(), league_name) is team
+            assert registry.league_of_id(team.id) == league_name
+    assert registry.get_team("Alpha", "North") is None
+    assert registry.get_team("Echo", "East") is None
+
+
+@pytest.mark.parametrize("batch_simulation", [False, True])
+def test_season_with_shared_team_names(make_game, batch_simulation):
+    game = make_game([("East", TEAM_NAMES), ("West", TEAM_NAMES)], batch_simulation=batch_simulation)
+    
+    while not game.is_season_over():
+        game.play_week()
+    
+    for league_name in ("East", "West"):
+        for team in game.registry[league_name]:
+            assert team.wins + team.losses == 3
+        assert sum(team.wins for team in game.registry[league_name]) == 6
+    assert not np.isnan(game.rating_manager.ratings).any()
+
+
+def test_save_round_trip_with_shared_team_names(make_game, tmp_path):
+    leagues = [("East", TEAM_NAMES), ("West", TEAM_NAMES)]
+    # A lookup by name alone would find the second league's Alpha
+    game = make_game(leagues, save_manager=SaveManager(str(tmp_path / "game.sav")))
+    game.play_week()
+    game.play_week()
+    
+    loaded = game.save_manager.load(game.leagues)
+    assert loaded.user_team.id == 0
+    assert loaded.current_week == 2
+    for team_id in range(game.registry.team_count):
+        team = game.registry.get_team_by_id(team_id)
+        restored = loaded.registry.get_team_by_id(team_id)
+        assert (restored.wins, restored.losses, restored.maps_won) == (team.wins, team.losses, team.maps_won)
+    np.testing.assert_allclose(loaded.rating_manager.ratings, game.rating_manager.ratings)
@@ -0,0 +1,73 @@
+"""Tests for the compact world index and its JSON Lines loader."""
+
+import json
+import pytest
+from models import WeekResults, WorldIndex
+
+LEAGUES = [
+    {"name": "East", "teams": [{"name": "Alpha"}, {"name": "Bravo"}, {"name": "Charlie"}]},
+    {"name": "West", "teams": [{"name": "Bravo"}, {"name": "alpha"}]},
+    {"name": "Empty", "teams": []},
+    {"name": "North", "teams": [{"name": "Delta"}, {"name": "Alpha"}]},
+]
+
+
+def test_from_lines_matches_from_leagues():
+    lines = [json.dumps(league) + "\n" for league in LEAGUES]
+    lines.insert(2, "   \n")
+    from_lines = WorldIndex.from_lines(lines)
+    from_leagues = WorldIndex.from_leagues(LEAGUES)
+    
+    for world in (from_lines, from_leagues):
+        assert world.league_names == ["East", "West", "Empty", "North"]
+        assert world.team_names == ["Alpha", "Bravo", "Charlie", "Bravo", "alpha", "Delta", "Alpha"]
+        assert world.offsets.tolist() == [0, 3, 5, 5, 7]
+        assert [dict(record) for record in world] == LEAGUES
+    assert WorldIndex.from_leagues(from_lines) is from_lines
+
+
+def test_from_lines_reports_the_bad_line():
+    lines = [json.dumps(LEAGUES[0]), "", '{"name": "Broken",']
+    with pytest.raises(ValueError, match="line 3"):
+        WorldIndex.from_lines(lines)
+
+
+def test_load_reads_both_formats(tmp_path):
+    jsonl_path = tmp_path / "world.jsonl"
+    jsonl_path.write_text("".join(json.dumps(league) + "\n" for league in LEAGUES))
+    json_path = tmp_path / "world.json"
+    json_path.write_text(json.dumps({"leagues": LEAGUES}))
+    
+    for path in (jsonl_path, json_path):
+        world = WorldIndex.load(str(path))
+        assert world.team_names_of(3) == ["Delta", "Alpha"]
+
+
+def test_league_team_id_resolves_shared_names_within_each_league():
+    world = WorldIndex.from_leagues(LEAGUES)
+    
+    assert world.league_team_id(0, "Alpha") == 0
+    assert world.league_team_id(0, "BRAVO") == 1
+    assert world.league_team_id(1, "Bravo") == 3
+    assert world.league_team_id(1, "ALPHA") == 4
+    assert world.league_team_id(3, "alpha") == 6
+    assert world.league_team_id(3, "Charlie") is None
+    assert world.league_team_id(2, "Alpha") is None
+    
+    # A world-wide lookup finds the last team of that name
+    assert world.team_id("alpha") == 6
+    for team_id in range(world.team_count):
+        league = world.league_of(team_id)
+        assert world.league_team_id(league, world.team_names[team_id]) == team_id
+        assert team_id in world.league_team_ids(league)
+
+
+def test_week_results_keep_teams_that_share_a_name_apart():
+    world = WorldIndex.from_leagues(LEAGUES)
+    all_results = {"North": [("Alpha", 2, 1, "Delta")], "East": [("Bravo", 0, 2, "Alpha")], "West": [("alpha", 2, 0, "Bravo")]}
+    week_results = WeekResults.from_results(world, all_results)
+    
+    assert week_results.leagues.tolist() == [0, 1, 3]
+    assert week_results.team1_ids.tolist() == [1, 4, 6]
+    assert week_results.team2_ids.tolist() == [0, 3, 5]
+    assert week_results["Empty"] == []